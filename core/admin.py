@@ -1,3 +1,22 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import Roster, RosterDay, Shift
+
+
+@admin.register(Shift)
+class ShiftAdmin(admin.ModelAdmin):
+    list_display = ('name', 'start_time', 'end_time', 'grace_minutes')
+
+
+class RosterDayInline(admin.TabularInline):
+    model = RosterDay
+    extra = 7
+
+
+@admin.register(Roster)
+class RosterAdmin(admin.ModelAdmin):
+    list_display = ('employee', 'starts_on', 'ends_on')
+    search_fields = ('employee__username', 'employee__first_name', 'employee__last_name')
+    # The employee table is too large for a <select>
+    raw_id_fields = ('employee',)
+    inlines = [RosterDayInline]
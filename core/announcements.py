@@ -0,0 +1,55 @@
+# core/announcements.py
+"""
+Per-user unread announcement tracking.
+
+Each user stores a single high-water mark (User.announcements_seen_at)
+instead of one row per user per announcement, so the unread count is one
+indexed COUNT over Announcement.created_at. Counts are cached per user;
+publishing or deleting an announcement bumps a shared version number,
+which makes every cached count stale at once.
+"""
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from .models import Announcement, User
+
+VERSION_KEY = 'announcements:version'
+UNREAD_CACHE_TIMEOUT = 300
+
+
+def _version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        version = 1
+        cache.add(VERSION_KEY, version, None)
+    return version
+
+
+def invalidate_unread_counts():
+    """Make every cached unread count stale. Call after publishing or deleting."""
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 2, None)
+
+
+def unread_announcement_count(user):
+    seen_at = user.announcements_seen_at
+    # The mark is part of the key, so advancing it never needs an explicit delete
+    key = f"announcements:unread:{_version()}:{user.pk}:{seen_at.timestamp() if seen_at else 0}"
+    count = cache.get(key)
+    if count is None:
+        queryset = Announcement.objects.all()
+        if seen_at:
+            queryset = queryset.filter(created_at__gt=seen_at)
+        count = queryset.count()
+        cache.set(key, count, UNREAD_CACHE_TIMEOUT)
+    return count
+
+
+def mark_announcements_seen(user):
+    """Advance the user's high-water mark to now with a single UPDATE."""
+    now = timezone.now()
+    User.objects.filter(pk=user.pk).update(announcements_seen_at=now)
+    user.announcements_seen_at = now
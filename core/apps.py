@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .hashers import hash_iterations
+
+        # Fail at startup rather than on the first login
+        hash_iterations()
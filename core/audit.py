@@ -0,0 +1,130 @@
+# core/audit.py
+"""
+Audit log of admin actions (leave decisions, payroll payments, employee
+approvals, edits and deletes, attendance entries).
+
+An INSERT per action would add a write to each of those requests, and
+often several when one request touches several rows. Instead record()
+appends the event to a per-request buffer. AuditMiddleware writes the
+whole buffer with one bulk_create once the view has returned. A request
+that fails with a server error writes nothing, because whatever it
+recorded may not have happened. Outside a request (management commands, the job worker)
+record() writes immediately.
+
+The buffer lives in a context variable, so concurrent requests on the
+threads of a gthread worker, or on an ASGI event loop, never share one.
+"""
+
+from contextvars import ContextVar
+from datetime import date, datetime
+from decimal import Decimal
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.db import models
+
+from .models import AuditEvent
+
+# What the views record, offered as filters by the admin audit log
+VERBS = ('approve', 'reject', 'pay', 'create', 'update', 'delete')
+MODELS = ('leave', 'payroll', 'user', 'attendance')
+
+_buffer = ContextVar('audit_buffer', default=None)
+
+
+def _plain(value):
+    """A JSON-friendly form of a field value for the changes column."""
+    if isinstance(value, models.Model):
+        return str(value)
+    if value is None or isinstance(value, (bool, int, float, str, Decimal, date, datetime)):
+        return value
+    return str(value)
+
+
+def field_changes(before, after):
+    """{field: [old, new]} for the keys whose values differ between two dicts."""
+    return {
+        field: [_plain(before.get(field)), _plain(after.get(field))]
+        for field in after.keys() | before.keys()
+        if before.get(field) != after.get(field)
+    }
+
+
+def form_changes(form):
+    """
+    {field: [old, new]} for the fields a bound ModelForm changed. Both sides
+    go through the form field's prepare_value(), so they are logged in the
+    same form: the initial data holds a foreign key's id while the cleaned
+    data holds the instance, and both become the id.
+    """
+    changes = {}
+    for name in form.changed_data:
+        # Never log credentials, not even hashed
+        if 'password' in name:
+            continue
+        field = form.fields[name]
+        changes[name] = [
+            _plain(field.prepare_value(form.get_initial_for_field(field, name))),
+            _plain(field.prepare_value(form.cleaned_data.get(name))),
+        ]
+    return changes
+
+
+def record(actor, verb, instance, changes=None):
+    """
+    Log that actor did verb (e.g. 'approve', 'delete') to a model instance.
+    Call it before deleting the instance, while it still has its pk.
+    """
+    event = AuditEvent(
+        actor=actor if actor is not None and actor.is_authenticated else None,
+        verb=verb,
+        model=instance._meta.model_name,
+        object_id=instance.pk,
+        changes=changes or {},
+    )
+    buffer = _buffer.get()
+    if buffer is None:
+        AuditEvent.objects.bulk_create([event])
+    else:
+        buffer.append(event)
+    return event
+
+
+class AuditMiddleware:
+    """Collect the audit events of a request and write them in one batch."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        events = []
+        token = _buffer.set(events)
+        try:
+            response = self.get_response(request)
+        finally:
+            _buffer.reset(token)
+        if _should_write(events, response):
+            AuditEvent.objects.bulk_create(events)
+        return response
+
+    async def __acall__(self, request):
+        events = []
+        token = _buffer.set(events)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _buffer.reset(token)
+        if _should_write(events, response):
+            await AuditEvent.objects.abulk_create(events)
+        return response
+
+
+def _should_write(events, response):
+    # Django turns a view's exception into a 500 response before it gets
+    # here, so the status code is what tells a failed request apart
+    return bool(events) and response.status_code < 500
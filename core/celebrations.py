@@ -0,0 +1,111 @@
+# core/celebrations.py
+"""
+Birthdays and work anniversaries for a given day.
+
+A filter on a full date column cannot use an index to find "this month and
+day in any year". User.birthday_key and User.anniversary_key hold the month
+and day (MMDD) of the two dates instead. User.save() keeps them in sync and
+both are indexed, so each digest below is one equality seek on its index.
+People born or hired on February 29 are celebrated on February 28 in common
+years.
+
+The digest is cached per day for a few minutes, so the employee dashboard
+does not repeat the two lookups on every page view.
+"""
+
+from calendar import isleap
+from datetime import date
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .announcements import invalidate_unread_counts
+from .events import publish_event
+from .models import Announcement, User, month_day_key
+
+DIGEST_CACHE_TIMEOUT = 300
+# Announcement.content is limited to 500 characters
+MAX_CONTENT_LENGTH = 500
+
+
+def day_keys(day):
+    """The MMDD keys celebrated on the given day."""
+    keys = [month_day_key(day)]
+    if day.month == 2 and day.day == 28 and not isleap(day.year):
+        keys.append(229)
+    return keys
+
+
+def display_name(row):
+    return f"{row['first_name']} {row['last_name']}".strip() or row['username']
+
+
+def _employees():
+    return User.objects.filter(role='EMPLOYEE', is_approved=True, is_active=True)
+
+
+def birthdays(day):
+    """Approved employees whose birthday falls on the given day."""
+    rows = _employees().filter(birthday_key__in=day_keys(day)).values('id', 'username', 'first_name', 'last_name')
+    return [{'id': row['id'], 'name': display_name(row)} for row in rows.order_by('first_name', 'last_name')]
+
+
+def anniversaries(day):
+    """Approved employees who joined on this day in an earlier year, longest-serving first."""
+    rows = (
+        _employees()
+        .filter(anniversary_key__in=day_keys(day), date_of_joining__lt=date(day.year, 1, 1))
+        .values('id', 'username', 'first_name', 'last_name', 'date_of_joining')
+        .order_by('date_of_joining', 'first_name')
+    )
+    return [
+        {'id': row['id'], 'name': display_name(row), 'years': day.year - row['date_of_joining'].year}
+        for row in rows
+    ]
+
+
+def daily_digest(day):
+    """{'birthdays': [...], 'anniversaries': [...]} for the given day."""
+    key = f'celebrations:digest:{day.isoformat()}'
+    digest = cache.get(key)
+    if digest is None:
+        digest = {'birthdays': birthdays(day), 'anniversaries': anniversaries(day)}
+        cache.set(key, digest, DIGEST_CACHE_TIMEOUT)
+    return digest
+
+
+def announcement_title(day):
+    return f"Celebrations for {day:%B} {day.day}, {day.year}"
+
+
+def announcement_content(digest):
+    parts = []
+    if digest['birthdays']:
+        parts.append('Happy birthday to ' + ', '.join(row['name'] for row in digest['birthdays']) + '!')
+    if digest['anniversaries']:
+        parts.append('Happy work anniversary to ' + ', '.join(
+            f"{row['name']} ({row['years']} year{'s' if row['years'] != 1 else ''})" for row in digest['anniversaries']
+        ) + '!')
+    content = ' '.join(parts)
+    if len(content) > MAX_CONTENT_LENGTH:
+        content = content[:MAX_CONTENT_LENGTH - 3].rsplit(' ', 1)[0] + '...'
+    return content
+
+
+def announce_celebrations(day):
+    """
+    Publish one announcement listing the day's birthdays and anniversaries.
+    Returns it, or None when there is nothing to celebrate or the day has
+    already been announced, so running it twice is harmless.
+    """
+    digest = {'birthdays': birthdays(day), 'anniversaries': anniversaries(day)}
+    if not digest['birthdays'] and not digest['anniversaries']:
+        return None
+    title = announcement_title(day)
+    with transaction.atomic():
+        if Announcement.objects.filter(title=title).exists():
+            return None
+        announcement = Announcement.objects.create(title=title, content=announcement_content(digest))
+        publish_event('announcement.created', {'id': announcement.pk, 'title': announcement.title})
+    invalidate_unread_counts()
+    return announcement
@@ -0,0 +1,97 @@
+# core/choices.py
+"""
+Cached choice lists for admin and signup forms.
+
+Department dropdowns and employee autocomplete results are cached under a
+per-list version number. Saving or deleting a Department or User bumps the
+matching version (see core/signals.py), which makes every cached entry for
+that list stale at once without having to know its keys.
+
+Employee pickers no longer render every approved employee into a <select>;
+they ask employee_search() for a handful of prefix matches per keystroke.
+"""
+
+import hashlib
+
+from django.core.cache import cache
+from django.db.models import Q
+from django.db.models.functions import Lower
+
+from .models import Department, User
+
+CHOICES_CACHE_TIMEOUT = 300
+AUTOCOMPLETE_LIMIT = 10
+# Fields matched by employee_search(); each has a Lower() index on User
+EMPLOYEE_SEARCH_FIELDS = ('username', 'first_name', 'last_name')
+
+
+def _version_key(name):
+    return f'choices:{name}:version'
+
+
+def _version(name):
+    version = cache.get(_version_key(name))
+    if version is None:
+        version = 1
+        cache.add(_version_key(name), version, None)
+    return version
+
+
+def invalidate_choices(name):
+    """Make every cached entry of one choice list ('departments' or 'employees') stale."""
+    try:
+        cache.incr(_version_key(name))
+    except ValueError:
+        cache.set(_version_key(name), 2, None)
+
+
+def department_choices():
+    """[(pk, name), ...] for every department, ordered by name."""
+    key = f"choices:departments:{_version('departments')}"
+    choices = cache.get(key)
+    if choices is None:
+        choices = list(Department.objects.order_by('name').values_list('pk', 'name'))
+        cache.set(key, choices, CHOICES_CACHE_TIMEOUT)
+    return choices
+
+
+def employee_label(first_name, last_name, username):
+    full_name = f'{first_name} {last_name}'.strip()
+    return f'{full_name} ({username})' if full_name else username
+
+
+def _prefix_filter(field, prefix):
+    # A LIKE 'prefix%' on the lowercased column. Whether an index can serve
+    # it depends on the backend: PostgreSQL needs a text_pattern_ops index
+    # under a linguistic collation (migration 0024 adds them), since a plain
+    # range would follow the collation's order rather than the prefix
+    return Q(**{f'{field}_ci__startswith': prefix})
+
+
+def employee_search(term, limit=AUTOCOMPLETE_LIMIT):
+    """
+    Approved employees whose username, first name or last name starts with
+    term (case-insensitively), as [{'id': ..., 'label': ...}, ...].
+    """
+    prefix = term.strip().lower()
+    if not prefix:
+        return []
+
+    # Hashed, so spaces and other characters in the term make a valid key on every cache backend
+    digest = hashlib.md5(prefix.encode()).hexdigest()
+    key = f"choices:employees:{_version('employees')}:{limit}:{digest}"
+    results = cache.get(key)
+    if results is None:
+        lookup = Q()
+        for field in EMPLOYEE_SEARCH_FIELDS:
+            lookup |= _prefix_filter(field, prefix)
+        rows = (
+            User.objects.filter(role='EMPLOYEE', is_approved=True)
+            .annotate(**{f'{field}_ci': Lower(field) for field in EMPLOYEE_SEARCH_FIELDS})
+            .filter(lookup)
+            .order_by('last_name_ci', 'first_name_ci', 'pk')
+            .values_list('pk', 'first_name', 'last_name', 'username')[:limit]
+        )
+        results = [{'id': pk, 'label': employee_label(first, last, username)} for pk, first, last, username in rows]
+        cache.set(key, results, CHOICES_CACHE_TIMEOUT)
+    return results
@@ -0,0 +1,138 @@
+# core/events.py
+"""
+Server-sent events feed for announcements and leave decisions.
+
+Every event is written to the FeedEvent table, which is the source of truth
+and lets clients resume with Last-Event-ID. On top of that an in-process
+broker wakes up the streams connected to the same worker the moment an event
+is committed. Streams on other workers pick the event up on their next DB
+poll (every SSE_POLL_INTERVAL seconds), so multi-worker deployments still
+deliver everything, just with a little more latency.
+
+A stream starts from the newest event and lives at most SSE_MAX_DURATION
+seconds, so older events can no longer be asked for. The job worker
+deletes them (purge_feed_events) to keep the table, and every poll, small.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import FeedEvent
+
+
+class EventBroker:
+    """In-process fan-out that wakes the SSE streams waiting for a user."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # user id -> set of (event loop, asyncio.Event) for connected streams
+        self.waiters = {}
+
+    def subscribe(self, user_id):
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self.lock:
+            self.waiters.setdefault(user_id, set()).add(waiter)
+        return waiter
+
+    def unsubscribe(self, user_id, waiter):
+        with self.lock:
+            waiters = self.waiters.get(user_id)
+            if waiters is not None:
+                waiters.discard(waiter)
+                if not waiters:
+                    del self.waiters[user_id]
+
+    def notify(self, user_id=None):
+        """Wake the streams of one user, or of everyone when user_id is None."""
+        with self.lock:
+            if user_id is None:
+                targets = [waiter for waiters in self.waiters.values() for waiter in waiters]
+            else:
+                targets = list(self.waiters.get(user_id, ()))
+        for loop, event in targets:
+            # publish() runs in sync request threads, the streams on the event loop
+            loop.call_soon_threadsafe(event.set)
+
+
+broker = EventBroker()
+
+
+def publish_event(kind, data, user=None):
+    """
+    Store an event for the feed and wake local listeners once the current
+    transaction commits. A user of None broadcasts to everyone.
+    """
+    event = FeedEvent.objects.create(kind=kind, data=data, user=user)
+    user_id = user.pk if user is not None else None
+    transaction.on_commit(lambda: broker.notify(user_id))
+    return event
+
+
+def purge_feed_events():
+    """
+    Delete events older than any connected stream could still resume from:
+    SSE_MAX_DURATION plus FEED_RETENTION_MARGIN for reconnecting browsers.
+    """
+    keep = getattr(settings, 'SSE_MAX_DURATION', 1800) + getattr(settings, 'FEED_RETENTION_MARGIN', 3600)
+    deleted, _ = FeedEvent.objects.filter(created_at__lt=timezone.now() - timedelta(seconds=keep)).delete()
+    return deleted
+
+
+def _format(event):
+    payload = json.dumps({'id': event.pk, 'kind': event.kind, 'data': event.data, 'created_at': event.created_at.isoformat()})
+    return f"id: {event.pk}\nevent: {event.kind}\ndata: {payload}\n\n"
+
+
+async def _latest_event_id():
+    latest = await FeedEvent.objects.order_by('-id').values_list('id', flat=True).afirst()
+    return latest or 0
+
+
+async def _events_after(user_id, last_id):
+    queryset = (
+        FeedEvent.objects.filter(id__gt=last_id)
+        .filter(Q(user__isnull=True) | Q(user_id=user_id))
+        .order_by('id')[:100]
+    )
+    return [event async for event in queryset]
+
+
+async def event_stream(user_id, last_id=None):
+    """
+    Async generator of SSE frames for one user. It waits for a local wake-up
+    or the poll interval, whichever comes first, and then reads new events
+    from the database after the last delivered id.
+    """
+    poll_interval = getattr(settings, 'SSE_POLL_INTERVAL', 15)
+    max_duration = getattr(settings, 'SSE_MAX_DURATION', 1800)
+    if last_id is None:
+        last_id = await _latest_event_id()
+
+    loop, wake = broker.subscribe(user_id)
+    deadline = time.monotonic() + max_duration
+    try:
+        yield f"retry: {int(poll_interval * 1000)}\n\n"
+        while time.monotonic() < deadline:
+            try:
+                await asyncio.wait_for(wake.wait(), timeout=poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            wake.clear()
+
+            events = await _events_after(user_id, last_id)
+            for event in events:
+                last_id = event.pk
+                yield _format(event)
+            if not events:
+                # Comment frame keeps proxies from closing an idle connection
+                yield ": keepalive\n\n"
+    finally:
+        broker.unsubscribe(user_id, (loop, wake))
@@ -1,36 +1,52 @@
 # core/forms.py
 
+import copy
+
 from django import forms
+from django.forms.models import ModelFormMetaclass
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import Lower
 from django.contrib.auth.forms import UserCreationForm, UserChangeForm
 from .models import User, Department, Leave, Payroll, Attendance,Announcement
+from .choices import department_choices
 
-class AnnouncementForm(forms.ModelForm):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        common_attrs = {
-            'class': 'bg-gray-50 border border-gray-300 text-gray-900 text-sm rounded-lg focus:ring-blue-500 focus:border-blue-500 block w-full p-3.5'
-        }
-        
-        for field_name, field in self.fields.items():
-            # Apply common styles to all fields except checkboxes
-            if isinstance(field.widget, (forms.TextInput, forms.EmailInput, forms.NumberInput, forms.Select, forms.DateInput, forms.PasswordInput)):
-                field.widget.attrs.update(common_attrs)
+INPUT_CLASS = 'bg-gray-50 border border-gray-300 text-gray-900 text-sm rounded-lg focus:ring-blue-500 focus:border-blue-500 block w-full p-3.5'
+COMPACT_INPUT_CLASS = 'bg-gray-50 border border-gray-300 text-gray-900 text-sm rounded-lg focus:ring-blue-500 focus:border-blue-500 block w-full p-2.5'
+# Widgets that get the input styles (date and time inputs subclass TextInput);
+# checkboxes and textareas keep their own
+STYLED_WIDGETS = (forms.TextInput, forms.EmailInput, forms.NumberInput, forms.Select, forms.DateInput, forms.PasswordInput)
+
+
+class StyledModelFormMetaclass(ModelFormMetaclass):
+    """
+    Apply field_css_class to the form's widgets once, when the form class is
+    created. Every instance deep-copies base_fields, so it inherits the styled
+    widgets without looping over its fields on each request.
+    """
+    def __new__(mcs, name, bases, attrs):
+        new_class = super().__new__(mcs, name, bases, attrs)
+        css_class = getattr(new_class, 'field_css_class', None)
+        if css_class:
+            for field_name, field in new_class.base_fields.items():
+                if isinstance(field.widget, STYLED_WIDGETS):
+                    # Copy first: inherited fields are shared with the parent class
+                    field = copy.deepcopy(field)
+                    field.widget.attrs['class'] = css_class
+                    new_class.base_fields[field_name] = field
+        return new_class
+
+
+class StyledModelForm(forms.ModelForm, metaclass=StyledModelFormMetaclass):
+    field_css_class = INPUT_CLASS
+
+
+class AnnouncementForm(StyledModelForm):
     class Meta:
         model = Announcement
         fields = ['title', 'content']
         
 
-class AttendanceForm(forms.ModelForm):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        common_attrs = {
-            'class': 'bg-gray-50 border border-gray-300 text-gray-900 text-sm rounded-lg focus:ring-blue-500 focus:border-blue-500 block w-full p-3.5'
-        }
-        
-        for field_name, field in self.fields.items():
-            # Apply common styles to all fields except checkboxes
-            if isinstance(field.widget, (forms.TextInput, forms.EmailInput, forms.NumberInput, forms.Select, forms.DateInput, forms.PasswordInput)):
-                field.widget.attrs.update(common_attrs)
+class AttendanceForm(StyledModelForm):
     class Meta:
         model = Attendance
         fields = ['employee', 'date', 'clock_in', 'clock_out']
@@ -40,18 +56,7 @@ class AttendanceForm(forms.ModelForm):
             'clock_out': forms.TimeInput(attrs={'type': 'time'}),
         }
 
-class PayrollForm(forms.ModelForm):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        common_attrs = {
-            'class': 'bg-gray-50 border border-gray-300 text-gray-900 text-sm rounded-lg focus:ring-blue-500 focus:border-blue-500 block w-full p-3.5'
-        }
-        
-        for field_name, field in self.fields.items():
-            # Apply common styles to all fields except checkboxes
-            if isinstance(field.widget, (forms.TextInput, forms.EmailInput, forms.NumberInput, forms.Select, forms.DateInput, forms.PasswordInput)):
-                field.widget.attrs.update(common_attrs)
-   
+class PayrollForm(StyledModelForm):
     class Meta:
         model = Payroll
         fields = ['employee', 'salary', 'pay_period_start', 'pay_period_end']
@@ -60,17 +65,7 @@ class PayrollForm(forms.ModelForm):
             'pay_period_end': forms.DateInput(attrs={'type': 'date'}),
         }
 
-class LeaveForm(forms.ModelForm):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        common_attrs = {
-            'class': 'bg-gray-50 border border-gray-300 text-gray-900 text-sm rounded-lg focus:ring-blue-500 focus:border-blue-500 block w-full p-3.5'
-        }
-        
-        for field_name, field in self.fields.items():
-            # Apply common styles to all fields except checkboxes
-            if isinstance(field.widget, (forms.TextInput, forms.EmailInput, forms.NumberInput, forms.Select, forms.DateInput, forms.PasswordInput)):
-                field.widget.attrs.update(common_attrs)
+class LeaveForm(StyledModelForm):
     class Meta:
         model = Leave
         fields = ['start_date', 'end_date', 'reason']
@@ -79,22 +74,14 @@ class LeaveForm(forms.ModelForm):
             'end_date': forms.DateInput(attrs={'type': 'date'}),
         }
 
-class DepartmentForm(forms.ModelForm):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        common_attrs = {
-            'class': 'bg-gray-50 border border-gray-300 text-gray-900 text-sm rounded-lg focus:ring-blue-500 focus:border-blue-500 block w-full p-2.5'
-        }
-        
-        for field_name, field in self.fields.items():
-            # Apply common styles to all fields except checkboxes
-            if isinstance(field.widget, (forms.TextInput, forms.EmailInput, forms.NumberInput, forms.Select, forms.DateInput, forms.PasswordInput)):
-                field.widget.attrs.update(common_attrs)
+class DepartmentForm(StyledModelForm):
+    field_css_class = COMPACT_INPUT_CLASS
+
     class Meta:
         model = Department
         fields = ['name']
 
-class EmployeeSignUpForm(UserCreationForm):
+class EmployeeSignUpForm(UserCreationForm, metaclass=StyledModelFormMetaclass):
     """
     A form for creating new employee users with additional profile information.
     Inherits from Django's UserCreationForm and uses the custom User model.
@@ -125,17 +112,14 @@ class EmployeeSignUpForm(UserCreationForm):
         widget=forms.NumberInput(attrs={'min': '0', 'max': '50'})
     )
 
+    field_css_class = COMPACT_INPUT_CLASS
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        common_attrs = {
-            'class': 'bg-gray-50 border border-gray-300 text-gray-900 text-sm rounded-lg focus:ring-blue-500 focus:border-blue-500 block w-full p-2.5'
-        }
-        
-        for field_name, field in self.fields.items():
-            # Apply common styles to all fields except checkboxes
-            if isinstance(field.widget, (forms.TextInput, forms.EmailInput, forms.NumberInput, forms.Select, forms.DateInput, forms.PasswordInput)):
-                field.widget.attrs.update(common_attrs)
-        
+
+        # Render the department dropdown from the cached list instead of a query per form
+        self.fields['department'].choices = [('', self.fields['department'].empty_label), *department_choices()]
+
         # Ensure required fields are marked
         self.fields['username'].required = True
         self.fields['email'].required = True
@@ -168,78 +152,41 @@ class EmployeeSignUpForm(UserCreationForm):
         return password2
 
     def clean_username(self):
-        """Check if username is already taken."""
-        username = self.cleaned_data.get('username')
-        print(f"DEBUG: clean_username called with: '{username}'")
-        print(f"DEBUG: Form instance: {self.instance}")
-        print(f"DEBUG: Form instance.pk: {getattr(self.instance, 'pk', None)}")
-        
-        if username:
-            # If we're editing an existing user, exclude that user from the check
-            queryset = User.objects.filter(username=username)
-            if self.instance and self.instance.pk:
-                queryset = queryset.exclude(pk=self.instance.pk)
-                print(f"DEBUG: Excluding user with pk: {self.instance.pk}")
-            
-            exact_match = queryset.exists()
-            print(f"DEBUG: Exact match for '{username}': {exact_match}")
-            
-            # Check for case-insensitive match
-            case_insensitive_queryset = User.objects.filter(username__iexact=username)
-            if self.instance and self.instance.pk:
-                case_insensitive_queryset = case_insensitive_queryset.exclude(pk=self.instance.pk)
-            
-            case_insensitive_match = case_insensitive_queryset.exists()
-            print(f"DEBUG: Case-insensitive match for '{username}': {case_insensitive_match}")
-            
-            # List all existing usernames for debugging
-            existing_usernames = list(User.objects.values_list('username', flat=True))
-            print(f"DEBUG: All existing usernames: {existing_usernames}")
-            
-            if exact_match:
-                print(f"DEBUG: Username '{username}' already exists!")
-                raise forms.ValidationError("A user with this username already exists.")
-        return username
+        """Usernames are compared case-insensitively; see clean() for the uniqueness check."""
+        return self.cleaned_data.get('username')
 
     def clean_email(self):
-        """Check if email is already taken."""
+        """Emails are compared case-insensitively; see clean() for the uniqueness check."""
         email = self.cleaned_data.get('email')
-        print(f"DEBUG: clean_email called with: '{email}'")
-        print(f"DEBUG: Form instance: {self.instance}")
-        print(f"DEBUG: Form instance.pk: {getattr(self.instance, 'pk', None)}")
-        
+        return User.objects.normalize_email(email) if email else email
+
+    def _check_unique_identity(self):
+        """
+        Check username and email against the case-folded unique indexes with
+        a single query instead of separate exact and iexact lookups per field.
+        """
+        username = self.cleaned_data.get('username')
+        email = self.cleaned_data.get('email')
+        if not username and not email:
+            return
+
+        lookup = models.Q()
+        if username:
+            lookup |= models.Q(username_ci=username.lower())
         if email:
-            # If we're editing an existing user, exclude that user from the check
-            queryset = User.objects.filter(email=email)
-            if self.instance and self.instance.pk:
-                queryset = queryset.exclude(pk=self.instance.pk)
-                print(f"DEBUG: Excluding user with pk: {self.instance.pk}")
-            
-            exact_match = queryset.exists()
-            print(f"DEBUG: Exact email match for '{email}': {exact_match}")
-            
-            # Check for case-insensitive match
-            case_insensitive_queryset = User.objects.filter(email__iexact=email)
-            if self.instance and self.instance.pk:
-                case_insensitive_queryset = case_insensitive_queryset.exclude(pk=self.instance.pk)
-            
-            case_insensitive_match = case_insensitive_queryset.exists()
-            print(f"DEBUG: Case-insensitive email match for '{email}': {case_insensitive_match}")
-            
-            # List all existing emails for debugging
-            existing_emails = list(User.objects.values_list('email', flat=True))
-            print(f"DEBUG: All existing emails: {existing_emails}")
-            
-            if exact_match:
-                print(f"DEBUG: Email '{email}' already exists!")
-                raise forms.ValidationError("A user with this email already exists.")
-        return email
+            lookup |= models.Q(email_ci=email.lower())
+        queryset = User.objects.annotate(username_ci=Lower('username'), email_ci=Lower('email')).filter(lookup)
+        if self.instance and self.instance.pk:
+            queryset = queryset.exclude(pk=self.instance.pk)
+
+        for existing_username, existing_email in queryset.values_list('username_ci', 'email_ci')[:2]:
+            if username and existing_username == username.lower() and 'username' not in self._errors:
+                self.add_error('username', "A user with this username already exists.")
+            if email and existing_email == email.lower() and 'email' not in self._errors:
+                self.add_error('email', "A user with this email already exists.")
 
     def _post_clean(self):
         """Override to run our custom validations while skipping Django's password validation."""
-        print(f"DEBUG: _post_clean called")
-        print(f"DEBUG: Form fields: {list(self.fields.keys())}")
-        
         # Run individual field clean methods (including our custom clean_username and clean_email)
         self._clean_fields()
         
@@ -252,7 +199,7 @@ class EmployeeSignUpForm(UserCreationForm):
     def clean(self):
         """Custom validation for the form."""
         cleaned_data = super().clean()
-        print(f"DEBUG: Form clean method called. Data: {cleaned_data}")
+        self._check_unique_identity()
         return cleaned_data
 
     class Meta(UserCreationForm.Meta):
@@ -276,9 +223,6 @@ class EmployeeSignUpForm(UserCreationForm):
         Saves the user instance, setting the role to 'EMPLOYEE'.
         The user will not be approved by default but will be active.
         """
-        print(f"DEBUG: Form save method called. Commit: {commit}")
-        print(f"DEBUG: Form cleaned_data: {self.cleaned_data}")
-        
         user = super().save(commit=False)
         
         # Ensure the user object has the correct values from the form
@@ -296,41 +240,21 @@ class EmployeeSignUpForm(UserCreationForm):
         user.is_approved = False
         user.is_active = True # IMPORTANT: This allows the user to be authenticated
         
-        print(f"DEBUG: User object before save - Username: '{user.username}', Email: '{user.email}'")
-        
         if commit:
-            # Final check right before saving to database
-            username = user.username
-            email = user.email
-            
-            print(f"DEBUG: Final check before save - Username: '{username}', Email: '{email}'")
-            
-            # Check username one more time
-            if User.objects.filter(username=username).exists():
-                print(f"DEBUG: Username '{username}' now exists in database!")
-                raise forms.ValidationError("A user with this username already exists.")
-            
-            # Check email one more time
-            if User.objects.filter(email=email).exists():
-                print(f"DEBUG: Email '{email}' now exists in database!")
-                raise forms.ValidationError("A user with this email already exists.")
-            
-            print(f"DEBUG: Saving user to database: {user.username}")
+            # The case-folded unique indexes are the final word: a concurrent
+            # signup that slipped past clean() fails here instead of creating a duplicate
             try:
-                user.save()
-                print(f"DEBUG: User saved successfully! User ID: {user.id}")
-            except Exception as e:
-                print(f"DEBUG: Error saving user: {e}")
-                # Re-raise as ValidationError so it's handled properly by the form
-                if "UNIQUE constraint failed" in str(e):
-                    if "username" in str(e):
-                        raise forms.ValidationError("A user with this username already exists.")
-                    elif "email" in str(e):
-                        raise forms.ValidationError("A user with this email already exists.")
+                with transaction.atomic():
+                    user.save()
+            except IntegrityError as e:
+                if 'username' in str(e):
+                    raise forms.ValidationError("A user with this username already exists.")
+                if 'email' in str(e):
+                    raise forms.ValidationError("A user with this email already exists.")
                 raise forms.ValidationError(f"Error saving user: {str(e)}")
         return user
 
-class EmployeeUpdateForm(UserChangeForm):
+class EmployeeUpdateForm(UserChangeForm, metaclass=StyledModelFormMetaclass):
     password = None # Exclude password from the form
     department = forms.ModelChoiceField(
         queryset=Department.objects.all(), 
@@ -339,16 +263,11 @@ class EmployeeUpdateForm(UserChangeForm):
     )
 
 
+    field_css_class = COMPACT_INPUT_CLASS
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        common_attrs = {
-            'class': 'bg-gray-50 border border-gray-300 text-gray-900 text-sm rounded-lg focus:ring-blue-500 focus:border-blue-500 block w-full p-2.5'
-        }
-        
-        for field_name, field in self.fields.items():
-            # Apply common styles to all fields except checkboxes
-            if isinstance(field.widget, (forms.TextInput, forms.EmailInput, forms.NumberInput, forms.Select, forms.DateInput)):
-                field.widget.attrs.update(common_attrs)
+        self.fields['department'].choices = [('', self.fields['department'].empty_label), *department_choices()]
 
     class Meta:
         model = User
@@ -0,0 +1,87 @@
+# core/hashers.py
+"""
+Password hasher with a configurable cost profile.
+
+PBKDF2 cost is almost all of the CPU time of a signup or login, so the
+iteration count is taken from settings (PASSWORD_HASH_PROFILE or
+PASSWORD_HASH_ITERATIONS) instead of Django's hard-coded default. The
+algorithm name stays pbkdf2_sha256 and every hash stores its own iteration
+count, so existing passwords keep verifying and are re-hashed at the new
+cost on the user's next login.
+
+A misconfigured cost would quietly weaken every stored hash as users log
+in, so an unknown profile name is an error, and so is an iteration count
+below the 'fast' profile unless DEBUG is on. CoreConfig.ready() checks
+this at startup.
+
+PASSWORD_HASH_CONCURRENCY caps how many hashes a worker process computes at
+once, so a signup burst cannot tie up every thread and starve the cheap
+requests (clock-in, dashboards) queued behind it.
+"""
+
+import threading
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.core.exceptions import ImproperlyConfigured
+
+HASH_PROFILES = {
+    # Django's own default for this version
+    'strong': PBKDF2PasswordHasher.iterations,
+    # OWASP's recommended minimum for PBKDF2-HMAC-SHA256
+    'balanced': 600_000,
+    # Local development, tests and seeding only
+    'fast': 10_000,
+}
+
+_budget = None
+_budget_lock = threading.Lock()
+
+
+# Fewest iterations accepted outside DEBUG
+MIN_ITERATIONS = HASH_PROFILES['fast']
+
+
+def hash_iterations():
+    """The configured PBKDF2 iteration count; raises ImproperlyConfigured for an invalid setting."""
+    iterations = getattr(settings, 'PASSWORD_HASH_ITERATIONS', None)
+    if iterations:
+        iterations = int(iterations)
+        if iterations < MIN_ITERATIONS and not settings.DEBUG:
+            raise ImproperlyConfigured(
+                f'PASSWORD_HASH_ITERATIONS={iterations} is below the minimum of {MIN_ITERATIONS:,} '
+                '(allowed only with DEBUG)'
+            )
+        return iterations
+    profile = getattr(settings, 'PASSWORD_HASH_PROFILE', 'strong')
+    if profile not in HASH_PROFILES:
+        raise ImproperlyConfigured(
+            f"Unknown PASSWORD_HASH_PROFILE {profile!r}; choose one of {', '.join(HASH_PROFILES)}"
+        )
+    return HASH_PROFILES[profile]
+
+
+def _hash_budget():
+    """Process-wide semaphore sized by PASSWORD_HASH_CONCURRENCY (0 disables it)."""
+    global _budget
+    if _budget is None:
+        with _budget_lock:
+            if _budget is None:
+                limit = getattr(settings, 'PASSWORD_HASH_CONCURRENCY', 0)
+                _budget = threading.BoundedSemaphore(limit) if limit > 0 else False
+    return _budget
+
+
+class ProfiledPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 whose iteration count follows the configured profile."""
+
+    @property
+    def iterations(self):
+        return hash_iterations()
+
+    def encode(self, password, salt, iterations=None):
+        budget = _hash_budget()
+        if not budget:
+            return super().encode(password, salt, iterations)
+        with budget:
+            return super().encode(password, salt, iterations)
@@ -0,0 +1,114 @@
+# core/health.py
+"""
+Liveness and readiness probes.
+
+HealthCheckMiddleware sits first in MIDDLEWARE and answers /health/ and
+/ready/ before sessions, CSRF, auth, messages or URL resolution run, so
+orchestrator polling costs next to nothing. The readiness probe checks the
+database at most once per READINESS_CHECK_INTERVAL seconds and serves the
+cached result in between. The middleware handles both sync and async
+requests, so under ASGI probes and the async views behind it do not pay
+for a hop to a worker thread.
+"""
+
+import threading
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connection
+from django.http import HttpResponse
+
+HEALTH_PATHS = ('/health/', '/health')
+READY_PATHS = ('/ready/', '/ready')
+
+_LIVE_BODY = b'{"status": "healthy"}'
+_READY_BODY = b'{"status": "ready"}'
+_NOT_READY_BODY = b'{"status": "unavailable"}'
+
+_lock = threading.Lock()
+# 'at' is None until the first check has finished
+_last_check = {'at': None, 'ok': False}
+
+
+def database_ready():
+    """Return the cached DB check result, refreshing it when it has expired."""
+    interval = getattr(settings, 'READINESS_CHECK_INTERVAL', 5)
+    if _last_check['at'] is not None and time.monotonic() - _last_check['at'] < interval:
+        return _last_check['ok']
+
+    # Only one thread probes the database. While it does, the others serve
+    # the previous result, or wait for this one when there is none yet
+    if not _lock.acquire(blocking=_last_check['at'] is None):
+        return _last_check['ok']
+    try:
+        # Another thread may have finished a check while this one waited
+        if _last_check['at'] is not None and time.monotonic() - _last_check['at'] < interval:
+            return _last_check['ok']
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            ok = True
+        except Exception:
+            ok = False
+        _last_check['ok'] = ok
+        _last_check['at'] = time.monotonic()
+        return ok
+    finally:
+        _lock.release()
+
+
+def _json_response(body, status=200):
+    response = HttpResponse(body, content_type='application/json', status=status)
+    response['Cache-Control'] = 'no-store'
+    return response
+
+
+def health_check(request):
+    """Liveness: the process is up and serving requests."""
+    return _json_response(_LIVE_BODY)
+
+
+def readiness_check(request):
+    """Readiness: the process can reach its database."""
+    return _readiness_response(database_ready())
+
+
+async def areadiness_check(request):
+    return _readiness_response(await sync_to_async(database_ready)())
+
+
+def _readiness_response(ok):
+    if ok:
+        return _json_response(_READY_BODY)
+    return _json_response(_NOT_READY_BODY, status=503)
+
+
+class HealthCheckMiddleware:
+    """Answer health probes before the rest of the middleware stack runs."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        path = request.path_info
+        if path in HEALTH_PATHS:
+            return health_check(request)
+        if path in READY_PATHS:
+            return readiness_check(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        path = request.path_info
+        if path in HEALTH_PATHS:
+            return health_check(request)
+        if path in READY_PATHS:
+            return await areadiness_check(request)
+        return await self.get_response(request)
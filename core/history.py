@@ -0,0 +1,102 @@
+# core/history.py
+"""
+Keyset pagination for an employee's own history lists (attendance, leave
+requests, payslips).
+
+Each list is ordered newest first by its date and then by id. A page is
+the next page_size rows after a cursor, which is the date and id of the
+last row already shown, so every page is one seek on an (employee, date
+desc, id desc) index. Deep pages cost the same as the first one, unlike
+OFFSET. The first paint renders only the latest page and the rest is
+fetched on demand from the load-more endpoint.
+
+Attendance and paid payroll moved to the archive tables by archive_history
+stay in the employee's history: those lists read the same page from the
+live and the archive table and merge the two. Archived rows keep their
+original ids, so the cursor works across both.
+"""
+
+from datetime import date
+
+from .models import ArchivedAttendance, ArchivedPayroll, Attendance, Leave, Payroll
+
+HISTORIES = {
+    'attendance': {
+        'model': Attendance,
+        'archive_model': ArchivedAttendance,
+        'date_field': 'date',
+        # About a month of working days
+        'page_size': 31,
+        'rows_template': 'employee_attendance_rows.html',
+    },
+    'leaves': {
+        'model': Leave,
+        'date_field': 'start_date',
+        'page_size': 20,
+        'rows_template': 'leave_history_rows.html',
+    },
+    'payslips': {
+        'model': Payroll,
+        'archive_model': ArchivedPayroll,
+        'date_field': 'pay_period_end',
+        'page_size': 12,
+        'rows_template': 'employee_payslips_rows.html',
+    },
+}
+
+
+def encode_cursor(day, pk):
+    return f'{day.isoformat()}.{pk}'
+
+
+def decode_cursor(value):
+    """(date, id) from a cursor string. Raises ValueError if it is malformed."""
+    day, _, pk = value.partition('.')
+    return date.fromisoformat(day), int(pk)
+
+
+def _page_rows(model, employee, date_field, cursor, limit):
+    queryset = model.objects.filter(employee=employee).order_by(f'-{date_field}', '-pk')
+    if cursor:
+        day, pk = decode_cursor(cursor)
+        # A range on the index plus a cheap exclusion of the rows on the
+        # cursor's own day that were already shown
+        queryset = queryset.filter(**{f'{date_field}__lte': day}).exclude(**{date_field: day, 'pk__gte': pk})
+    return list(queryset[:limit])
+
+
+def history_page(name, employee, cursor=None):
+    """
+    (rows, next cursor) for one page of the employee's history, newest
+    first. The next cursor is None on the last page.
+    """
+    history = HISTORIES[name]
+    date_field = history['date_field']
+    limit = history['page_size'] + 1
+    rows = _page_rows(history['model'], employee, date_field, cursor, limit)
+    if history.get('archive_model'):
+        rows += _page_rows(history['archive_model'], employee, date_field, cursor, limit)
+        rows.sort(key=lambda row: (getattr(row, date_field), row.pk), reverse=True)
+        rows = rows[:limit]
+    if len(rows) <= history['page_size']:
+        return rows, None
+    rows = rows[:history['page_size']]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, date_field), last.pk)
+
+
+def group_by_month(name, rows, cursor=None):
+    """
+    [{'month': first day of the month, 'continued': bool, 'rows': [...]}, ...].
+    A group continues the previous page's last month when the cursor falls
+    in the same month, so the page does not repeat its heading.
+    """
+    date_field = HISTORIES[name]['date_field']
+    previous = decode_cursor(cursor)[0].replace(day=1) if cursor else None
+    groups = []
+    for row in rows:
+        month = getattr(row, date_field).replace(day=1)
+        if not groups or groups[-1]['month'] != month:
+            groups.append({'month': month, 'continued': month == previous, 'rows': []})
+        groups[-1]['rows'].append(row)
+    return groups
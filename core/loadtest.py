@@ -0,0 +1,74 @@
+# core/loadtest.py
+"""
+Helpers shared by the HTTP load-test and benchmark commands (loadtest_punch,
+benchmark_server, benchmark_startup): throwaway accounts, pre-made session
+cookies, local gunicorn servers and percentiles.
+"""
+
+import http.client
+import socket
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model, BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.sessions.backends.db import SessionStore
+
+User = get_user_model()
+
+
+def prepare_users(usernames, **fields):
+    """
+    Get or create approved users with the given usernames. Returns
+    (users, number created). They never log in with a password, so
+    creating them skips password hashing.
+    """
+    existing = set(User.objects.filter(username__in=usernames).values_list('username', flat=True))
+    missing = [name for name in usernames if name not in existing]
+    for username in missing:
+        user = User(username=username, email=f'{username}@loadtest.local', is_approved=True, **fields)
+        user.set_unusable_password()
+        user.save()
+    return list(User.objects.filter(username__in=usernames)), len(missing)
+
+
+def login_cookie(user):
+    """Create a DB session for ``user`` and return the Cookie header value."""
+    session = SessionStore()
+    session[SESSION_KEY] = user._meta.pk.value_to_string(user)
+    session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+    session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+    session.save()
+    return f"{settings.SESSION_COOKIE_NAME}={session.session_key}"
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_healthy(process, port, timeout=60):
+    """
+    Poll /health/ on a local server until it answers 200. Returns False if
+    the process exits or the timeout passes first.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            conn.request('GET', '/health/')
+            if conn.getresponse().status == 200:
+                return True
+        except OSError:
+            pass
+        time.sleep(0.05)
+    return False
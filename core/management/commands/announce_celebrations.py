@@ -0,0 +1,32 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.celebrations import announce_celebrations
+
+
+class Command(BaseCommand):
+    help = (
+        "Publish an announcement for today's birthdays and work anniversaries. "
+        'Safe to re-run; schedule it daily, e.g. `0 7 * * * python manage.py announce_celebrations`.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', help='Day to announce, YYYY-MM-DD (default: today)')
+
+    def handle(self, *args, **options):
+        if options['date']:
+            try:
+                day = date.fromisoformat(options['date'])
+            except ValueError:
+                raise CommandError('--date must be YYYY-MM-DD')
+        else:
+            day = timezone.localdate()
+
+        announcement = announce_celebrations(day)
+        if announcement is None:
+            self.stdout.write(f'Nothing new to announce for {day} (no celebrations, or already announced).')
+            return
+        self.stdout.write(f'  {announcement.content}')
+        self.stdout.write(self.style.SUCCESS(f'Published "{announcement.title}"'))
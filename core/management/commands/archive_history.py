@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+import time
+
+from core.retention import POLICIES, archivable, archive, retention_cutoff
+
+
+class Command(BaseCommand):
+    help = (
+        'Move attendance and paid payroll older than the retention window into the archive tables, '
+        'keeping the hot tables small. Safe to re-run or interrupt.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--attendance-months', type=int, help='Keep this many months of attendance (default: RETENTION_ATTENDANCE_MONTHS)')
+        parser.add_argument('--payroll-months', type=int, help='Keep this many months of paid payroll (default: RETENTION_PAYROLL_MONTHS)')
+        parser.add_argument('--only', choices=sorted(POLICIES), help='Run a single policy')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Rows moved per transaction (default: 2000)')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many rows would be archived')
+
+    def handle(self, *args, **options):
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size must be at least 1')
+        months = {'attendance': options['attendance_months'], 'payroll': options['payroll_months']}
+
+        for name in POLICIES:
+            if options['only'] and name != options['only']:
+                continue
+            if months[name] is not None and months[name] < 0:
+                raise CommandError(f'--{name}-months cannot be negative')
+            cutoff = retention_cutoff(name, months[name])
+
+            if options['dry_run']:
+                count = archivable(name, cutoff).count()
+                self.stdout.write(f'  Would archive {count:,} {name} rows dated before {cutoff}')
+                continue
+
+            self.stdout.write(f'Archiving {name} dated before {cutoff}...')
+            started = time.perf_counter()
+
+            def progress(moved):
+                self.stdout.write(f'  {moved:,} rows moved', ending='\r')
+                self.stdout.flush()
+
+            moved = archive(name, cutoff, options['chunk_size'], progress)
+            elapsed = time.perf_counter() - started
+            rate = moved / elapsed if elapsed > 0 else 0
+            self.stdout.write(f'  Archived {moved:,} {name} rows in {elapsed:.2f}s ({rate:,.0f} rows/sec)' + ' ' * 10)
+
+        self.stdout.write(self.style.SUCCESS('Archiving complete.'))
@@ -0,0 +1,207 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from datetime import timedelta
+import django
+import json
+import os
+import statistics
+import time
+
+from core.models import Attendance, Payroll, Leave, Job
+from core.tasks import run_job
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        'Drive the Django test client through dashboards, filtered list views, clock-in and payslip PDF '
+        'generation, and record latency percentiles and query counts to a JSON baseline.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help='Requests per scenario (default: 20)')
+        parser.add_argument('--warmup', type=int, default=2, help='Untimed warm-up requests per scenario')
+        parser.add_argument(
+            '--output',
+            default=os.path.join('benchmarks', 'latest.json'),
+            help='Where to write the results JSON (default: benchmarks/latest.json)',
+        )
+        parser.add_argument('--baseline', help='Previous results JSON to compare against')
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=20.0,
+            help='Percent p95 slowdown or query-count increase reported as a regression (default: 20)',
+        )
+        parser.add_argument(
+            '--fail-on-regression',
+            action='store_true',
+            help='Exit with an error when a regression is found (for CI)',
+        )
+        parser.add_argument('--only', nargs='+', help='Run only the named scenarios')
+
+    def handle(self, *args, **options):
+        employee = (
+            User.objects.filter(role='EMPLOYEE', is_approved=True)
+            .annotate(payslips=Count('payroll'))
+            .filter(payslips__gt=0).order_by('id').first()
+        )
+        if employee is None:
+            raise CommandError('No approved employee with payroll records found; run seed_data first.')
+
+        results = {}
+        # Everything runs inside a transaction that is rolled back, so clock-ins,
+        # queued jobs and the benchmark admin never reach the database
+        with transaction.atomic():
+            admin = User.objects.create_superuser('benchmark.admin', 'benchmark@example.com', None)
+            admin_client = Client()
+            admin_client.force_login(admin)
+            employee_client = Client()
+            employee_client.force_login(employee)
+            clients = {'admin': admin_client, 'employee': employee_client}
+
+            for name, role, request, setup in self.scenarios(employee):
+                if options['only'] and name not in options['only']:
+                    continue
+                self.stdout.write(f'Running {name}...')
+                results[name] = self.measure(clients[role], request, setup, options['iterations'], options['warmup'])
+            transaction.set_rollback(True)
+
+        report = {
+            'meta': {
+                'timestamp': timezone.now().isoformat(),
+                'django': django.get_version(),
+                'database': connection.vendor,
+                'iterations': options['iterations'],
+                'employees': User.objects.filter(role='EMPLOYEE').count(),
+                'attendance_rows': Attendance.objects.count(),
+                'leave_rows': Leave.objects.count(),
+                'payroll_rows': Payroll.objects.count(),
+            },
+            'scenarios': results,
+        }
+        self.print_report(results)
+
+        output_dir = os.path.dirname(options['output'])
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        with open(options['output'], 'w') as handle:
+            json.dump(report, handle, indent=2)
+        self.stdout.write(f"Results written to {options['output']}")
+
+        if options['baseline']:
+            regressions = self.compare(options['baseline'], results, options['threshold'])
+            if regressions and options['fail_on_regression']:
+                raise CommandError(f'{regressions} scenario(s) regressed beyond {options["threshold"]}%')
+
+    def scenarios(self, employee):
+        """
+        Yield (name, client role, request, setup). request takes a client and
+        returns the response; setup, if any, runs untimed before each request.
+        """
+        today = timezone.localdate()
+        month_ago = (today - timedelta(days=30)).isoformat()
+        payslip = Payroll.objects.filter(employee=employee).order_by('-pay_period_end').first()
+        admin = 'admin'
+        staff = 'employee'
+
+        def get(url):
+            return lambda client: client.get(url)
+
+        def reset_clock_in():
+            # Start every iteration from "not clocked in yet" so the insert path is measured
+            Attendance.objects.filter(employee=employee, date=today).delete()
+
+        def payslip_pdf(client):
+            response = client.get(reverse('payslip_pdf', args=[payslip.pk]))
+            job = Job.objects.get(pk=response.url.rstrip('/').split('/')[-1])
+            # The worker's render time counts towards the scenario too
+            run_job(job)
+            return response
+
+        yield 'admin_dashboard', admin, get(reverse('admin_dashboard')), None
+        yield 'employee_dashboard', staff, get(reverse('employee_dashboard')), None
+        yield 'admin_employee_list', admin, get(reverse('admin_view_employees') + '?page=2'), None
+        yield 'admin_leaves_filtered', admin, get(reverse('admin_manage_leaves') + f'?status=PENDING&employee=a&start_date={month_ago}'), None
+        yield 'admin_payroll_filtered', admin, get(reverse('admin_manage_payroll') + f'?status=PAID&start_date={month_ago}'), None
+        yield 'admin_attendance_filtered', admin, get(reverse('admin_manage_attendance') + f'?start_date={month_ago}&end_date={today.isoformat()}'), None
+        yield 'employee_attendance', staff, get(reverse('employee_attendance')), None
+        yield 'leave_history', staff, get(reverse('leave_history')), None
+        yield 'employee_payslips', staff, get(reverse('employee_payslips')), None
+        yield 'employee_announcements', staff, get(reverse('employee_view_announcements')), None
+        yield 'clock_in', staff, get(reverse('clock_in')), reset_clock_in
+        yield 'payslip_pdf', staff, payslip_pdf, None
+
+    def measure(self, client, request, setup, iterations, warmup):
+        for _ in range(warmup):
+            if setup:
+                setup()
+            request(client)
+
+        latencies = []
+        queries = []
+        for _ in range(iterations):
+            if setup:
+                setup()
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                response = request(client)
+                elapsed = time.perf_counter() - started
+            if response.status_code >= 400:
+                raise CommandError(f'Request failed with status {response.status_code}')
+            latencies.append(elapsed * 1000)
+            queries.append(len(captured))
+
+        latencies.sort()
+        return {
+            'p50_ms': round(self.percentile(latencies, 50), 3),
+            'p95_ms': round(self.percentile(latencies, 95), 3),
+            'p99_ms': round(self.percentile(latencies, 99), 3),
+            'mean_ms': round(statistics.mean(latencies), 3),
+            'min_ms': round(latencies[0], 3),
+            'max_ms': round(latencies[-1], 3),
+            'queries': max(queries),
+        }
+
+    def compare(self, baseline_path, results, threshold):
+        with open(baseline_path) as handle:
+            baseline = json.load(handle)['scenarios']
+
+        self.stdout.write(f'\nComparison with {baseline_path}:')
+        regressions = 0
+        for name, current in results.items():
+            previous = baseline.get(name)
+            if previous is None:
+                self.stdout.write(f'  {name:28} (new scenario)')
+                continue
+            p95_change = (current['p95_ms'] - previous['p95_ms']) / previous['p95_ms'] * 100 if previous['p95_ms'] else 0.0
+            query_change = (current['queries'] - previous['queries']) / previous['queries'] * 100 if previous['queries'] else 0.0
+            line = (
+                f"  {name:28} p95 {previous['p95_ms']:8.1f} -> {current['p95_ms']:8.1f} ms ({p95_change:+.0f}%)  "
+                f"queries {previous['queries']} -> {current['queries']}"
+            )
+            if p95_change > threshold or query_change > threshold:
+                regressions += 1
+                self.stdout.write(self.style.ERROR(line + '  REGRESSION'))
+            else:
+                self.stdout.write(line)
+        return regressions
+
+    def print_report(self, results):
+        header = f"{'Scenario':28} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'Queries':>8}"
+        self.stdout.write('\n' + header)
+        self.stdout.write('-' * len(header))
+        for name, row in results.items():
+            self.stdout.write(f"{name:28} {row['p50_ms']:>9.1f} {row['p95_ms']:>9.1f} {row['p99_ms']:>9.1f} {row['queries']:>8}")
+
+    @staticmethod
+    def percentile(values, pct):
+        index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+        return values[index]
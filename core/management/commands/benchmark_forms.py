@@ -0,0 +1,70 @@
+from django.core.management.base import BaseCommand, CommandError
+import time
+
+from core.forms import (
+    AnnouncementForm, AttendanceForm, PayrollForm, LeaveForm, DepartmentForm,
+    EmployeeSignUpForm, EmployeeUpdateForm, INPUT_CLASS, STYLED_WIDGETS,
+)
+
+FORMS = {
+    'announcement': AnnouncementForm,
+    'attendance': AttendanceForm,
+    'payroll': PayrollForm,
+    'leave': LeaveForm,
+    'department': DepartmentForm,
+    'signup': EmployeeSignUpForm,
+    'employee_update': EmployeeUpdateForm,
+}
+
+
+def style_per_instance(form):
+    """The styling loop every form used to run in __init__, kept for comparison."""
+    common_attrs = {'class': INPUT_CLASS}
+    for field_name, field in form.fields.items():
+        if isinstance(field.widget, STYLED_WIDGETS):
+            field.widget.attrs.update(common_attrs)
+
+
+class Command(BaseCommand):
+    help = (
+        'Instantiate and render every core form many times and report the cost per form, next to '
+        'the cost of the per-instance widget styling loop that the forms no longer run.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=10000, help='Instances per form (default: 10000)')
+        parser.add_argument('--only', nargs='+', choices=sorted(FORMS), help='Benchmark only these forms')
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        if iterations < 1:
+            raise CommandError('--iterations must be at least 1')
+
+        self.stdout.write(f"{'form':<16} {'init µs':>9} {'render µs':>10} {'old loop µs':>12} {'saved':>7}")
+        for name, form_class in FORMS.items():
+            if options['only'] and name not in options['only']:
+                continue
+            # Warm up caches (department choices, templates) outside the timings
+            form_class().as_p()
+
+            started = time.perf_counter()
+            for _ in range(iterations):
+                form_class()
+            init = (time.perf_counter() - started) / iterations
+
+            started = time.perf_counter()
+            for _ in range(iterations):
+                form_class().as_p()
+            render = (time.perf_counter() - started) / iterations - init
+
+            instances = [form_class() for _ in range(iterations)]
+            started = time.perf_counter()
+            for form in instances:
+                style_per_instance(form)
+            old_loop = (time.perf_counter() - started) / iterations
+
+            saved = old_loop / (init + render + old_loop) * 100
+            self.stdout.write(
+                f"{name:<16} {init * 1e6:>9.1f} {render * 1e6:>10.1f} {old_loop * 1e6:>12.1f} {saved:>6.1f}%"
+            )
+        self.stdout.write('"saved" is the share of instantiate + render time the per-instance loop used to cost.')
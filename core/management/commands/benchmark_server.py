@@ -0,0 +1,197 @@
+from concurrent.futures import ThreadPoolExecutor
+import http.client
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+
+from core.loadtest import free_port, login_cookie, percentile, prepare_users, wait_until_healthy
+
+# (scenario, URL name, who requests it, weight) for the mixed load: mostly
+# cheap employee requests, with heavier admin list and report pages mixed in
+MIX = [
+    ('attendance_api', 'attendance_api', 'employee', 40),
+    ('employee_dashboard', 'employee_dashboard', 'employee', 25),
+    ('employee_attendance', 'employee_attendance', 'employee', 10),
+    ('admin_attendance', 'admin_manage_attendance', 'admin', 10),
+    ('admin_employees', 'admin_view_employees', 'admin', 10),
+    ('admin_reports', 'admin_reports', 'admin', 5),
+]
+
+
+def process_tree(pid):
+    """pid and every descendant of it (Linux /proc only)."""
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as handle:
+                # The command name may contain spaces; the parent pid follows its closing paren
+                parent = int(handle.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(parent, []).append(int(entry))
+    tree, pending = [], [pid]
+    while pending:
+        current = pending.pop()
+        tree.append(current)
+        pending.extend(children.get(current, []))
+    return tree
+
+
+def memory_kb(pid):
+    """(RSS, PSS) in kB for one process. PSS splits shared pages between their users."""
+    values = {}
+    for path, keys in ((f'/proc/{pid}/status', ('VmRSS',)), (f'/proc/{pid}/smaps_rollup', ('Pss',))):
+        try:
+            with open(path) as handle:
+                for line in handle:
+                    key = line.split(':', 1)[0]
+                    if key in keys:
+                        values[key] = int(line.split()[1])
+        except OSError:
+            pass
+    return values.get('VmRSS', 0), values.get('Pss', 0)
+
+
+class Command(BaseCommand):
+    help = (
+        'Start gunicorn with each profile from gunicorn.conf.py, drive the same mixed request load '
+        'through it and compare throughput, latency and memory (Linux for the memory figures).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profiles', nargs='+', default=['mixed', 'io', 'cpu'], help='GUNICORN_PROFILE values to compare')
+        parser.add_argument('--requests', type=int, default=2000, help='Requests per profile (default: 2000)')
+        parser.add_argument('--concurrency', type=int, default=32, help='Concurrent client threads (default: 32)')
+        parser.add_argument('--users', type=int, default=20, help='Load-test employees to spread requests over')
+        parser.add_argument('--port', type=int, default=0, help='Port for the server (default: a free one)')
+        parser.add_argument('--app', default='ems.wsgi:application', help='Application gunicorn serves')
+        parser.add_argument('--seed', type=int, default=42, help='Seed for the request mix order')
+
+    def handle(self, *args, **options):
+        if options['requests'] < 1 or options['concurrency'] < 1:
+            raise CommandError('--requests and --concurrency must be at least 1')
+
+        employees, created = prepare_users([f'loadtest.{i}' for i in range(options['users'])], role='EMPLOYEE')
+        admins, _ = prepare_users(['loadtest.admin'], role='ADMIN')
+        if created:
+            self.stdout.write(f'  Created {created} load-test employees')
+        cookies = {
+            'employee': [login_cookie(user) for user in employees],
+            'admin': [login_cookie(user) for user in admins],
+        }
+
+        rng = random.Random(options['seed'])
+        weights = [weight for *_, weight in MIX]
+        plan = [
+            (scenario, reverse(url_name), rng.choice(cookies[who]))
+            for scenario, url_name, who, _ in rng.choices(MIX, weights=weights, k=options['requests'])
+        ]
+
+        results = []
+        for profile in options['profiles']:
+            port = options['port'] or free_port()
+            self.stdout.write(f'Profile {profile}: starting gunicorn on port {port}...')
+            server = self.start_server(options['app'], profile, port)
+            try:
+                results.append((profile, self.run_load(port, plan, options['concurrency'], server.pid)))
+            finally:
+                server.terminate()
+                try:
+                    server.wait(timeout=30)
+                except subprocess.TimeoutExpired:
+                    server.kill()
+
+        self.report(results)
+
+    def start_server(self, app, profile, port):
+        config = os.path.join(settings.BASE_DIR, 'gunicorn.conf.py')
+        # The run measures throughput, not cross-worker cache invalidation
+        env = {**os.environ, 'GUNICORN_PROFILE': profile, 'PORT': str(port), 'PROFILING': 'False', 'ALLOW_LOCAL_CACHE': '1'}
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', app, '-c', config, '--bind', f'127.0.0.1:{port}'],
+            env=env, cwd=settings.BASE_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        if wait_until_healthy(server, port):
+            return server
+        server.kill()
+        raise CommandError(f'gunicorn did not become healthy within 60s for profile {profile}')
+
+    def run_load(self, port, plan, concurrency, server_pid):
+        peak = {'rss': 0, 'pss': 0, 'processes': 0}
+        stop = threading.Event()
+
+        def sample_memory():
+            while not stop.is_set():
+                if os.path.isdir('/proc'):
+                    pids = process_tree(server_pid)
+                    usage = [memory_kb(pid) for pid in pids]
+                    peak['rss'] = max(peak['rss'], sum(rss for rss, _ in usage))
+                    peak['pss'] = max(peak['pss'], sum(pss for _, pss in usage))
+                    peak['processes'] = max(peak['processes'], len(pids))
+                stop.wait(0.25)
+
+        local = threading.local()
+
+        def fetch(item):
+            scenario, path, cookie = item
+            # One keep-alive connection per client thread, like a browser
+            if getattr(local, 'conn', None) is None:
+                local.conn = http.client.HTTPConnection('127.0.0.1', port, timeout=120)
+            started = time.perf_counter()
+            try:
+                local.conn.request('GET', path, headers={'Cookie': cookie})
+                response = local.conn.getresponse()
+                response.read()
+                status = response.status
+            except (OSError, http.client.HTTPException):
+                local.conn.close()
+                local.conn = None
+                status = None
+            return scenario, status, time.perf_counter() - started
+
+        sampler = threading.Thread(target=sample_memory, daemon=True)
+        sampler.start()
+        wall_start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            responses = list(pool.map(fetch, plan))
+        wall = time.perf_counter() - wall_start
+        stop.set()
+        sampler.join()
+
+        latencies = {}
+        for scenario, _, latency in responses:
+            latencies.setdefault(scenario, []).append(latency)
+        return {
+            'throughput': len(plan) / wall,
+            'failures': sum(1 for _, status, _ in responses if status is None or status >= 500),
+            'p95': {scenario: percentile(sorted(values), 95) * 1000 for scenario, values in latencies.items()},
+            'all_p95': percentile(sorted(latency for _, _, latency in responses), 95) * 1000,
+            **peak,
+        }
+
+    def report(self, results):
+        self.stdout.write('')
+        self.stdout.write(f"{'Profile':<10} {'req/s':>8} {'p95 ms':>8} {'procs':>6} {'RSS MB':>8} {'PSS MB':>8} {'failed':>7}")
+        for profile, result in results:
+            self.stdout.write(
+                f"{profile:<10} {result['throughput']:>8.1f} {result['all_p95']:>8.1f} {result['processes']:>6} "
+                f"{result['rss'] / 1024:>8.1f} {result['pss'] / 1024:>8.1f} {result['failures']:>7}"
+            )
+        self.stdout.write('')
+        self.stdout.write('p95 latency (ms) per scenario:')
+        scenarios = [scenario for scenario, *_ in MIX]
+        self.stdout.write(f"{'Profile':<10} " + ' '.join(f'{scenario[:18]:>18}' for scenario in scenarios))
+        for profile, result in results:
+            self.stdout.write(
+                f'{profile:<10} ' + ' '.join(f"{result['p95'].get(scenario, 0):>18.1f}" for scenario in scenarios)
+            )
+        self.stdout.write(self.style.SUCCESS('Server benchmark finished!'))
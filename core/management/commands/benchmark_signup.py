@@ -0,0 +1,75 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+import statistics
+import time
+
+from core.hashers import HASH_PROFILES
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        'Post signups through the real signup view once per password hasher profile and report '
+        'signups/sec, latency and queries per signup for a single worker. Nothing is kept: every '
+        'profile runs inside a transaction that is rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--signups', type=int, default=20, help='Signups per profile (default: 20)')
+        parser.add_argument(
+            '--profiles',
+            nargs='+',
+            choices=sorted(HASH_PROFILES),
+            default=['strong', 'balanced', 'fast'],
+            help='Hasher profiles to compare (default: strong balanced fast)',
+        )
+
+    def handle(self, *args, **options):
+        if options['signups'] < 1:
+            raise CommandError('--signups must be at least 1')
+
+        self.stdout.write(f"{'profile':<10} {'iterations':>10} {'signups/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'queries':>8}")
+        for profile in options['profiles']:
+            with override_settings(PASSWORD_HASH_PROFILE=profile, PASSWORD_HASH_ITERATIONS=0):
+                result = self.measure(profile, options['signups'])
+            self.stdout.write(
+                f"{profile:<10} {HASH_PROFILES[profile]:>10} {result['rate']:>10.1f} "
+                f"{result['p50']:>9.1f} {result['p95']:>9.1f} {result['queries']:>8.1f}"
+            )
+
+    def measure(self, profile, signups):
+        client = Client()
+        url = reverse('signup')
+        latencies = []
+        queries = 0
+        with transaction.atomic():
+            for i in range(signups):
+                data = {
+                    'username': f'bench.{profile}.{i}',
+                    'email': f'bench.{profile}.{i}@example.com',
+                    'first_name': 'Bench',
+                    'last_name': 'Signup',
+                    'password1': 'benchmark-password',
+                    'password2': 'benchmark-password',
+                }
+                with CaptureQueriesContext(connection) as captured:
+                    started = time.perf_counter()
+                    response = client.post(url, data)
+                    latencies.append(time.perf_counter() - started)
+                if response.status_code != 302:
+                    raise CommandError(f'Signup {i} for profile {profile} failed with status {response.status_code}')
+                queries += len(captured)
+            transaction.set_rollback(True)
+
+        latencies.sort()
+        return {
+            'rate': len(latencies) / sum(latencies),
+            'p50': statistics.median(latencies) * 1000,
+            'p95': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000,
+            'queries': queries / signups,
+        }
@@ -0,0 +1,101 @@
+from statistics import median
+import os
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.loadtest import free_port, wait_until_healthy
+
+# What start.sh used to run on every container start, one Django boot each
+LEGACY_STEPS = [
+    ['migrate'],
+    ['partition_attendance'],
+    ['collectstatic', '--noinput'],
+    ['shell', '-c', "from django.contrib.auth import get_user_model; get_user_model().objects.filter(username='admin').exists()"],
+]
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure cold-start time: one Django boot, the old per-start steps of start.sh, the one-shot '
+        '`release` command, and gunicorn from launch until /health/ answers.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=3, help='Repetitions per measurement (default: 3)')
+        parser.add_argument('--app', default='ems.wsgi:application', help='Application gunicorn serves')
+        parser.add_argument(
+            '--skip-legacy',
+            action='store_true',
+            help='Skip the old start.sh steps (they run migrate and collectstatic against this environment)',
+        )
+
+    def handle(self, *args, **options):
+        if options['runs'] < 1:
+            raise CommandError('--runs must be at least 1')
+
+        measurements = [
+            ('Django boot (manage.py check)', lambda: self.manage('check')),
+            ('release (once per deploy)', lambda: self.manage('release')),
+            ('gunicorn ready', lambda: self.web_ready(options['app'])),
+        ]
+        if not options['skip_legacy']:
+            measurements.insert(1, ('old start.sh steps', self.legacy_steps))
+
+        results = []
+        for label, measure in measurements:
+            self.stdout.write(f'Measuring {label}...')
+            timings = [measure() for _ in range(options['runs'])]
+            results.append((label, timings))
+
+        self.stdout.write('')
+        self.stdout.write(f"{'Step':<32} {'median s':>9} {'min s':>8} {'max s':>8}")
+        for label, timings in results:
+            self.stdout.write(f'{label:<32} {median(timings):>9.2f} {min(timings):>8.2f} {max(timings):>8.2f}')
+
+        by_label = {label: median(timings) for label, timings in results}
+        if 'old start.sh steps' in by_label:
+            before = by_label['old start.sh steps'] + by_label['gunicorn ready']
+            self.stdout.write(
+                f"\nContainer start to first healthy response: {before:.2f}s before, "
+                f"{by_label['gunicorn ready']:.2f}s now"
+            )
+        self.stdout.write(self.style.SUCCESS('Startup benchmark finished!'))
+
+    def manage(self, *args):
+        started = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, 'manage.py', *args],
+            cwd=settings.BASE_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+        )
+        if completed.returncode:
+            raise CommandError(f"manage.py {' '.join(args)} failed:\n{completed.stderr}")
+        return time.perf_counter() - started
+
+    def legacy_steps(self):
+        return sum(self.manage(*step) for step in LEGACY_STEPS)
+
+    def web_ready(self, app):
+        port = free_port()
+        config = os.path.join(settings.BASE_DIR, 'gunicorn.conf.py')
+        # Time the profile's full worker count, as benchmark_server does,
+        # whether or not a shared cache is configured here
+        env = {**os.environ, 'PORT': str(port), 'PROFILING': 'False', 'ALLOW_LOCAL_CACHE': '1'}
+        started = time.perf_counter()
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', app, '-c', config, '--bind', f'127.0.0.1:{port}'],
+            env=env, cwd=settings.BASE_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            if not wait_until_healthy(server, port):
+                raise CommandError('gunicorn did not become healthy within 60s')
+            return time.perf_counter() - started
+        finally:
+            server.terminate()
+            try:
+                server.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                server.kill()
@@ -1,11 +1,33 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth import get_user_model
-from core.models import Department, Leave, Attendance, Announcement, Payroll
+from django.db import connection, models, transaction
+from django.db.models import Max, Min
+import time
+
+from core.models import Department, Leave, Attendance, Announcement, Payroll, ArchivedAttendance, ArchivedPayroll
+from core.choices import invalidate_choices
+from core.salary_stats import invalidate_salary_statistics
+from core.announcements import invalidate_unread_counts
+from core.rollups import rebuild_rollups
 
 User = get_user_model()
 
+# Tables that are always emptied completely, children before parents
+DATA_MODELS = [
+    (Payroll, 'payroll records'),
+    (Attendance, 'attendance records'),
+    (Leave, 'leave records'),
+    (Announcement, 'announcements'),
+    (ArchivedPayroll, 'archived payroll records'),
+    (ArchivedAttendance, 'archived attendance records'),
+]
+
+
 class Command(BaseCommand):
-    help = 'Clear all seeded data from the database'
+    help = (
+        'Clear all seeded data from the database. Rows are deleted in primary-key ranges, one '
+        'transaction per chunk, without loading them into memory.'
+    )
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -13,44 +35,106 @@ class Command(BaseCommand):
             action='store_true',
             help='Keep admin users when clearing data',
         )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=10000,
+            help='Primary-key range deleted per transaction (default: 10000)',
+        )
+        parser.add_argument(
+            '--truncate',
+            action='store_true',
+            help='PostgreSQL only: empty the payroll, attendance, leave, announcement and archive tables with TRUNCATE ... CASCADE',
+        )
 
     def handle(self, *args, **options):
+        self.chunk_size = options['chunk_size']
+        if self.chunk_size < 1:
+            raise CommandError('--chunk-size must be at least 1')
+        if options['truncate'] and connection.vendor != 'postgresql':
+            raise CommandError('--truncate is only supported on PostgreSQL')
+
         self.stdout.write('Starting to clear database...')
-        
-        # Clear payroll records
-        payroll_count = Payroll.objects.count()
-        Payroll.objects.all().delete()
-        self.stdout.write(f'  Deleted {payroll_count} payroll records')
-        
-        # Clear attendance records
-        attendance_count = Attendance.objects.count()
-        Attendance.objects.all().delete()
-        self.stdout.write(f'  Deleted {attendance_count} attendance records')
-        
-        # Clear leave records
-        leave_count = Leave.objects.count()
-        Leave.objects.all().delete()
-        self.stdout.write(f'  Deleted {leave_count} leave records')
-        
-        # Clear announcements
-        announcement_count = Announcement.objects.count()
-        Announcement.objects.all().delete()
-        self.stdout.write(f'  Deleted {announcement_count} announcements')
-        
+
+        if options['truncate']:
+            self.truncate(DATA_MODELS)
+        else:
+            for model, label in DATA_MODELS:
+                self.purge(model._base_manager.all(), label)
+
         # Clear employees (but keep admin users if requested)
         if options['keep_admin']:
-            employee_count = User.objects.filter(role='EMPLOYEE').count()
-            User.objects.filter(role='EMPLOYEE').delete()
-            self.stdout.write(f'  Deleted {employee_count} employee users (kept admin users)')
+            self.purge(User._base_manager.filter(role='EMPLOYEE'), 'employee users (kept admin users)')
         else:
             # Clear all non-superuser users
-            user_count = User.objects.filter(is_superuser=False).count()
-            User.objects.filter(is_superuser=False).delete()
-            self.stdout.write(f'  Deleted {user_count} non-admin users')
-        
-        # Clear departments
-        department_count = Department.objects.count()
-        Department.objects.all().delete()
-        self.stdout.write(f'  Deleted {department_count} departments')
-        
+            self.purge(User._base_manager.filter(is_superuser=False), 'non-admin users')
+
+        self.purge(Department._base_manager.all(), 'departments')
+
+        # The raw deletes skip the model signals that normally invalidate these caches
+        invalidate_choices('departments')
+        invalidate_choices('employees')
+        invalidate_salary_statistics()
+        invalidate_unread_counts()
+        rebuild_rollups()
+
         self.stdout.write(self.style.SUCCESS('Successfully cleared database!'))
+
+    def truncate(self, entries):
+        tables = ', '.join(connection.ops.quote_name(model._meta.db_table) for model, _ in entries)
+        started = time.perf_counter()
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f'TRUNCATE {tables} CASCADE')
+        labels = ', '.join(label for _, label in entries)
+        self.stdout.write(f'  Truncated {labels} in {time.perf_counter() - started:.2f}s')
+
+    def purge(self, queryset, label, indent='  ', report_empty=True):
+        """
+        Delete every row of queryset in primary-key ranges of --chunk-size.
+
+        Rows that reference these ones are handled first, following each
+        foreign key's on_delete, so each chunk can then be removed with a
+        plain DELETE instead of Django's collector, which would load the rows
+        and their relations into memory.
+        """
+        self.clear_dependents(queryset, indent + '  ')
+
+        bounds = queryset.aggregate(low=Min('pk'), high=Max('pk'))
+        deleted = 0
+        started = time.perf_counter()
+        if bounds['low'] is not None:
+            span = bounds['high'] - bounds['low'] + 1
+            for start in range(bounds['low'], bounds['high'] + 1, self.chunk_size):
+                with transaction.atomic():
+                    chunk = queryset.filter(pk__gte=start, pk__lt=start + self.chunk_size)
+                    deleted += chunk._raw_delete(chunk.db)
+                done = min(start + self.chunk_size - bounds['low'], span)
+                self.stdout.write(f'{indent}Deleting {label}: {deleted:,} rows ({done * 100 // span}%)', ending='\r')
+                self.stdout.flush()
+
+        if not deleted and not report_empty:
+            return deleted
+        elapsed = time.perf_counter() - started
+        rate = deleted / elapsed if elapsed > 0 else 0
+        self.stdout.write(f'{indent}Deleted {deleted:,} {label} in {elapsed:.2f}s ({rate:,.0f} rows/sec)' + ' ' * 10)
+        return deleted
+
+    def clear_dependents(self, queryset, indent):
+        """Apply on_delete for every foreign key (including M2M through tables) pointing at queryset's rows."""
+        model = queryset.model
+        for relation in model._meta.get_fields(include_hidden=True):
+            if not (relation.auto_created and not relation.concrete and (relation.one_to_many or relation.one_to_one)):
+                continue
+            on_delete = relation.on_delete
+            if on_delete is models.DO_NOTHING:
+                continue
+            related = relation.related_model._base_manager.filter(**{f'{relation.field.name}__in': queryset})
+            if on_delete is models.CASCADE:
+                self.purge(related, f'{relation.related_model._meta.verbose_name_plural} of deleted {model._meta.verbose_name_plural}', indent, report_empty=False)
+            elif on_delete is models.SET_NULL:
+                related.update(**{relation.field.name: None})
+            else:
+                raise CommandError(
+                    f'{relation.related_model.__name__}.{relation.field.name} uses {on_delete.__name__}; '
+                    f'remove those rows before clearing {model._meta.verbose_name_plural}'
+                )
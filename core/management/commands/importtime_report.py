@@ -0,0 +1,103 @@
+import json
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Libraries that must only be imported by the code paths that use them,
+# never while a web worker boots
+HEAVY_MODULES = ['xhtml2pdf', 'reportlab', 'PIL', 'html5lib', 'pypdf', 'arabic_reshaper', 'svglib']
+
+# Run in a fresh interpreter under -X importtime: boot the WSGI app the way a
+# gunicorn worker does, load the URLconf, then import any extra modules
+BOOT_SCRIPT = '''
+import json, os, resource, sys, time
+started = time.perf_counter()
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ems.settings')
+from django.core.wsgi import get_wsgi_application
+get_wsgi_application()
+from django.urls import get_resolver
+get_resolver().url_patterns
+booted = time.perf_counter()
+for name in sys.argv[1:]:
+    __import__(name)
+print(json.dumps({
+    'boot_s': booted - started,
+    'total_s': time.perf_counter() - started,
+    'maxrss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    'modules': sorted(sys.modules),
+}))
+'''
+
+
+def parse_importtime(stderr):
+    """[(module, self microseconds, cumulative microseconds, depth), ...] from -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+class Command(BaseCommand):
+    help = (
+        'Profile what a web worker imports while it boots (python -X importtime): the slowest modules, '
+        'time per top-level package, boot time and peak RSS. --check fails if a heavy library is loaded.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=20, help='Modules to list (default: 20)')
+        parser.add_argument(
+            '--module',
+            action='append',
+            default=[],
+            help='Also import this module after booting, e.g. --module xhtml2pdf.pisa to see what a top-level import would cost',
+        )
+        parser.add_argument('--check', action='store_true', help=f"Fail if any of {', '.join(HEAVY_MODULES)} is imported at boot")
+
+    def handle(self, *args, **options):
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', BOOT_SCRIPT, *options['module']],
+            cwd=settings.BASE_DIR, capture_output=True, text=True,
+        )
+        if completed.returncode:
+            raise CommandError(f'Booting the app failed:\n{completed.stderr[-2000:]}')
+        # settings.py prints the database in use, so the JSON is the last line
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        rows = parse_importtime(completed.stderr)
+        top = options['top']
+
+        self.stdout.write(
+            f"Boot (WSGI app + URLconf): {result['boot_s'] * 1000:.0f}ms, "
+            f"{len(rows)} modules, peak RSS {result['maxrss_kb'] / 1024:.1f} MB"
+        )
+        if options['module']:
+            self.stdout.write(f"Including {', '.join(options['module'])}: {result['total_s'] * 1000:.0f}ms")
+
+        self.stdout.write('\nSlowest modules by cumulative time (ms):')
+        for name, self_us, cumulative_us, depth in sorted(rows, key=lambda row: -row[2])[:top]:
+            self.stdout.write(f"  {cumulative_us / 1000:>8.1f} {self_us / 1000:>8.1f} self  {'  ' * min(depth, 6)}{name}")
+
+        packages = {}
+        for name, self_us, _, _ in rows:
+            package = name.split('.')[0]
+            packages[package] = packages.get(package, 0) + self_us
+        self.stdout.write('\nTime per top-level package (ms, self time summed):')
+        for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+            self.stdout.write(f'  {self_us / 1000:>8.1f}  {package}')
+
+        loaded = sorted({name.split('.')[0] for name in result['modules']} & set(HEAVY_MODULES))
+        if options['module']:
+            # Requested explicitly, so only report them
+            self.stdout.write(f"\nHeavy libraries loaded: {', '.join(loaded) or 'none'}")
+        elif loaded:
+            message = f"Heavy libraries imported at boot: {', '.join(loaded)}. Import them inside the code that needs them."
+            if options['check']:
+                raise CommandError(message)
+            self.stdout.write(self.style.WARNING(message))
+        else:
+            self.stdout.write(self.style.SUCCESS('\nNo heavy libraries imported at boot.'))
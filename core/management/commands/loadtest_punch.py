@@ -0,0 +1,92 @@
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+import http.client
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+from django.utils import timezone
+
+from core.loadtest import login_cookie, percentile, prepare_users
+from core.models import Attendance
+
+
+class Command(BaseCommand):
+    help = (
+        'Fire concurrent clock-in/clock-out requests at a running server and report throughput. '
+        'Run it once against the WSGI deployment and once against SERVER_MODE=asgi on the same '
+        'hardware to compare.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://127.0.0.1:8000', help='Base URL of the running server')
+        parser.add_argument('--users', type=int, default=50, help='Number of load-test employees to punch with')
+        parser.add_argument('--requests', type=int, default=2000, help='Total number of punch requests to send')
+        parser.add_argument('--concurrency', type=int, default=50, help='Number of concurrent client threads')
+        parser.add_argument(
+            '--endpoint',
+            choices=['clock_in', 'clock_out', 'attendance_api'],
+            default='clock_in',
+            help='Which punch endpoint to hit',
+        )
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help="Delete today's attendance for the load-test employees before the run",
+        )
+
+    def handle(self, *args, **options):
+        target = urlsplit(options['url'])
+        if target.scheme not in ('http', 'https'):
+            raise CommandError('--url must be an http:// or https:// URL')
+
+        users = self.prepare_users(options['users'])
+        if options['reset']:
+            deleted, _ = Attendance.objects.filter(employee__in=users, date=timezone.localdate()).delete()
+            self.stdout.write(f"  Reset {deleted} attendance records for today")
+        cookies = [login_cookie(user) for user in users]
+
+        path = reverse(options['endpoint'])
+        total = options['requests']
+        self.stdout.write(
+            f"Sending {total} requests to {target.geturl().rstrip('/')}{path} "
+            f"with {options['concurrency']} concurrent clients..."
+        )
+
+        def punch(i):
+            cookie = cookies[i % len(cookies)]
+            conn_class = http.client.HTTPSConnection if target.scheme == 'https' else http.client.HTTPConnection
+            conn = conn_class(target.hostname, target.port, timeout=60)
+            started = time.perf_counter()
+            try:
+                conn.request('GET', path, headers={'Cookie': cookie, 'Host': target.netloc})
+                status = conn.getresponse().status
+            except OSError:
+                status = None
+            finally:
+                conn.close()
+            return status, time.perf_counter() - started
+
+        wall_start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as pool:
+            results = list(pool.map(punch, range(total)))
+        wall = time.perf_counter() - wall_start
+
+        latencies = sorted(latency for _, latency in results)
+        failures = sum(1 for status, _ in results if status is None or status >= 500)
+        self.stdout.write(f"  Throughput: {total / wall:.1f} req/s over {wall:.2f}s")
+        self.stdout.write(
+            f"  Latency: p50={percentile(latencies, 50) * 1000:.1f}ms "
+            f"p95={percentile(latencies, 95) * 1000:.1f}ms "
+            f"p99={percentile(latencies, 99) * 1000:.1f}ms"
+        )
+        if failures:
+            self.stdout.write(self.style.WARNING(f"  {failures} requests failed"))
+        self.stdout.write(self.style.SUCCESS('Load test finished!'))
+
+    def prepare_users(self, count):
+        """Get or create the approved employees used by the load test."""
+        users, created = prepare_users([f'loadtest.{i}' for i in range(count)], role='EMPLOYEE')
+        if created:
+            self.stdout.write(f"  Created {created} load-test employees")
+        return users
@@ -0,0 +1,53 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from datetime import date
+
+from core import partitions
+
+
+class Command(BaseCommand):
+    help = (
+        'Create upcoming monthly partitions of the attendance table on PostgreSQL. '
+        'Run it daily or on every deploy; it only creates partitions that are missing.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=getattr(settings, 'ATTENDANCE_PARTITION_MONTHS_AHEAD', 3),
+            help='Create partitions up to this many months after the current one',
+        )
+        parser.add_argument(
+            '--convert',
+            action='store_true',
+            help='Convert the plain attendance table to a partitioned one first (locks the table while copying)',
+        )
+        parser.add_argument('--list', action='store_true', help='List partitions with their estimated row counts')
+
+    def handle(self, *args, **options):
+        if options['months_ahead'] < 0:
+            raise CommandError('--months-ahead cannot be negative')
+        if not partitions.is_supported(connection):
+            self.stdout.write(f'Attendance partitioning needs PostgreSQL; the {connection.vendor} table stays unpartitioned.')
+            return
+
+        with transaction.atomic():
+            if not partitions.is_partitioned(connection):
+                if not options['convert']:
+                    self.stdout.write('core_attendance is not partitioned. Run with --convert (or set ATTENDANCE_PARTITIONING=True before migrating).')
+                    return
+                self.stdout.write('Converting core_attendance to monthly partitions...')
+                partitions.partition_table(connection, options['months_ahead'])
+
+            today = date.today()
+            created = partitions.ensure_partitions(today, partitions.add_months(today, options['months_ahead']), connection)
+
+        for name in created:
+            self.stdout.write(f'  Created {name}')
+        self.stdout.write(self.style.SUCCESS(f'{len(created)} partition(s) created.'))
+
+        if options['list']:
+            for name, bounds, rows in partitions.list_partitions(connection):
+                self.stdout.write(f'  {name:<32} {bounds:<60} ~{max(rows, 0):,} rows')
@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+from django.conf import settings
+import json
+
+from core.profiling import load_snapshots, merge_snapshots
+
+
+class Command(BaseCommand):
+    help = 'Print the hottest views recorded by ProfilingMiddleware across all worker processes'
+
+    SORT_KEYS = {
+        'total': 'total_ms',
+        'avg': 'avg_ms',
+        'p95': 'p95_ms',
+        'queries': 'avg_queries',
+        'sql': 'sql_ms',
+        'count': 'count',
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=20, help='Number of views to show')
+        parser.add_argument(
+            '--sort',
+            choices=sorted(self.SORT_KEYS),
+            default='total',
+            help='Column to rank views by (default: total time spent)',
+        )
+        parser.add_argument('--json', action='store_true', help='Output the report as JSON')
+
+    def handle(self, *args, **options):
+        # The command runs in its own process, so only the dumped snapshots count
+        rows = merge_snapshots(load_snapshots(include_live=False))
+        rows.sort(key=lambda row: row[self.SORT_KEYS[options['sort']]], reverse=True)
+        rows = rows[:options['limit']]
+
+        if options['json']:
+            self.stdout.write(json.dumps(rows, indent=2))
+            return
+
+        if not rows:
+            self.stdout.write(f"No profiling data found in {settings.PROFILING_DIR}")
+            if not settings.PROFILING_ENABLED:
+                self.stdout.write('Profiling is disabled; set PROFILING=True on the web server to collect stats.')
+            return
+
+        header = f"{'View':40} {'Reqs':>7} {'Total s':>9} {'Avg ms':>8} {'p95 ms':>8} {'Queries':>8} {'SQL ms':>8} {'Tmpl ms':>8}"
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+        for row in rows:
+            self.stdout.write(
+                f"{row['view'][:40]:40} {row['count']:>7} {row['total_ms'] / 1000:>9.2f} {row['avg_ms']:>8.1f} "
+                f"{row['p95_ms']:>8.1f} {row['avg_queries']:>8.1f} {row['avg_sql_ms']:>8.1f} {row['avg_template_ms']:>8.1f}"
+            )
@@ -0,0 +1,51 @@
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+import os
+import time
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        'One-shot deploy step: apply migrations, create upcoming attendance partitions and make sure '
+        'the admin account exists, all in a single Django boot. Run it once per deploy (release phase '
+        'or pre-deploy command) instead of on every container start.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--collectstatic',
+            action='store_true',
+            help='Also collect static files, for platforms without an image build step',
+        )
+        parser.add_argument('--skip-superuser', action='store_true', help='Do not create the admin account')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        self.step('Applying migrations', call_command, 'migrate', interactive=False, verbosity=0)
+        self.step('Creating attendance partitions', call_command, 'partition_attendance', verbosity=0, stdout=self.stdout)
+        if options['collectstatic']:
+            self.step('Collecting static files', call_command, 'collectstatic', interactive=False, verbosity=0)
+        if not options['skip_superuser']:
+            self.step('Checking admin account', self.ensure_superuser)
+        self.stdout.write(self.style.SUCCESS(f'Release finished in {time.perf_counter() - started:.2f}s'))
+
+    def step(self, label, func, *args, **kwargs):
+        self.stdout.write(f'{label}...')
+        started = time.perf_counter()
+        func(*args, **kwargs)
+        self.stdout.write(f'  done in {time.perf_counter() - started:.2f}s')
+
+    def ensure_superuser(self):
+        username = os.environ.get('DJANGO_SUPERUSER_USERNAME', 'admin')
+        if User.objects.filter(username=username).exists():
+            self.stdout.write('  Superuser already exists')
+            return
+        User.objects.create_superuser(
+            username,
+            os.environ.get('DJANGO_SUPERUSER_EMAIL', 'admin@example.com'),
+            os.environ.get('DJANGO_SUPERUSER_PASSWORD', 'admin123'),
+        )
+        self.stdout.write(f'  Superuser created: {username}')
@@ -0,0 +1,79 @@
+from django.core.management.base import BaseCommand
+from django.conf import settings
+from django.db import close_old_connections
+import time
+
+from core.events import purge_feed_events
+from core.tasks import claim_next_job, purge_finished_jobs, run_job, requeue_stale_jobs
+
+# How often a long-running worker deletes expired jobs and feed events
+PURGE_INTERVAL = 3600
+
+
+class Command(BaseCommand):
+    help = 'Run the background job worker (PDF generation, payroll runs, notifications)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Process all currently runnable jobs and exit',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=getattr(settings, 'JOB_POLL_INTERVAL', 1.0),
+            help='Seconds to sleep when the queue is empty',
+        )
+        parser.add_argument(
+            '--stale-timeout',
+            type=int,
+            default=600,
+            help='Requeue RUNNING jobs older than this many seconds on startup',
+        )
+        parser.add_argument(
+            '--retention-days',
+            type=int,
+            default=getattr(settings, 'JOB_RETENTION_DAYS', 7),
+            help='Delete finished jobs and their results after this many days',
+        )
+
+    def handle(self, *args, **options):
+        requeued = requeue_stale_jobs(options['stale_timeout'])
+        if requeued:
+            self.stdout.write(f'  Requeued {requeued} stale jobs')
+        self.stdout.write('Job worker started...')
+
+        last_purge = None
+        try:
+            while True:
+                close_old_connections()
+                if last_purge is None or time.monotonic() - last_purge >= PURGE_INTERVAL:
+                    purged = purge_finished_jobs(options['retention_days'])
+                    if purged:
+                        self.stdout.write(f'  Purged {purged} finished jobs')
+                    purged = purge_feed_events()
+                    if purged:
+                        self.stdout.write(f'  Purged {purged} old feed events')
+                    last_purge = time.monotonic()
+                job = claim_next_job()
+                if job is None:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+                    continue
+
+                started = time.perf_counter()
+                job = run_job(job)
+                elapsed = time.perf_counter() - started
+                if job.status == 'SUCCEEDED':
+                    self.stdout.write(f'  {job} finished in {elapsed:.2f}s')
+                else:
+                    self.stdout.write(self.style.WARNING(
+                        f'  {job} failed (attempt {job.attempts}/{job.max_attempts}): '
+                        f'{job.error.strip().splitlines()[-1]}'
+                    ))
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS('Job worker stopped.'))
@@ -1,38 +1,110 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
 from django.utils import timezone
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
 from datetime import date, time, timedelta
+import time as perf_time
 from decimal import Decimal
 import random
 
 from core.models import Department, Leave, Attendance, Announcement, Payroll
+from core.choices import invalidate_choices
+from core.salary_stats import invalidate_salary_statistics
+from core import rollups
 
 User = get_user_model()
 
+FIRST_NAMES = [
+    'Aarav', 'Aditi', 'Arjun', 'Diya', 'Ishaan', 'Kavya', 'Neha', 'Rahul', 'Riya', 'Rohan',
+    'Sanjay', 'Sneha', 'Vikram', 'Ananya', 'Karan', 'Meera', 'Nikhil', 'Pooja', 'Siddharth', 'Tara',
+    'John', 'Jane', 'Mike', 'Sarah', 'David', 'Emma', 'Liam', 'Olivia', 'Noah', 'Sophia',
+]
+LAST_NAMES = [
+    'Sharma', 'Verma', 'Gupta', 'Iyer', 'Reddy', 'Nair', 'Patel', 'Singh', 'Mehta', 'Kapoor',
+    'Doe', 'Smith', 'Johnson', 'Wilson', 'Brown', 'Taylor', 'Anderson', 'Thomas', 'Moore', 'Clark',
+]
+LARGE_DEPARTMENTS = [
+    'Human Resources', 'Information Technology', 'Finance', 'Marketing', 'Operations',
+    'Sales', 'Legal', 'Customer Support', 'Research and Development', 'Procurement',
+    'Quality Assurance', 'Facilities',
+]
+LEAVE_REASONS = [
+    'Annual vacation',
+    'Sick leave',
+    'Personal emergency',
+    'Medical appointment',
+    'Family event'
+]
+
+
 class Command(BaseCommand):
     help = 'Seed the database with sample data for Employee Management System'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--employees',
+            type=int,
+            help='Generate a synthetic company with this many employees instead of the 5 sample employees',
+        )
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=365,
+            help='Days of attendance/leave/payroll history to generate with --employees (default: 365)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=2000,
+            help='Rows per bulk INSERT (default: 2000)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=42,
+            help='Random seed; the same seed always produces the same data (default: 42)',
+        )
+
     def handle(self, *args, **options):
-        self.stdout.write('Starting to seed database...')
-        
-        # Create departments
-        self.create_departments()
-        
-        # Create employees
-        self.create_employees()
-        
-        # Create leaves
-        self.create_leaves()
-        
-        # Create attendance records
-        self.create_attendance()
-        
-        # Create announcements
-        self.create_announcements()
-        
-        # Create payroll records
-        self.create_payroll()
-        
+        # A single seeded RNG drives every random choice, so the same seed
+        # always produces the same rows (relative to today's date)
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+
+        # One transaction for the whole run: either everything is seeded or nothing is
+        with transaction.atomic(), rollups.suspended():
+            # bulk_create skips the signals that normally refresh the cached choice lists
+            transaction.on_commit(lambda: invalidate_choices('departments'))
+            transaction.on_commit(lambda: invalidate_choices('employees'))
+            transaction.on_commit(invalidate_salary_statistics)
+            # Reporting rollups are rebuilt once instead of after every saved row
+            transaction.on_commit(rollups.rebuild_rollups)
+
+            if options['employees']:
+                self.generate_large_dataset(options)
+                return
+
+            self.stdout.write('Starting to seed database...')
+
+            # Create departments
+            self.create_departments()
+
+            # Create employees
+            self.create_employees()
+
+            # Create leaves
+            self.create_leaves()
+
+            # Create attendance records
+            self.create_attendance()
+
+            # Create announcements
+            self.create_announcements()
+
+            # Create payroll records
+            self.create_payroll()
+
         self.stdout.write(self.style.SUCCESS('Successfully seeded database!'))
 
     def create_departments(self):
@@ -46,20 +118,23 @@ class Command(BaseCommand):
             'Operations'
         ]
         
-        created_departments = []
-        for dept_name in departments_data:
-            dept, created = Department.objects.get_or_create(name=dept_name)
-            if created:
-                self.stdout.write(f'  Created department: {dept_name}')
-            created_departments.append(dept)
-        
-        return created_departments
+        started = perf_time.perf_counter()
+        existing = set(Department.objects.filter(name__in=departments_data).values_list('name', flat=True))
+        new_departments = [Department(name=name) for name in departments_data if name not in existing]
+        self.bulk_insert(Department, new_departments, self.batch_size)
+        for department in new_departments:
+            self.stdout.write(f'  Created department: {department.name}')
+        self.report_rate('departments', len(new_departments), started)
+
+        # Keep the order of departments_data so employees map to the right department
+        by_name = Department.objects.in_bulk(departments_data, field_name='name')
+        return [by_name[name] for name in departments_data]
 
     def create_employees(self):
         self.stdout.write('Creating employees...')
         
-        # Get all departments
-        departments = list(Department.objects.all())
+        # Departments in the same order they were created in
+        departments = list(Department.objects.order_by('id'))
         
         employees_data = [
             {
@@ -124,78 +199,79 @@ class Command(BaseCommand):
             }
         ]
         
-        created_employees = []
+        started = perf_time.perf_counter()
+        existing = set(
+            User.objects.filter(username__in=[emp['username'] for emp in employees_data])
+            .values_list('username', flat=True)
+        )
+        # Hash the shared default password once instead of once per employee
+        password_hash = make_password('password123') if len(existing) < len(employees_data) else None
+        new_employees = []
         for emp_data in employees_data:
-            # Check if user already exists
-            if not User.objects.filter(username=emp_data['username']).exists():
-                user = User.objects.create_user(
-                    username=emp_data['username'],
-                    email=emp_data['email'],
-                    password='password123',  # Default password
-                    first_name=emp_data['first_name'],
-                    last_name=emp_data['last_name'],
-                    department=emp_data['department'],
-                    salary=emp_data['salary'],
-                    birthday=emp_data['birthday'],
-                    experience=emp_data['experience'],
-                    date_of_joining=emp_data['date_of_joining'],
-                    is_approved=emp_data['is_approved'],
-                    role='EMPLOYEE'
-                )
-                created_employees.append(user)
-                self.stdout.write(f'  Created employee: {emp_data["first_name"]} {emp_data["last_name"]}')
-            else:
-                user = User.objects.get(username=emp_data['username'])
-                created_employees.append(user)
+            if emp_data['username'] in existing:
                 self.stdout.write(f'  Employee already exists: {emp_data["first_name"]} {emp_data["last_name"]}')
-        
-        return created_employees
+                continue
+            new_employees.append(User(password=password_hash, role='EMPLOYEE', **emp_data))
+            self.stdout.write(f'  Created employee: {emp_data["first_name"]} {emp_data["last_name"]}')
+        for user in new_employees:
+            # bulk_create skips User.save(), which normally fills these in
+            user.update_celebration_keys()
+        self.bulk_insert(User, new_employees, self.batch_size)
+        self.report_rate('employees', len(new_employees), started)
+
+        return list(User.objects.filter(username__in=[emp['username'] for emp in employees_data]))
 
     def create_leaves(self):
         self.stdout.write('Creating leave records...')
         
-        employees = list(User.objects.filter(role='EMPLOYEE'))
+        employees = list(User.objects.filter(role='EMPLOYEE').order_by('id'))
         if not employees:
             self.stdout.write('  No employees found to create leaves for')
             return
         
-        leave_reasons = [
-            'Annual vacation',
-            'Sick leave',
-            'Personal emergency',
-            'Medical appointment',
-            'Family event'
-        ]
-        
+        started = perf_time.perf_counter()
+        existing = set(
+            Leave.objects.filter(employee__in=employees).values_list('employee_id', 'start_date', 'end_date')
+        )
+        leaves = []
         for employee in employees:
             # Create 1-3 leave records per employee
-            num_leaves = random.randint(1, 3)
+            num_leaves = self.rng.randint(1, 3)
             for _ in range(num_leaves):
-                start_date = date.today() - timedelta(days=random.randint(30, 180))
-                end_date = start_date + timedelta(days=random.randint(1, 5))
-                status = random.choice(['PENDING', 'APPROVED', 'REJECTED'])
-                reason = random.choice(leave_reasons)
+                start_date = date.today() - timedelta(days=self.rng.randint(30, 180))
+                end_date = start_date + timedelta(days=self.rng.randint(1, 5))
+                status = self.rng.choice(['PENDING', 'APPROVED', 'REJECTED'])
+                reason = self.rng.choice(LEAVE_REASONS)
                 
-                Leave.objects.get_or_create(
+                key = (employee.id, start_date, end_date)
+                if key in existing:
+                    continue
+                existing.add(key)
+                leaves.append(Leave(
                     employee=employee,
                     start_date=start_date,
                     end_date=end_date,
-                    defaults={
-                        'reason': reason,
-                        'status': status
-                    }
-                )
+                    reason=reason,
+                    status=status
+                ))
         
-        self.stdout.write(f'  Created leave records for {len(employees)} employees')
+        created = self.bulk_insert(Leave, leaves, self.batch_size)
+        self.report_rate('leave records', created, started)
 
     def create_attendance(self):
         self.stdout.write('Creating attendance records...')
         
-        employees = list(User.objects.filter(role='EMPLOYEE'))
+        employees = list(User.objects.filter(role='EMPLOYEE').order_by('id'))
         if not employees:
             self.stdout.write('  No employees found to create attendance for')
             return
         
+        started = perf_time.perf_counter()
+        first_day = date.today() - timedelta(days=29)
+        existing = set(
+            Attendance.objects.filter(employee__in=employees, date__gte=first_day).values_list('employee_id', 'date')
+        )
+        records = []
         # Create attendance records for the last 30 days
         for employee in employees:
             for i in range(30):
@@ -206,25 +282,26 @@ class Command(BaseCommand):
                     continue
                 
                 # Random clock in time between 8:00 AM and 9:30 AM
-                clock_in_hour = random.randint(8, 9)
-                clock_in_minute = random.randint(0, 59) if clock_in_hour == 8 else random.randint(0, 30)
+                clock_in_hour = self.rng.randint(8, 9)
+                clock_in_minute = self.rng.randint(0, 59) if clock_in_hour == 8 else self.rng.randint(0, 30)
                 clock_in = time(clock_in_hour, clock_in_minute)
                 
                 # Random clock out time between 5:00 PM and 6:30 PM
-                clock_out_hour = random.randint(17, 18)
-                clock_out_minute = random.randint(0, 59)
+                clock_out_hour = self.rng.randint(17, 18)
+                clock_out_minute = self.rng.randint(0, 59)
                 clock_out = time(clock_out_hour, clock_out_minute)
                 
-                Attendance.objects.get_or_create(
+                if (employee.id, record_date) in existing:
+                    continue
+                records.append(Attendance(
                     employee=employee,
                     date=record_date,
-                    defaults={
-                        'clock_in': clock_in,
-                        'clock_out': clock_out
-                    }
-                )
+                    clock_in=clock_in,
+                    clock_out=clock_out
+                ))
         
-        self.stdout.write(f'  Created attendance records for {len(employees)} employees')
+        created = self.bulk_insert(Attendance, records, self.batch_size)
+        self.report_rate('attendance records', created, started)
 
     def create_announcements(self):
         self.stdout.write('Creating announcements...')
@@ -252,24 +329,32 @@ class Command(BaseCommand):
             }
         ]
         
-        for announcement_data in announcements_data:
-            Announcement.objects.get_or_create(
-                title=announcement_data['title'],
-                defaults={
-                    'content': announcement_data['content']
-                }
-            )
-        
-        self.stdout.write(f'  Created {len(announcements_data)} announcements')
+        started = perf_time.perf_counter()
+        existing = set(
+            Announcement.objects.filter(title__in=[item['title'] for item in announcements_data])
+            .values_list('title', flat=True)
+        )
+        announcements = [
+            Announcement(title=item['title'], content=item['content'])
+            for item in announcements_data if item['title'] not in existing
+        ]
+        created = self.bulk_insert(Announcement, announcements, self.batch_size)
+        self.report_rate('announcements', created, started)
 
     def create_payroll(self):
         self.stdout.write('Creating payroll records...')
         
-        employees = list(User.objects.filter(role='EMPLOYEE'))
+        employees = list(User.objects.filter(role='EMPLOYEE').order_by('id'))
         if not employees:
             self.stdout.write('  No employees found to create payroll for')
             return
         
+        started = perf_time.perf_counter()
+        existing = set(
+            Payroll.objects.filter(employee__in=employees)
+            .values_list('employee_id', 'pay_period_start', 'pay_period_end')
+        )
+        payrolls = []
         # Create payroll records for the last 6 months
         for employee in employees:
             for i in range(6):
@@ -279,18 +364,169 @@ class Command(BaseCommand):
                 
                 # Use employee's salary or default to 45000
                 salary = employee.salary or Decimal('45000.00')
-                monthly_salary = salary / 12
+                monthly_salary = (salary / 12).quantize(Decimal('0.01'))
                 
-                status = random.choice(['PENDING', 'PAID'])
+                status = self.rng.choice(['PENDING', 'PAID'])
                 
-                Payroll.objects.get_or_create(
+                if (employee.id, start_date, end_date) in existing:
+                    continue
+                payrolls.append(Payroll(
                     employee=employee,
                     pay_period_start=start_date,
                     pay_period_end=end_date,
-                    defaults={
-                        'salary': monthly_salary,
-                        'status': status
-                    }
-                )
+                    salary=monthly_salary,
+                    status=status
+                ))
         
-        self.stdout.write(f'  Created payroll records for {len(employees)} employees')
+        created = self.bulk_insert(Payroll, payrolls, self.batch_size)
+        self.report_rate('payroll records', created, started)
+
+    # --- Synthetic large-company dataset ---
+
+    def generate_large_dataset(self, options):
+        """
+        Generate N employees with D days of history using bulk_create.
+        The default password is hashed once and shared by every generated
+        employee, so user creation costs no per-row PBKDF2 work.
+        """
+        rng = self.rng
+        count = options['employees']
+        days = options['days']
+        batch_size = self.batch_size
+        self.stdout.write(f'Generating {count} employees with {days} days of history...')
+
+        existing_departments = set(Department.objects.values_list('name', flat=True))
+        self.bulk_insert(
+            Department,
+            [Department(name=name) for name in LARGE_DEPARTMENTS if name not in existing_departments],
+            batch_size,
+        )
+        by_name = Department.objects.in_bulk(LARGE_DEPARTMENTS, field_name='name')
+        departments = [by_name[name] for name in LARGE_DEPARTMENTS]
+        password_hash = make_password('password123')
+        today = date.today()
+        history_start = today - timedelta(days=days)
+
+        # Employees
+        started = perf_time.perf_counter()
+        usernames = [f'emp{i:06d}' for i in range(count)]
+        existing = set(User.objects.filter(username__in=usernames).values_list('username', flat=True))
+        new_users = []
+        for username in usernames:
+            # Draw every field before skipping existing employees, so the
+            # random sequence (and each employee's data) is the same however
+            # many of them a previous run already created
+            fields = {
+                'first_name': rng.choice(FIRST_NAMES),
+                'last_name': rng.choice(LAST_NAMES),
+                'experience': rng.randint(0, 25),
+                'department': rng.choice(departments),
+                'salary': Decimal(rng.randrange(300000, 3000000, 1000)),
+                'birthday': date(rng.randint(1965, 2003), rng.randint(1, 12), rng.randint(1, 28)),
+                'date_of_joining': history_start - timedelta(days=rng.randint(0, 3650)),
+            }
+            if username in existing:
+                continue
+            new_users.append(User(
+                username=username,
+                email=f'{username}@company.com',
+                password=password_hash,
+                role='EMPLOYEE',
+                is_approved=True,
+                **fields,
+            ))
+        for user in new_users:
+            # bulk_create skips User.save(), which normally fills these in
+            user.update_celebration_keys()
+        created = self.bulk_insert(User, new_users, batch_size)
+        self.report_rate('employees', created, started)
+
+        # History is only generated for employees created in this run, so
+        # re-running the command does not duplicate rows
+        employees = list(
+            User.objects.filter(username__in=[user.username for user in new_users])
+            .order_by('username').values_list('id', 'salary')
+        )
+
+        started = perf_time.perf_counter()
+        created = self.bulk_insert(Attendance, self.generate_attendance(rng, employees, history_start, today), batch_size)
+        self.report_rate('attendance records', created, started)
+
+        started = perf_time.perf_counter()
+        created = self.bulk_insert(Leave, self.generate_leaves(rng, employees, history_start, days), batch_size)
+        self.report_rate('leave records', created, started)
+
+        started = perf_time.perf_counter()
+        created = self.bulk_insert(Payroll, self.generate_payroll(rng, employees, history_start, today), batch_size)
+        self.report_rate('payroll records', created, started)
+
+        self.create_announcements()
+        self.stdout.write(self.style.SUCCESS('Successfully generated synthetic dataset!'))
+
+    def bulk_insert(self, model, rows, batch_size):
+        """
+        Insert rows (a list or a generator) with bulk_create in batches of
+        batch_size, so generated datasets never sit in memory all at once.
+        Callers leave out rows that already exist; anything else that hits a
+        unique constraint aborts the run rather than being skipped silently,
+        so the returned count is the number of rows really inserted. Runs
+        inside the transaction opened by handle().
+        """
+        created = 0
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                created += len(model.objects.bulk_create(batch, batch_size=batch_size))
+                batch = []
+        if batch:
+            created += len(model.objects.bulk_create(batch, batch_size=batch_size))
+        return created
+
+    def generate_attendance(self, rng, employees, start, end):
+        record_date = start
+        while record_date <= end:
+            if record_date.weekday() < 5:
+                for employee_id, _ in employees:
+                    # Roughly 5% of working days are absences
+                    if rng.random() < 0.05:
+                        continue
+                    clock_in = time(rng.randint(8, 9), rng.randint(0, 59))
+                    clock_out = None if record_date == end else time(rng.randint(17, 18), rng.randint(0, 59))
+                    yield Attendance(employee_id=employee_id, date=record_date, clock_in=clock_in, clock_out=clock_out)
+            record_date += timedelta(days=1)
+
+    def generate_leaves(self, rng, employees, start, days):
+        # About 4 leave requests per employee per year
+        per_employee = max(1, round(days / 365 * 4))
+        for employee_id, _ in employees:
+            for _ in range(per_employee):
+                start_date = start + timedelta(days=rng.randint(0, days))
+                yield Leave(
+                    employee_id=employee_id,
+                    start_date=start_date,
+                    end_date=start_date + timedelta(days=rng.randint(0, 4)),
+                    reason=rng.choice(LEAVE_REASONS),
+                    status=rng.choice(['PENDING', 'APPROVED', 'APPROVED', 'REJECTED']),
+                )
+
+    def generate_payroll(self, rng, employees, start, end):
+        period_end = end
+        while period_end - timedelta(days=29) >= start:
+            period_start = period_end - timedelta(days=29)
+            # Only the most recent period is still pending
+            status = 'PENDING' if period_end == end else 'PAID'
+            for employee_id, salary in employees:
+                yield Payroll(
+                    employee_id=employee_id,
+                    salary=((salary or Decimal('45000.00')) / 12).quantize(Decimal('0.01')),
+                    pay_period_start=period_start,
+                    pay_period_end=period_end,
+                    status=status,
+                )
+            period_end = period_start - timedelta(days=1)
+
+    def report_rate(self, label, count, started):
+        elapsed = perf_time.perf_counter() - started
+        rate = count / elapsed if elapsed > 0 else 0
+        self.stdout.write(f'  Created {count} {label} in {elapsed:.2f}s ({rate:,.0f} rows/sec)')
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='announcements_seen_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='announcement',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:10
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_case_collisions(apps, schema_editor):
+    """
+    Stop before adding the constraints if existing users differ only by
+    case; the indexes could not be built and the deploy would fail half way.
+    Which account to keep is a decision for an admin, not for a migration.
+    """
+    User = apps.get_model('core', 'User')
+    collisions = []
+    for field in ('username', 'email'):
+        users = User.objects.annotate(folded=Lower(field))
+        if field == 'email':
+            users = users.exclude(email='')
+        duplicated = users.values('folded').annotate(count=Count('id')).filter(count__gt=1).values_list('folded', flat=True)
+        for folded in duplicated[:20]:
+            values = users.filter(folded=folded).order_by('id').values_list('id', field)
+            collisions.append(f"{field}: " + ', '.join(f'{value!r} (id {pk})' for pk, value in values))
+    if collisions:
+        raise RuntimeError(
+            "Cannot add the case-insensitive unique constraints on core_user: these users differ only by case.\n  "
+            + '\n  '.join(collisions)
+            + "\nRename, merge or delete the duplicates, then run migrate again."
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('core', '0011_feedevent'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_case_collisions, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('username'), name='core_user_username_ci_unique', violation_error_message='A user with this username already exists.'),
+        ),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), condition=models.Q(('email', ''), _negated=True), name='core_user_email_ci_unique', violation_error_message='A user with this email already exists.'),
+        ),
+    ]
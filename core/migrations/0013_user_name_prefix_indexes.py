@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:13
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('core', '0012_user_case_insensitive_unique'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(django.db.models.functions.text.Lower('first_name'), name='core_user_first_name_ci_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(django.db.models.functions.text.Lower('last_name'), name='core_user_last_name_ci_idx'),
+        ),
+    ]
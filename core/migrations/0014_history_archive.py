@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:18
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_user_name_prefix_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedAttendance',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('date', models.DateField()),
+                ('clock_in', models.TimeField()),
+                ('clock_out', models.TimeField(blank=True, null=True)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['employee', 'date'], name='core_archatt_emp_date_idx'), models.Index(fields=['date'], name='core_archatt_date_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedPayroll',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('salary', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('pay_period_start', models.DateField()),
+                ('pay_period_end', models.DateField()),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('PAID', 'Paid')], default='PAID', max_length=10)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['employee', 'pay_period_end'], name='core_archpay_emp_end_idx'), models.Index(fields=['pay_period_end'], name='core_archpay_end_idx')],
+            },
+        ),
+    ]
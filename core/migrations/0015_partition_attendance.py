@@ -0,0 +1,30 @@
+# Range-partitions core_attendance by month on PostgreSQL when
+# ATTENDANCE_PARTITIONING is enabled; a no-op everywhere else.
+# See core/partitions.py.
+
+from django.conf import settings
+from django.db import migrations
+
+
+def partition_attendance(apps, schema_editor):
+    from core import partitions
+
+    if getattr(settings, 'ATTENDANCE_PARTITIONING', False):
+        partitions.partition_table(schema_editor.connection, getattr(settings, 'ATTENDANCE_PARTITION_MONTHS_AHEAD', 3))
+
+
+def unpartition_attendance(apps, schema_editor):
+    from core import partitions
+
+    partitions.unpartition_table(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_history_archive'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_attendance, unpartition_attendance),
+    ]
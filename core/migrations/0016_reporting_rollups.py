@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_partition_attendance'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HeadcountRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('headcount', models.PositiveIntegerField(default=0)),
+                ('hires', models.PositiveIntegerField(default=0)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PayrollRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('total_cost', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('paid_cost', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('payslips', models.PositiveIntegerField(default=0)),
+                ('employees', models.PositiveIntegerField(default=0)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SalaryBandRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('band', models.CharField(max_length=20, unique=True)),
+                ('position', models.PositiveSmallIntegerField(default=0)),
+                ('employees', models.PositiveIntegerField(default=0)),
+                ('total_salary', models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='payroll',
+            index=models.Index(fields=['pay_period_end'], name='core_payroll_period_end_idx'),
+        ),
+        migrations.AddField(
+            model_name='headcountrollup',
+            name='department',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='core.department'),
+        ),
+        migrations.AddField(
+            model_name='payrollrollup',
+            name='department',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='core.department'),
+        ),
+        migrations.AddConstraint(
+            model_name='headcountrollup',
+            constraint=models.UniqueConstraint(fields=('month', 'department'), name='core_headcountrollup_month_dept_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='payrollrollup',
+            constraint=models.UniqueConstraint(fields=('month', 'department'), name='core_payrollrollup_month_dept_uniq'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:37
+
+from django.db import migrations, models
+
+
+def backfill_keys(apps, schema_editor):
+    User = apps.get_model('core', 'User')
+    users = []
+    for user in User.objects.only('pk', 'birthday', 'date_of_joining').iterator(chunk_size=2000):
+        # Historical models do not have User.save(), so mirror month_day_key() here
+        user.birthday_key = user.birthday.month * 100 + user.birthday.day if user.birthday else None
+        user.anniversary_key = user.date_of_joining.month * 100 + user.date_of_joining.day if user.date_of_joining else None
+        users.append(user)
+    User.objects.bulk_update(users, ['birthday_key', 'anniversary_key'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('core', '0016_reporting_rollups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='anniversary_key',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='birthday_key',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['birthday_key'], name='core_user_birthday_key_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['anniversary_key'], name='core_user_anniversary_key_idx'),
+        ),
+        migrations.RunPython(backfill_keys, migrations.RunPython.noop),
+    ]
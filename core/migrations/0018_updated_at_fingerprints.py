@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:40
+
+from django.db import migrations, models
+
+
+def announcements_updated_at_created(apps, schema_editor):
+    # Existing rows got the migration time; their creation time is closer
+    Announcement = apps.get_model('core', 'Announcement')
+    Announcement.objects.update(updated_at=models.F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_celebration_keys'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='announcement',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+        migrations.AddField(
+            model_name='attendance',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='leave',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='payroll',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['employee', 'updated_at'], name='core_att_emp_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leave',
+            index=models.Index(fields=['employee', 'updated_at'], name='core_leave_emp_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payroll',
+            index=models.Index(fields=['employee', 'updated_at'], name='core_payroll_emp_updated_idx'),
+        ),
+        migrations.RunPython(announcements_updated_at_created, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_updated_at_fingerprints'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['employee', '-date', '-id'], name='core_att_emp_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leave',
+            index=models.Index(fields=['employee', '-start_date', '-id'], name='core_leave_emp_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payroll',
+            index=models.Index(fields=['employee', '-pay_period_end', '-id'], name='core_payroll_emp_end_idx'),
+        ),
+    ]
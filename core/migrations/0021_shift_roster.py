@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:50
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_audit_event'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Shift',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('start_time', models.TimeField()),
+                ('end_time', models.TimeField()),
+                ('grace_minutes', models.PositiveSmallIntegerField(default=10, help_text='Minutes after the start before a clock-in counts as late')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Roster',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('starts_on', models.DateField()),
+                ('ends_on', models.DateField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rosters', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RosterDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveSmallIntegerField()),
+                ('roster', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='days', to='core.roster')),
+                ('shift', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='core.shift')),
+            ],
+            options={
+                'ordering': ['position'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='roster',
+            index=models.Index(fields=['employee', 'starts_on'], name='core_roster_emp_start_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='rosterday',
+            constraint=models.UniqueConstraint(fields=('roster', 'position'), name='core_rosterday_roster_pos_uniq'),
+        ),
+    ]
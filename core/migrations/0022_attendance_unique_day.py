@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:58
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def merge_duplicate_days(apps, schema_editor):
+    """
+    Fold duplicate attendance records of one employee and day (left by
+    concurrent clock-ins) into the oldest one: earliest clock-in, latest
+    clock-out.
+    """
+    Attendance = apps.get_model('core', 'Attendance')
+    duplicates = (
+        Attendance.objects.values('employee_id', 'date')
+        .annotate(records=Count('id'))
+        .filter(records__gt=1)
+    )
+    for day in duplicates.iterator():
+        rows = list(Attendance.objects.filter(employee_id=day['employee_id'], date=day['date']).order_by('id'))
+        keeper = rows[0]
+        keeper.clock_in = min(row.clock_in for row in rows)
+        keeper.clock_out = max((row.clock_out for row in rows if row.clock_out), default=None)
+        keeper.save(update_fields=['clock_in', 'clock_out'])
+        Attendance.objects.filter(pk__in=[row.pk for row in rows[1:]]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_shift_roster'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_days, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='attendance',
+            constraint=models.UniqueConstraint(fields=('employee', 'date'), name='core_attendance_emp_date_uniq'),
+        ),
+    ]
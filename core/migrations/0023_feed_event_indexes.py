@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0022_attendance_unique_day'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='feedevent',
+            index=models.Index(fields=['user', 'id'], name='core_feedevent_user_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='feedevent',
+            index=models.Index(fields=['created_at'], name='core_feedevent_created_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Prefix-search indexes for the employee autocomplete (core/choices.py) on
+# PostgreSQL. employee_search() filters with LOWER(column) LIKE 'prefix%';
+# under a linguistic collation only a text_pattern_ops index can serve that
+# LIKE. Other backends keep using the Lower() indexes of migrations 0012
+# and 0013.
+
+from django.db import migrations
+
+FIELDS = ('username', 'first_name', 'last_name')
+
+
+def create_pattern_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for field in FIELDS:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS core_user_{field}_pattern_idx '
+            f'ON core_user (LOWER({field}) text_pattern_ops)'
+        )
+
+
+def drop_pattern_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for field in FIELDS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS core_user_{field}_pattern_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0023_feed_event_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_pattern_indexes, drop_pattern_indexes),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:17
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def drop_duplicate_pending_payrolls(apps, schema_editor):
+    """
+    Remove duplicate payroll records of one employee and pay period (left by
+    overlapping payroll runs) that were never paid, keeping the paid one or
+    else the oldest. Records paid more than once stop the migration: whether
+    to recover the money is a decision for an admin, not for a migration.
+    """
+    Payroll = apps.get_model('core', 'Payroll')
+    duplicates = (
+        Payroll.objects.values('employee_id', 'pay_period_start', 'pay_period_end')
+        .annotate(records=Count('id'))
+        .filter(records__gt=1)
+    )
+    paid_twice = []
+    for period in duplicates.iterator():
+        rows = list(Payroll.objects.filter(**period_filter(period)).order_by('id'))
+        paid = [row for row in rows if row.status == 'PAID']
+        if len(paid) > 1:
+            paid_twice.append(', '.join(f'id {row.pk}' for row in paid))
+            continue
+        keeper = paid[0] if paid else rows[0]
+        Payroll.objects.filter(pk__in=[row.pk for row in rows if row.pk != keeper.pk]).delete()
+    if paid_twice:
+        raise RuntimeError(
+            "Cannot add the unique constraint on core_payroll: these payroll records pay the same employee "
+            "for the same period more than once.\n  " + '\n  '.join(paid_twice[:20])
+            + "\nResolve or delete the extra records, then run migrate again."
+        )
+
+
+def period_filter(period):
+    return {
+        'employee_id': period['employee_id'],
+        'pay_period_start': period['pay_period_start'],
+        'pay_period_end': period['pay_period_end'],
+    }
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0024_user_name_pattern_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_pending_payrolls, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='payroll',
+            constraint=models.UniqueConstraint(fields=('employee', 'pay_period_start', 'pay_period_end'), name='core_payroll_emp_period_uniq', violation_error_message='This employee already has a payroll record for this pay period.'),
+        ),
+    ]
@@ -1,8 +1,11 @@
 # core/models.py
 
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser, BaseUserManager, Group, Permission
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
 class Department(models.Model):
     name = models.CharField(max_length=100, unique=True)
 
@@ -57,6 +60,11 @@ class CustomUserManager(BaseUserManager):
         return self._create_user(username, email, password, **extra_fields)
 
 
+def month_day_key(value):
+    """A date's month and day as one sortable number (MMDD), e.g. 1225 for December 25."""
+    return value.month * 100 + value.day if value else None
+
+
 class User(AbstractUser):
     """
     Custom User model for the Employee Management System.
@@ -76,6 +84,12 @@ class User(AbstractUser):
     birthday = models.DateField(null=True, blank=True)
     experience = models.PositiveIntegerField(null=True, blank=True, help_text="Experience in years")
     date_of_joining = models.DateField(null=True, blank=True)
+    # Month and day (MMDD) of birthday and date_of_joining, kept in sync by
+    # save(), so "whose birthday is today" is an equality lookup on an index
+    birthday_key = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)
+    anniversary_key = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)
+    # High-water mark for announcements: everything created after this is unread
+    announcements_seen_at = models.DateTimeField(null=True, blank=True)
 
     # Use the custom manager
     objects = CustomUserManager()
@@ -98,6 +112,46 @@ class User(AbstractUser):
         related_query_name="user",
     )
 
+    class Meta(AbstractUser.Meta):
+        swappable = 'AUTH_USER_MODEL'
+        # Case-folded uniqueness enforced by the database, so signup needs a
+        # single lookup and concurrent signups cannot race past the check
+        constraints = [
+            models.UniqueConstraint(
+                Lower('username'),
+                name='core_user_username_ci_unique',
+                violation_error_message='A user with this username already exists.',
+            ),
+            models.UniqueConstraint(
+                Lower('email'),
+                condition=~models.Q(email=''),
+                name='core_user_email_ci_unique',
+                violation_error_message='A user with this email already exists.',
+            ),
+        ]
+        # Lowercased name indexes for the employee autocomplete (username is
+        # covered above); on PostgreSQL its prefix searches use the
+        # text_pattern_ops indexes of migration 0024 instead
+        indexes = [
+            models.Index(Lower('first_name'), name='core_user_first_name_ci_idx'),
+            models.Index(Lower('last_name'), name='core_user_last_name_ci_idx'),
+            # Daily birthday and work-anniversary digests (core/celebrations.py)
+            models.Index(fields=['birthday_key'], name='core_user_birthday_key_idx'),
+            models.Index(fields=['anniversary_key'], name='core_user_anniversary_key_idx'),
+        ]
+
+    def update_celebration_keys(self):
+        """Recompute birthday_key and anniversary_key. Call before bulk_create, which skips save()."""
+        self.birthday_key = month_day_key(self.birthday)
+        self.anniversary_key = month_day_key(self.date_of_joining)
+
+    def save(self, *args, **kwargs):
+        self.update_celebration_keys()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'birthday', 'date_of_joining'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'birthday_key', 'anniversary_key'}
+        super().save(*args, **kwargs)
+
 class Leave(models.Model):
     STATUS_CHOICES = (
         ('PENDING', 'Pending'),
@@ -109,6 +163,15 @@ class Leave(models.Model):
     end_date = models.DateField()
     reason = models.CharField(max_length=500)
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='PENDING')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Per-employee fingerprint (count, latest change) for conditional GET
+            models.Index(fields=['employee', 'updated_at'], name='core_leave_emp_updated_idx'),
+            # Keyset pages of an employee's history, newest first (core/history.py)
+            models.Index(fields=['employee', '-start_date', '-id'], name='core_leave_emp_start_idx'),
+        ]
 
     def __str__(self):
         return f"{self.employee.username} - {self.start_date} to {self.end_date}"
@@ -118,14 +181,81 @@ class Attendance(models.Model):
     date = models.DateField()
     clock_in = models.TimeField()
     clock_out = models.TimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Per-employee fingerprint (count, latest change) for conditional GET
+            models.Index(fields=['employee', 'updated_at'], name='core_att_emp_updated_idx'),
+            # Keyset pages of an employee's history, newest first (core/history.py)
+            models.Index(fields=['employee', '-date', '-id'], name='core_att_emp_date_idx'),
+        ]
+        constraints = [
+            # One record per employee and day, so concurrent clock-ins cannot both insert
+            models.UniqueConstraint(fields=['employee', 'date'], name='core_attendance_emp_date_uniq'),
+        ]
 
     def __str__(self):
         return f"{self.employee.username} - {self.date}"
 
+class Shift(models.Model):
+    """
+    A working window in local time. A shift whose end is not after its start
+    runs overnight and ends on the next day; it still belongs to the day it
+    starts on, as does its attendance record.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    start_time = models.TimeField()
+    end_time = models.TimeField()
+    grace_minutes = models.PositiveSmallIntegerField(default=10, help_text="Minutes after the start before a clock-in counts as late")
+
+    @property
+    def crosses_midnight(self):
+        return self.end_time <= self.start_time
+
+    def __str__(self):
+        return f"{self.name} ({self.start_time:%H:%M}-{self.end_time:%H:%M})"
+
+class Roster(models.Model):
+    """
+    A repeating shift pattern for one employee. Its RosterDays give the
+    shift for each day of the cycle, counted from starts_on, and the cycle
+    repeats until ends_on (open-ended if blank). Where an employee's rosters
+    overlap, the one that starts latest wins. Expanded by core/rosters.py.
+    """
+    employee = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='rosters')
+    starts_on = models.DateField()
+    ends_on = models.DateField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['employee', 'starts_on'], name='core_roster_emp_start_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.employee.username} from {self.starts_on}"
+
+class RosterDay(models.Model):
+    """Day `position` (0-based) of a roster's cycle. No shift means a day off."""
+    roster = models.ForeignKey(Roster, on_delete=models.CASCADE, related_name='days')
+    position = models.PositiveSmallIntegerField()
+    shift = models.ForeignKey(Shift, on_delete=models.PROTECT, null=True, blank=True)
+
+    class Meta:
+        ordering = ['position']
+        constraints = [
+            models.UniqueConstraint(fields=['roster', 'position'], name='core_rosterday_roster_pos_uniq'),
+        ]
+
+    def __str__(self):
+        return f"Day {self.position + 1}: {self.shift.name if self.shift_id else 'off'}"
+
 class Announcement(models.Model):
     title = models.CharField(max_length=200)
     content = models.CharField(max_length=500)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self):
         return self.title
@@ -140,6 +270,201 @@ class Payroll(models.Model):
     pay_period_start = models.DateField()
     pay_period_end = models.DateField()
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='PENDING')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # One record per employee and pay period, so a retried or doubly
+        # enqueued payroll run cannot pay anybody twice
+        constraints = [
+            models.UniqueConstraint(
+                fields=['employee', 'pay_period_start', 'pay_period_end'],
+                name='core_payroll_emp_period_uniq',
+                violation_error_message='This employee already has a payroll record for this pay period.',
+            ),
+        ]
+        indexes = [
+            # Month buckets for the payroll rollups
+            models.Index(fields=['pay_period_end'], name='core_payroll_period_end_idx'),
+            # Per-employee fingerprint (count, latest change) for conditional GET
+            models.Index(fields=['employee', 'updated_at'], name='core_payroll_emp_updated_idx'),
+            # Keyset pages of an employee's history, newest first (core/history.py)
+            models.Index(fields=['employee', '-pay_period_end', '-id'], name='core_payroll_emp_end_idx'),
+        ]
 
     def __str__(self):
         return f"{self.employee.username} - {self.pay_period_start} to {self.pay_period_end}"
+
+class Job(models.Model):
+    """
+    A unit of background work (PDF rendering, payroll runs, notifications)
+    stored in the database and executed by the `run_jobs` worker command.
+    """
+    STATUS_CHOICES = (
+        ('PENDING', 'Pending'),
+        ('RUNNING', 'Running'),
+        ('SUCCEEDED', 'Succeeded'),
+        ('FAILED', 'Failed'),
+    )
+    kind = models.CharField(max_length=50)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='PENDING')
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_after = models.DateTimeField(default=timezone.now)
+    created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    # Downloadable output such as a PDF or CSV report
+    result = models.BinaryField(null=True, blank=True)
+    result_content_type = models.CharField(max_length=100, blank=True)
+    result_filename = models.CharField(max_length=255, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'run_after'], name='core_job_status_run_after_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.pk} ({self.status})"
+
+class FeedEvent(models.Model):
+    """
+    An event pushed to connected clients over the server-sent events feed.
+    A null user means the event is broadcast to every employee.
+    """
+    kind = models.CharField(max_length=50)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, null=True, blank=True)
+    data = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # Stream polls: a user's (and the broadcast) events after the last id
+            models.Index(fields=['user', 'id'], name='core_feedevent_user_id_idx'),
+            # Retention deletes (core.events.purge_feed_events)
+            models.Index(fields=['created_at'], name='core_feedevent_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.pk}"
+
+class ArchivedAttendance(models.Model):
+    """
+    Attendance moved out of the hot table by the `archive_history` command.
+    The primary key is the original Attendance id, so re-running an archive
+    never duplicates rows.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    employee = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    date = models.DateField()
+    clock_in = models.TimeField()
+    clock_out = models.TimeField(null=True, blank=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['employee', 'date'], name='core_archatt_emp_date_idx'),
+            models.Index(fields=['date'], name='core_archatt_date_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.employee.username} - {self.date} (archived)"
+
+class ArchivedPayroll(models.Model):
+    """Paid payroll periods moved out of the hot table by `archive_history`."""
+    id = models.BigIntegerField(primary_key=True)
+    employee = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    salary = models.DecimalField(max_digits=10, decimal_places=2)
+    pay_period_start = models.DateField()
+    pay_period_end = models.DateField()
+    status = models.CharField(max_length=10, choices=Payroll.STATUS_CHOICES, default='PAID')
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['employee', 'pay_period_end'], name='core_archpay_emp_end_idx'),
+            models.Index(fields=['pay_period_end'], name='core_archpay_end_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.employee.username} - {self.pay_period_start} to {self.pay_period_end} (archived)"
+
+class PayrollRollup(models.Model):
+    """
+    Payroll cost per department per month (by pay period end, live and
+    archived payroll together). Maintained by core/rollups.py; a null
+    department is employees without one.
+    """
+    month = models.DateField()
+    department = models.ForeignKey(Department, on_delete=models.CASCADE, null=True, blank=True)
+    total_cost = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    paid_cost = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    payslips = models.PositiveIntegerField(default=0)
+    employees = models.PositiveIntegerField(default=0)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['month', 'department'], name='core_payrollrollup_month_dept_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.month:%Y-%m} {self.department or 'Unassigned'}: {self.total_cost}"
+
+class HeadcountRollup(models.Model):
+    """
+    Approved employees per department at the end of each month, counted by
+    joining date. Maintained by core/rollups.py.
+    """
+    month = models.DateField()
+    department = models.ForeignKey(Department, on_delete=models.CASCADE, null=True, blank=True)
+    headcount = models.PositiveIntegerField(default=0)
+    hires = models.PositiveIntegerField(default=0)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['month', 'department'], name='core_headcountrollup_month_dept_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.month:%Y-%m} {self.department or 'Unassigned'}: {self.headcount}"
+
+class SalaryBandRollup(models.Model):
+    """Current salary totals of approved employees per experience band. Maintained by core/rollups.py."""
+    band = models.CharField(max_length=20, unique=True)
+    position = models.PositiveSmallIntegerField(default=0)
+    employees = models.PositiveIntegerField(default=0)
+    total_salary = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    @property
+    def average_salary(self):
+        return self.total_salary / self.employees if self.employees else 0
+
+    def __str__(self):
+        return f"{self.band}: {self.employees}"
+
+class AuditEvent(models.Model):
+    """
+    Append-only record of an admin action: who (actor) did what (verb) to
+    which row (model, object_id), with the changed fields as
+    {field: [old, new]}. Written in batches by core/audit.py.
+    """
+    actor = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    verb = models.CharField(max_length=20)
+    model = models.CharField(max_length=30)
+    object_id = models.PositiveBigIntegerField()
+    changes = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    ts = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            # History of one row, oldest to newest
+            models.Index(fields=['model', 'object_id', 'ts'], name='core_audit_model_obj_ts_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.verb} {self.model} #{self.object_id}"
@@ -0,0 +1,186 @@
+# core/partitions.py
+"""
+Monthly range partitioning of the attendance table on PostgreSQL.
+
+When enabled, core_attendance becomes a table partitioned by RANGE (date)
+with one partition per month (core_attendance_y2026m01, ...) plus a default
+partition that catches dates no monthly partition covers yet. Queries that
+filter on date (clock-in, the dashboard's monthly count, the admin date
+range) then only touch the matching partitions.
+
+The ORM model does not change: PostgreSQL requires the partition key in the
+primary key, so the table's primary key becomes (id, date), while id keeps
+coming from its own sequence and stays unique.
+
+Other databases (SQLite in development) keep the plain table; every
+function here is a no-op for them.
+"""
+
+from datetime import date
+
+from django.db import connection as default_connection
+
+TABLE = 'core_attendance'
+DEFAULT_PARTITION = f'{TABLE}_default'
+SEQUENCE = f'{TABLE}_id_seq'
+
+
+def is_supported(connection=default_connection):
+    return connection.vendor == 'postgresql'
+
+
+def add_months(day, months):
+    """First day of the month `months` months after day's month."""
+    month_index = day.year * 12 + day.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def partition_name(month):
+    return f'{TABLE}_y{month.year}m{month.month:02d}'
+
+
+def is_partitioned(connection=default_connection):
+    if not is_supported(connection):
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relkind FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE c.relname = %s AND n.nspname = current_schema()",
+            [TABLE],
+        )
+        row = cursor.fetchone()
+    return row is not None and row[0] == 'p'
+
+
+def list_partitions(connection=default_connection):
+    """[(partition name, bound expression, estimated rows), ...] ordered by name."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid), child.reltuples::bigint "
+            "FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = %s ORDER BY child.relname",
+            [TABLE],
+        )
+        return cursor.fetchall()
+
+
+def create_month_partition(cursor, month):
+    """
+    Create the partition for one month unless it exists. Rows for that month
+    that already landed in the default partition are moved into it first,
+    because PostgreSQL refuses to add a partition that would overlap them.
+    """
+    name = partition_name(month)
+    cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [name])
+    if cursor.fetchone()[0]:
+        return False
+
+    start, end = month.isoformat(), add_months(month, 1).isoformat()
+    bounds = f"FOR VALUES FROM ('{start}') TO ('{end}')"
+    cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [DEFAULT_PARTITION])
+    has_default = cursor.fetchone()[0]
+    stranded = False
+    if has_default:
+        cursor.execute(f'SELECT EXISTS (SELECT 1 FROM "{DEFAULT_PARTITION}" WHERE date >= %s AND date < %s)', [start, end])
+        stranded = cursor.fetchone()[0]
+
+    if stranded:
+        cursor.execute(f'CREATE TABLE "{name}" (LIKE "{TABLE}" INCLUDING DEFAULTS)')
+        cursor.execute(
+            f'WITH moved AS (DELETE FROM "{DEFAULT_PARTITION}" WHERE date >= %s AND date < %s RETURNING *) '
+            f'INSERT INTO "{name}" SELECT * FROM moved',
+            [start, end],
+        )
+        cursor.execute(f'ALTER TABLE "{TABLE}" ATTACH PARTITION "{name}" {bounds}')
+    else:
+        cursor.execute(f'CREATE TABLE "{name}" PARTITION OF "{TABLE}" {bounds}')
+    return True
+
+
+def ensure_partitions(first_month, last_month, connection=default_connection):
+    """Create the monthly partitions from first_month to last_month inclusive; return the new names."""
+    created = []
+    month = first_month.replace(day=1)
+    with connection.cursor() as cursor:
+        while month <= last_month:
+            if create_month_partition(cursor, month):
+                created.append(partition_name(month))
+            month = add_months(month, 1)
+    return created
+
+
+def _capture_dependents(cursor, table):
+    """Index and foreign key definitions on table, other than its primary key."""
+    cursor.execute(
+        "SELECT indexdef FROM pg_indexes WHERE tablename = %s AND schemaname = current_schema() "
+        "AND indexname NOT IN (SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'p')",
+        [table, table],
+    )
+    indexes = [row[0] for row in cursor.fetchall()]
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'f'",
+        [table],
+    )
+    foreign_keys = cursor.fetchall()
+    return indexes, foreign_keys
+
+
+def _rebuild(connection, partitioned, months_ahead):
+    """
+    Recreate core_attendance as a partitioned (or plain) table with the same
+    columns, rows, indexes, foreign keys and id sequence. Runs inside the
+    caller's transaction.
+    """
+    old = f'{TABLE}_old'
+    with connection.cursor() as cursor:
+        indexes, foreign_keys = _capture_dependents(cursor, TABLE)
+        cursor.execute(f'SELECT COALESCE(MAX(id), 0), MIN(date), MAX(date) FROM "{TABLE}"')
+        max_id, min_date, max_date = cursor.fetchone()
+
+        cursor.execute(f'ALTER TABLE "{TABLE}" RENAME TO "{old}"')
+        if partitioned:
+            cursor.execute(f'CREATE TABLE "{TABLE}" (LIKE "{old}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS) PARTITION BY RANGE (date)')
+            cursor.execute(f'CREATE TABLE "{DEFAULT_PARTITION}" PARTITION OF "{TABLE}" DEFAULT')
+        else:
+            cursor.execute(f'CREATE TABLE "{TABLE}" (LIKE "{old}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+        # LIKE copies the column types but not the id default, which still
+        # points at the old table's sequence; it is replaced below
+        cursor.execute(f'ALTER TABLE "{TABLE}" ALTER COLUMN id DROP DEFAULT')
+
+    if partitioned:
+        today = date.today()
+        ensure_partitions(min(min_date or today, today), add_months(max(max_date or today, today), months_ahead), connection)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'INSERT INTO "{TABLE}" SELECT * FROM "{old}"')
+        # Drops the old indexes, constraints and identity/serial sequence with it
+        cursor.execute(f'DROP TABLE "{old}"')
+
+        primary_key = '(id, date)' if partitioned else '(id)'
+        cursor.execute(f'ALTER TABLE "{TABLE}" ADD CONSTRAINT "{TABLE}_pkey" PRIMARY KEY {primary_key}')
+        for definition in indexes:
+            cursor.execute(definition)
+        for name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE "{TABLE}" ADD CONSTRAINT "{name}" {definition}')
+
+        cursor.execute(f'CREATE SEQUENCE "{SEQUENCE}" OWNED BY "{TABLE}".id')
+        cursor.execute(f"ALTER TABLE \"{TABLE}\" ALTER COLUMN id SET DEFAULT nextval('\"{SEQUENCE}\"')")
+        cursor.execute("SELECT setval(%s, %s, %s)", [SEQUENCE, max(max_id, 1), max_id > 0])
+
+
+def partition_table(connection=default_connection, months_ahead=3):
+    """Convert core_attendance to monthly partitions. Returns False if there was nothing to do."""
+    if not is_supported(connection) or is_partitioned(connection):
+        return False
+    _rebuild(connection, partitioned=True, months_ahead=months_ahead)
+    return True
+
+
+def unpartition_table(connection=default_connection):
+    """Convert core_attendance back into a plain table."""
+    if not is_partitioned(connection):
+        return False
+    _rebuild(connection, partitioned=False, months_ahead=0)
+    return True
@@ -0,0 +1,285 @@
+# core/profiling.py
+"""
+Opt-in request profiling.
+
+When PROFILING_ENABLED is set, ProfilingMiddleware records SQL query count,
+SQL time, template render time and total latency per URL name into an
+in-memory ring buffer with latency histograms. Each worker process also
+dumps its snapshot to PROFILING_DIR so the admin stats page and the
+`profile_report` command can merge every worker's numbers.
+
+When disabled the middleware raises MiddlewareNotUsed, so Django drops it
+from the chain and requests pay nothing.
+
+The current request's counters live in a context variable. It follows the
+request into the threads that sync_to_async runs the ORM in, so queries
+and renders of async views are counted too, and the middleware serves
+async requests without a thread hop of its own.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+# Upper bounds (in ms) of the latency histogram buckets; the last bucket is open-ended
+HISTOGRAM_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_profile = ContextVar('request_profile', default=None)
+
+
+class ViewStats:
+    """Aggregated timings for one URL name."""
+    def __init__(self, sample_size):
+        self.count = 0
+        self.total_ms = 0.0
+        self.sql_ms = 0.0
+        self.template_ms = 0.0
+        self.queries = 0
+        self.max_ms = 0.0
+        self.histogram = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        # Ring buffer of recent (total_ms, queries, sql_ms, template_ms) samples
+        self.samples = deque(maxlen=sample_size)
+
+    def add(self, total_ms, queries, sql_ms, template_ms):
+        self.count += 1
+        self.total_ms += total_ms
+        self.sql_ms += sql_ms
+        self.template_ms += template_ms
+        self.queries += queries
+        self.max_ms = max(self.max_ms, total_ms)
+        for index, bound in enumerate(HISTOGRAM_BUCKETS):
+            if total_ms <= bound:
+                break
+        else:
+            index = len(HISTOGRAM_BUCKETS)
+        self.histogram[index] += 1
+        self.samples.append((round(total_ms, 3), queries, round(sql_ms, 3), round(template_ms, 3)))
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'total_ms': self.total_ms,
+            'sql_ms': self.sql_ms,
+            'template_ms': self.template_ms,
+            'queries': self.queries,
+            'max_ms': self.max_ms,
+            'histogram': list(self.histogram),
+            'samples': list(self.samples),
+        }
+
+
+class ProfileRegistry:
+    """Thread-safe per-process store of ViewStats keyed by URL name."""
+    def __init__(self, sample_size=200):
+        self.sample_size = sample_size
+        self.lock = threading.Lock()
+        self.views = {}
+
+    def record(self, view_name, total_ms, queries, sql_ms, template_ms):
+        with self.lock:
+            stats = self.views.get(view_name)
+            if stats is None:
+                stats = self.views[view_name] = ViewStats(self.sample_size)
+            stats.add(total_ms, queries, sql_ms, template_ms)
+
+    def snapshot(self):
+        with self.lock:
+            return {name: stats.to_dict() for name, stats in self.views.items()}
+
+    def reset(self):
+        with self.lock:
+            self.views = {}
+
+
+registry = ProfileRegistry(getattr(settings, 'PROFILING_SAMPLE_SIZE', 200))
+
+
+def _snapshot_path(pid=None):
+    return os.path.join(settings.PROFILING_DIR, f"profile-{pid or os.getpid()}.json")
+
+
+def dump_snapshot():
+    """Write this process's snapshot to PROFILING_DIR for other processes to merge."""
+    os.makedirs(settings.PROFILING_DIR, exist_ok=True)
+    path = _snapshot_path()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as handle:
+        json.dump({'pid': os.getpid(), 'written_at': time.time(), 'views': registry.snapshot()}, handle)
+    os.replace(tmp_path, path)
+
+
+def load_snapshots(include_live=True):
+    """
+    Return every worker's snapshot from PROFILING_DIR. The live in-memory
+    numbers replace this process's (possibly stale) file when include_live is set.
+    """
+    snapshots = []
+    own_path = _snapshot_path()
+    directory = getattr(settings, 'PROFILING_DIR', None)
+    if directory and os.path.isdir(directory):
+        for filename in sorted(os.listdir(directory)):
+            path = os.path.join(directory, filename)
+            if not filename.endswith('.json') or (include_live and path == own_path):
+                continue
+            try:
+                with open(path) as handle:
+                    snapshots.append(json.load(handle)['views'])
+            except (OSError, ValueError, KeyError):
+                continue
+    if include_live:
+        snapshots.append(registry.snapshot())
+    return snapshots
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def merge_snapshots(snapshots):
+    """
+    Merge per-worker snapshots into one report row per URL name, sorted by
+    total time spent (the "hottest" views first).
+    """
+    merged = {}
+    for snapshot in snapshots:
+        for name, data in snapshot.items():
+            row = merged.setdefault(name, {
+                'view': name, 'count': 0, 'total_ms': 0.0, 'sql_ms': 0.0, 'template_ms': 0.0,
+                'queries': 0, 'max_ms': 0.0, 'histogram': [0] * (len(HISTOGRAM_BUCKETS) + 1), 'latencies': [],
+            })
+            row['count'] += data['count']
+            row['total_ms'] += data['total_ms']
+            row['sql_ms'] += data['sql_ms']
+            row['template_ms'] += data['template_ms']
+            row['queries'] += data['queries']
+            row['max_ms'] = max(row['max_ms'], data['max_ms'])
+            row['histogram'] = [a + b for a, b in zip(row['histogram'], data['histogram'])]
+            row['latencies'].extend(sample[0] for sample in data['samples'])
+
+    rows = []
+    for row in merged.values():
+        count = row['count'] or 1
+        latencies = sorted(row.pop('latencies'))
+        row.update({
+            'avg_ms': row['total_ms'] / count,
+            'avg_sql_ms': row['sql_ms'] / count,
+            'avg_template_ms': row['template_ms'] / count,
+            'avg_queries': row['queries'] / count,
+            'p50_ms': _percentile(latencies, 50),
+            'p95_ms': _percentile(latencies, 95),
+            'p99_ms': _percentile(latencies, 99),
+        })
+        rows.append(row)
+    rows.sort(key=lambda row: row['total_ms'], reverse=True)
+    return rows
+
+
+def histogram_labels():
+    return [f"<={bound}ms" for bound in HISTOGRAM_BUCKETS] + [f">{HISTOGRAM_BUCKETS[-1]}ms"]
+
+
+def _timed_template_render(original_render):
+    def render(self, context=None, request=None):
+        profile = _profile.get()
+        if profile is None:
+            return original_render(self, context, request)
+        started = time.perf_counter()
+        try:
+            return original_render(self, context, request)
+        finally:
+            profile['template_ms'] += (time.perf_counter() - started) * 1000
+    render.profiling_wrapped = True
+    return render
+
+
+def _record_query(execute, sql, params, many, context):
+    profile = _profile.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile['queries'] += 1
+        profile['sql_ms'] += (time.perf_counter() - started) * 1000
+
+
+def _install_query_timer(connection, **kwargs):
+    # Connections are per thread; each one gets the timer once and it stays
+    # idle unless a profiled request is running in the current context
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+class ProfilingMiddleware:
+    """Record per-URL-name SQL, template and total timings for each request."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'PROFILING_ENABLED', False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        self.dump_interval = getattr(settings, 'PROFILING_DUMP_INTERVAL', 10)
+        self.last_dump = 0.0
+
+        # Time top-level template renders through the Django template backend
+        from django.template.backends.django import Template
+        if not getattr(Template.render, 'profiling_wrapped', False):
+            Template.render = _timed_template_render(Template.render)
+
+        connection_created.connect(_install_query_timer, dispatch_uid='core.profiling.query_timer')
+        for connection in connections.all(initialized_only=True):
+            _install_query_timer(connection)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        profile = {'queries': 0, 'sql_ms': 0.0, 'template_ms': 0.0}
+        token = _profile.set(profile)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _profile.reset(token)
+        self.record(request, profile, started)
+        return response
+
+    async def __acall__(self, request):
+        profile = {'queries': 0, 'sql_ms': 0.0, 'template_ms': 0.0}
+        token = _profile.set(profile)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _profile.reset(token)
+        self.record(request, profile, started)
+        return response
+
+    def record(self, request, profile, started):
+        total_ms = (time.perf_counter() - started) * 1000
+        match = getattr(request, 'resolver_match', None)
+        view_name = (match.view_name if match else None) or '<unresolved>'
+        registry.record(view_name, total_ms, profile['queries'], profile['sql_ms'], profile['template_ms'])
+
+        now = time.monotonic()
+        if now - self.last_dump >= self.dump_interval:
+            self.last_dump = now
+            try:
+                dump_snapshot()
+            except OSError:
+                pass
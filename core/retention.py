@@ -0,0 +1,84 @@
+# core/retention.py
+"""
+Retention policies that keep the hot Attendance and Payroll tables small.
+
+Rows older than a policy's retention window are moved, in primary-key
+order and one chunk per transaction, into archive tables with the same
+columns (ArchivedAttendance, ArchivedPayroll). Archive rows keep the
+original primary key, so an interrupted run can simply be repeated. The
+archive stays queryable through the read-only admin archive page, and
+employees still see their archived attendance and payslips in their own
+history (core/history.py).
+"""
+
+from datetime import date
+
+from django.conf import settings
+from django.db import transaction
+
+from .models import Attendance, Payroll, ArchivedAttendance, ArchivedPayroll
+
+POLICIES = {
+    'attendance': {
+        'model': Attendance,
+        'archive_model': ArchivedAttendance,
+        'date_field': 'date',
+        'fields': ('id', 'employee_id', 'date', 'clock_in', 'clock_out'),
+        'filters': {},
+        'months_setting': 'RETENTION_ATTENDANCE_MONTHS',
+    },
+    'payroll': {
+        'model': Payroll,
+        'archive_model': ArchivedPayroll,
+        'date_field': 'pay_period_end',
+        'fields': ('id', 'employee_id', 'salary', 'pay_period_start', 'pay_period_end', 'status'),
+        # Only closed periods; pending payroll stays where admins can process it
+        'filters': {'status': 'PAID'},
+        'months_setting': 'RETENTION_PAYROLL_MONTHS',
+    },
+}
+
+
+def months_before(day, months):
+    """First day of the month `months` months before day's month."""
+    month_index = day.year * 12 + day.month - 1 - months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def retention_cutoff(name, months=None, today=None):
+    """Rows dated before this day are archived. Whole months are kept together."""
+    if months is None:
+        months = getattr(settings, POLICIES[name]['months_setting'])
+    return months_before(today or date.today(), months)
+
+
+def archivable(name, cutoff):
+    """Hot-table queryset of the rows the policy would move."""
+    policy = POLICIES[name]
+    return policy['model'].objects.filter(**{f"{policy['date_field']}__lt": cutoff}, **policy['filters'])
+
+
+def archive(name, cutoff, chunk_size=2000, progress=None):
+    """
+    Move every archivable row into the policy's archive table and return how
+    many were moved. progress, if given, is called with the running total
+    after each chunk.
+    """
+    policy = POLICIES[name]
+    archive_model = policy['archive_model']
+    queryset = archivable(name, cutoff).order_by('pk')
+    moved = 0
+    while True:
+        with transaction.atomic():
+            rows = list(queryset.values(*policy['fields'])[:chunk_size])
+            if not rows:
+                break
+            archive_model.objects.bulk_create([archive_model(**row) for row in rows], ignore_conflicts=True)
+            # Nothing references these rows, and the rollups count live and
+            # archived payroll together, so the per-row delete signals are skipped
+            moved_rows = policy['model'].objects.filter(pk__in=[row['id'] for row in rows])
+            moved_rows._raw_delete(moved_rows.db)
+        moved += len(rows)
+        if progress:
+            progress(moved)
+    return moved
@@ -0,0 +1,303 @@
+# core/rollups.py
+"""
+Pre-aggregated reporting tables for the admin reports page.
+
+- PayrollRollup: payroll cost per department per month (pay period end),
+  over live and archived payroll.
+- HeadcountRollup: approved employees per department at each month end,
+  counted by joining date, plus that month's hires.
+- SalaryBandRollup: current salary totals per experience band.
+
+Model signals (core/signals.py) refresh only the buckets a change touches,
+once the surrounding transaction commits. Bulk inserts and raw deletes skip
+those signals, so seed_data, clear_data and the payroll run call in here
+directly, and `python manage.py rebuild_rollups` recomputes everything from
+scratch (run it nightly to catch anything else).
+
+Reports attribute payroll to each employee's current department, since
+department history is not recorded.
+"""
+
+import threading
+from contextlib import contextmanager
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Case, Count, DateField, F, Q, Sum, Value, When
+from django.db.models.functions import Cast, Coalesce, TruncMonth
+from django.utils import timezone
+
+from .models import ArchivedPayroll, Payroll, User, PayrollRollup, HeadcountRollup, SalaryBandRollup
+from .partitions import add_months
+
+EXPERIENCE_BANDS = (
+    ('0-2 years', 0, 2),
+    ('3-5 years', 3, 5),
+    ('6-10 years', 6, 10),
+    ('11-20 years', 11, 20),
+    ('21+ years', 21, None),
+)
+UNKNOWN_BAND = 'Not recorded'
+# User fields the headcount, salary band and payroll department buckets depend on
+EMPLOYEE_ROLLUP_FIELDS = ('department_id', 'experience', 'salary', 'role', 'is_approved', 'date_of_joining')
+BAND_POSITIONS = {label: position for position, (label, _, _) in enumerate(EXPERIENCE_BANDS)}
+BAND_POSITIONS[UNKNOWN_BAND] = len(EXPERIENCE_BANDS)
+
+# Sentinel for "every department" (None already means "no department")
+ALL = object()
+
+_state = threading.local()
+
+
+def month_start(day):
+    return day.replace(day=1)
+
+
+def experience_band(years):
+    if years is None:
+        return UNKNOWN_BAND
+    for label, low, high in EXPERIENCE_BANDS:
+        if years >= low and (high is None or years <= high):
+            return label
+    return UNKNOWN_BAND
+
+
+def _approved_employees():
+    return User.objects.filter(role='EMPLOYEE', is_approved=True)
+
+
+def _department_filter(prefix, department_id):
+    if department_id is ALL:
+        return Q()
+    if department_id is None:
+        return Q(**{f'{prefix}department__isnull': True})
+    return Q(**{f'{prefix}department_id': department_id})
+
+
+# --- Payroll cost ---
+
+def _payroll_rows(month=None, department_id=ALL):
+    """{(month, department id): totals} over live and archived payroll."""
+    lookup = _department_filter('employee__', department_id)
+    if month is not None:
+        lookup &= Q(pay_period_end__gte=month, pay_period_end__lt=add_months(month, 1))
+
+    buckets = {}
+    for model in (Payroll, ArchivedPayroll):
+        rows = (
+            model.objects.filter(lookup)
+            .values(bucket_month=TruncMonth('pay_period_end'), department_id=F('employee__department_id'))
+            .annotate(
+                total=Sum('salary'),
+                paid=Sum('salary', filter=Q(status='PAID')),
+                payslips=Count('id'),
+                # Archiving moves whole months of paid payroll, so an employee
+                # is almost never counted in both tables for one month
+                employees=Count('employee', distinct=True),
+            )
+        )
+        for row in rows:
+            totals = buckets.setdefault((row['bucket_month'], row['department_id']), {
+                'total_cost': Decimal('0'), 'paid_cost': Decimal('0'), 'payslips': 0, 'employees': 0,
+            })
+            totals['total_cost'] += row['total'] or 0
+            totals['paid_cost'] += row['paid'] or 0
+            totals['payslips'] += row['payslips']
+            totals['employees'] += row['employees']
+    return buckets
+
+
+def refresh_payroll(month, department_id=ALL):
+    """Recompute the payroll rollup of one month, for one department or all of them."""
+    month = month_start(month)
+    buckets = _payroll_rows(month, department_id)
+    with transaction.atomic():
+        PayrollRollup.objects.filter(_department_filter('', department_id), month=month).delete()
+        PayrollRollup.objects.bulk_create([
+            PayrollRollup(month=bucket_month, department_id=dept, **totals)
+            for (bucket_month, dept), totals in buckets.items()
+        ])
+
+
+# --- Headcount ---
+
+def _join_month():
+    # date_of_joining is optional; fall back to when the account was created
+    return TruncMonth(Coalesce('date_of_joining', Cast('date_joined', DateField())))
+
+
+def _headcount_rows(department_id=ALL, today=None):
+    """HeadcountRollup instances from the first joining month up to this month."""
+    current_month = month_start(today or timezone.localdate())
+    hires = {}
+    for row in (
+        _approved_employees().filter(_department_filter('', department_id))
+        .values('department_id', joined=_join_month())
+        .annotate(count=Count('id'))
+    ):
+        by_month = hires.setdefault(row['department_id'], {})
+        by_month[row['joined']] = by_month.get(row['joined'], 0) + row['count']
+
+    rollups = []
+    for dept, by_month in hires.items():
+        month = min(by_month)
+        running = 0
+        while month <= current_month:
+            hired = by_month.get(month, 0)
+            running += hired
+            rollups.append(HeadcountRollup(month=month, department_id=dept, headcount=running, hires=hired))
+            month = add_months(month, 1)
+    return rollups
+
+
+def refresh_headcount(department_id=ALL):
+    """Recompute the headcount trend of one department (or all of them)."""
+    rollups = _headcount_rows(department_id)
+    with transaction.atomic():
+        HeadcountRollup.objects.filter(_department_filter('', department_id)).delete()
+        HeadcountRollup.objects.bulk_create(rollups)
+
+
+# --- Salary by experience band ---
+
+def _band_filter(label):
+    if label == UNKNOWN_BAND:
+        return Q(experience__isnull=True)
+    for band, low, high in EXPERIENCE_BANDS:
+        if band == label:
+            return Q(experience__gte=low) & (Q() if high is None else Q(experience__lte=high))
+    raise ValueError(f'Unknown experience band: {label}')
+
+
+def _band_expression():
+    whens = [When(experience__isnull=True, then=Value(UNKNOWN_BAND))]
+    for label, low, high in EXPERIENCE_BANDS:
+        if high is not None:
+            whens.append(When(experience__lte=high, then=Value(label)))
+    return Case(*whens, default=Value(EXPERIENCE_BANDS[-1][0]))
+
+
+def refresh_salary_band(label):
+    """Recompute one experience band."""
+    totals = _approved_employees().filter(_band_filter(label), salary__isnull=False).aggregate(
+        employees=Count('id'), total=Sum('salary'),
+    )
+    SalaryBandRollup.objects.update_or_create(
+        band=label,
+        defaults={
+            'position': BAND_POSITIONS[label],
+            'employees': totals['employees'],
+            'total_salary': totals['total'] or 0,
+        },
+    )
+
+
+def _salary_band_rows():
+    rows = (
+        _approved_employees().filter(salary__isnull=False)
+        .values(band=_band_expression())
+        .annotate(employees=Count('id'), total=Sum('salary'))
+    )
+    found = {row['band']: row for row in rows}
+    return [
+        SalaryBandRollup(
+            band=label,
+            position=position,
+            employees=found.get(label, {}).get('employees', 0),
+            total_salary=found.get(label, {}).get('total') or 0,
+        )
+        for label, position in BAND_POSITIONS.items()
+    ]
+
+
+# --- Full rebuild ---
+
+def rebuild_rollups():
+    """Recompute every rollup table from the source tables. Returns the row counts."""
+    payroll = [
+        PayrollRollup(month=bucket_month, department_id=dept, **totals)
+        for (bucket_month, dept), totals in _payroll_rows().items()
+    ]
+    headcount = _headcount_rows()
+    bands = _salary_band_rows()
+    with transaction.atomic():
+        PayrollRollup.objects.all().delete()
+        HeadcountRollup.objects.all().delete()
+        SalaryBandRollup.objects.all().delete()
+        PayrollRollup.objects.bulk_create(payroll, batch_size=1000)
+        HeadcountRollup.objects.bulk_create(headcount, batch_size=1000)
+        SalaryBandRollup.objects.bulk_create(bands)
+    return {'payroll': len(payroll), 'headcount': len(headcount), 'salary_bands': len(bands)}
+
+
+def schedule_rebuild():
+    """Rebuild every rollup once the current transaction commits."""
+    if not is_suspended():
+        transaction.on_commit(rebuild_rollups)
+
+
+# --- Incremental refresh hooks (called from core/signals.py) ---
+
+@contextmanager
+def suspended():
+    """
+    Skip the incremental refreshes inside the block, for bulk loads that
+    rebuild the rollups once at the end instead of once per saved row.
+    """
+    previous = getattr(_state, 'suspended', False)
+    _state.suspended = True
+    try:
+        yield
+    finally:
+        _state.suspended = previous
+
+
+def is_suspended():
+    return getattr(_state, 'suspended', False)
+
+
+def payroll_changed(pay_period_end, employee_id):
+    """Refresh the bucket a payroll row belongs to once the transaction commits."""
+    if is_suspended():
+        return
+
+    def refresh():
+        department = list(User.objects.filter(pk=employee_id).values_list('department_id', flat=True))
+        # The employee is gone when their payroll was deleted with them
+        refresh_payroll(pay_period_end, department[0] if department else ALL)
+    transaction.on_commit(refresh)
+
+
+def employee_state(user):
+    """The fields of a user the rollups depend on."""
+    return {field: getattr(user, field) for field in EMPLOYEE_ROLLUP_FIELDS}
+
+
+def employee_changed(employee_id, before, after):
+    """
+    Refresh what an employee change touches. before/after are employee_state()
+    dicts (None for a new or deleted row).
+    """
+    if is_suspended() or before == after:
+        return
+    states = [state for state in (before, after) if state is not None]
+    if not any(state['role'] == 'EMPLOYEE' and state['is_approved'] for state in states):
+        return
+    departments = {state['department_id'] for state in states}
+    bands = {experience_band(state['experience']) for state in states}
+    moved = len(states) == 2 and len(departments) == 2
+
+    def refresh():
+        for department_id in departments:
+            refresh_headcount(department_id)
+        for band in bands:
+            refresh_salary_band(band)
+        if moved:
+            # Payroll is reported under the current department, so every
+            # month this employee was paid moves from one bucket to another
+            months = set(Payroll.objects.filter(employee_id=employee_id).dates('pay_period_end', 'month'))
+            months |= set(ArchivedPayroll.objects.filter(employee_id=employee_id).dates('pay_period_end', 'month'))
+            for month in months:
+                for department_id in departments:
+                    refresh_payroll(month, department_id)
+    transaction.on_commit(refresh)
@@ -0,0 +1,191 @@
+# core/rosters.py
+"""
+Expected shifts per employee and day, from the repeating patterns in
+Roster and RosterDay.
+
+Working out one day's shift from the rosters takes a query and a walk over
+the employee's overlapping rosters. Clock-in needs it on every punch and
+the attendance list for every row, so rosters are expanded a month at a
+time into a calendar: a tuple with the shift id (or None) of each day of
+the month. Calendars are cached, and expected_shift() is then one cache
+read and an index into the tuple. The shifts themselves are cached as one
+small dict.
+
+Calendars are cached per employee under a version number, like the salary
+statistics. core/signals.py bumps an employee's version when one of their
+rosters changes (both employees' when a roster is reassigned), and the
+global version when a shift changes. Version bumps only reach other
+processes through a shared cache (REDIS_URL, required by gunicorn.conf.py
+for more than one worker); entries also expire after a few minutes, which
+bounds how long another process's local cache can serve an old roster.
+
+Shift times are local time (settings.TIME_ZONE), as are attendance punches.
+"""
+
+from calendar import monthrange
+from datetime import datetime, timedelta
+
+from django.core.cache import cache
+from django.db.models import Q
+
+from .models import Roster, RosterDay, Shift
+
+ROSTER_CACHE_TIMEOUT = 300
+
+
+def _version_key(scope):
+    return f'rosters:{scope}:version'
+
+
+def _versions(scopes):
+    versions = cache.get_many([_version_key(scope) for scope in scopes])
+    result = {}
+    for scope in scopes:
+        version = versions.get(_version_key(scope))
+        if version is None:
+            version = 1
+            cache.add(_version_key(scope), version, None)
+        result[scope] = version
+    return result
+
+
+def invalidate_rosters(*employee_ids):
+    """
+    Make the cached calendars of the given employees stale. With no
+    arguments (e.g. after a shift changed), everybody's and the shifts.
+    """
+    for scope in [str(employee_id) for employee_id in employee_ids] or ['global']:
+        try:
+            cache.incr(_version_key(scope))
+        except ValueError:
+            cache.set(_version_key(scope), 2, None)
+
+
+def shifts():
+    """{shift id: Shift} for every shift."""
+    key = f"rosters:{_versions(['global'])['global']}:shifts"
+    result = cache.get(key)
+    if result is None:
+        result = {shift.pk: shift for shift in Shift.objects.all()}
+        cache.set(key, result, ROSTER_CACHE_TIMEOUT)
+    return result
+
+
+def expand_month(employee_ids, month):
+    """{employee id: calendar} for the month starting on `month`, read from the database."""
+    last = month.replace(day=monthrange(month.year, month.month)[1])
+    rosters = {}
+    for roster in (
+        Roster.objects.filter(employee_id__in=employee_ids, starts_on__lte=last)
+        .filter(Q(ends_on__isnull=True) | Q(ends_on__gte=month))
+        .order_by('-starts_on', '-id')
+        .values_list('id', 'employee_id', 'starts_on', 'ends_on')
+    ):
+        # Latest start first, so the first active roster of a day wins
+        rosters.setdefault(roster[1], []).append(roster)
+
+    slots = {}
+    for roster_id, position, shift_id in RosterDay.objects.filter(
+        roster_id__in=[roster[0] for employee_rosters in rosters.values() for roster in employee_rosters]
+    ).values_list('roster_id', 'position', 'shift_id'):
+        slots.setdefault(roster_id, {})[position] = shift_id
+    # Positions missing from a cycle are days off
+    cycles = {roster_id: [days.get(position) for position in range(max(days) + 1)] for roster_id, days in slots.items()}
+
+    calendars = {}
+    for employee_id in employee_ids:
+        calendar = []
+        for offset in range(last.day):
+            day = month + timedelta(days=offset)
+            shift_id = None
+            for roster_id, _, starts_on, ends_on in rosters.get(employee_id, ()):
+                if starts_on <= day and (ends_on is None or day <= ends_on):
+                    cycle = cycles.get(roster_id)
+                    if cycle:
+                        shift_id = cycle[(day - starts_on).days % len(cycle)]
+                    break
+            calendar.append(shift_id)
+        calendars[employee_id] = tuple(calendar)
+    return calendars
+
+
+def calendars(pairs):
+    """
+    {(employee id, first of month): calendar} for the given pairs. Only the
+    pairs whose cached calendar is stale are expanded, one query per month.
+    """
+    pairs = set(pairs)
+    versions = _versions(['global', *{str(employee_id) for employee_id, _ in pairs}])
+    keys = {
+        (employee_id, month): f"rosters:{versions['global']}:{employee_id}:{versions[str(employee_id)]}:{month:%Y-%m}"
+        for employee_id, month in pairs
+    }
+    cached = cache.get_many(keys.values())
+    result, stale, missing = {}, {}, {}
+    for pair, key in keys.items():
+        if key in cached:
+            result[pair] = cached[key]
+        else:
+            stale.setdefault(pair[1], []).append(pair[0])
+    for month, employee_ids in stale.items():
+        for employee_id, calendar in expand_month(employee_ids, month).items():
+            result[employee_id, month] = missing[keys[employee_id, month]] = calendar
+    if missing:
+        cache.set_many(missing, ROSTER_CACHE_TIMEOUT)
+    return result
+
+
+def expected_shifts(pairs):
+    """{(employee id, day): Shift or None} for the given pairs."""
+    pairs = list(pairs)
+    months = calendars((employee_id, day.replace(day=1)) for employee_id, day in pairs)
+    by_id = shifts()
+    return {
+        (employee_id, day): by_id.get(months[employee_id, day.replace(day=1)][day.day - 1])
+        for employee_id, day in pairs
+    }
+
+
+def expected_shift(employee_id, day):
+    """The shift the employee is rostered for on `day`; None for a day off or no roster."""
+    return expected_shifts([(employee_id, day)])[employee_id, day]
+
+
+def punch_shift(employee_id, now):
+    """
+    (day, shift) a clock-in at local datetime `now` belongs to. While the
+    previous day's overnight shift is still running that is the previous
+    day, so a late arrival after midnight is not booked as a new day.
+    """
+    today = now.date()
+    yesterday = today - timedelta(days=1)
+    expected = expected_shifts([(employee_id, yesterday), (employee_id, today)])
+    previous = expected[employee_id, yesterday]
+    if previous is not None and previous.crosses_midnight and now.time() < previous.end_time:
+        return yesterday, previous
+    return today, expected[employee_id, today]
+
+
+def assess(shift, day, clock_in, clock_out=None):
+    """
+    {'late_minutes': ..., 'overtime_minutes': ...} of an attendance record
+    for `day` against the shift it was rostered for. Arrivals within the
+    shift's grace period are not late. Times earlier than the shift start
+    on an overnight shift are read as the next morning.
+    """
+    start = datetime.combine(day, shift.start_time)
+    end = datetime.combine(day + timedelta(days=shift.crosses_midnight), shift.end_time)
+    arrived = datetime.combine(day, clock_in)
+    if shift.crosses_midnight and clock_in <= shift.end_time:
+        arrived += timedelta(days=1)
+    late = (arrived - start).total_seconds() // 60
+    result = {
+        'late_minutes': int(late) if late > shift.grace_minutes else 0,
+        'overtime_minutes': 0,
+    }
+    if clock_out is not None:
+        left = datetime.combine(arrived.date(), clock_out)
+        if left < arrived:
+            left += timedelta(days=1)
+        result['overtime_minutes'] = max(int((left - end).total_seconds() // 60), 0)
+    return result
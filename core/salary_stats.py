@@ -0,0 +1,148 @@
+# core/salary_stats.py
+"""
+Salary statistics (count, min, max, mean, median and percentiles) per
+department, overall and per experience band, for compensation reviews.
+
+Salaries are read in one query ordered by salary, so the database does the
+sorting. They are streamed into compact array('d') columns per department
+and band, already in order, and each percentile is then an index lookup
+with linear interpolation (the same definition as numpy's default). No
+model instances are built and nothing is sorted in Python.
+
+Results are cached per department under a version number, like the choice
+lists in core/choices.py. core/signals.py bumps a department's version when
+an employee's salary, experience, department, role or approval changes.
+Bulk loads call invalidate_salary_statistics() to reset every department.
+"""
+
+from array import array
+
+from django.core.cache import cache
+
+from .models import Department, User
+from .rollups import EXPERIENCE_BANDS, UNKNOWN_BAND, experience_band
+
+STATS_CACHE_TIMEOUT = 3600
+PERCENTILES = (10, 25, 50, 75, 90)
+BANDS = [label for label, _, _ in EXPERIENCE_BANDS] + [UNKNOWN_BAND]
+# User fields the statistics depend on
+SALARY_STATS_FIELDS = ('salary', 'experience', 'department_id', 'role', 'is_approved')
+
+
+def percentile(sorted_values, pct):
+    """Linearly interpolated percentile of an ascending sequence."""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(sorted_values):
+    """Count, min, max, mean and PERCENTILES of an ascending sequence of salaries."""
+    count = len(sorted_values)
+    if not count:
+        return {'count': 0, 'min': None, 'max': None, 'mean': None, 'percentiles': {f'p{pct}': None for pct in PERCENTILES}}
+    return {
+        'count': count,
+        'min': round(sorted_values[0], 2),
+        'max': round(sorted_values[-1], 2),
+        'mean': round(sum(sorted_values) / count, 2),
+        'percentiles': {f'p{pct}': round(percentile(sorted_values, pct), 2) for pct in PERCENTILES},
+    }
+
+
+def _salaries(department_id=None, all_departments=False):
+    queryset = User.objects.filter(role='EMPLOYEE', is_approved=True, salary__isnull=False)
+    if not all_departments:
+        queryset = queryset.filter(department_id=department_id)
+    return queryset.order_by('salary').values_list('experience', 'salary')
+
+
+def compute_statistics(department_id=None, all_departments=False):
+    """Statistics for one department (None: employees without one), or for everybody."""
+    overall = array('d')
+    bands = {label: array('d') for label in BANDS}
+    for experience, salary in _salaries(department_id, all_departments).iterator(chunk_size=5000):
+        overall.append(salary)
+        bands[experience_band(experience)].append(salary)
+    return {
+        'overall': summarize(overall),
+        'bands': [{'band': label, **summarize(bands[label])} for label in BANDS],
+    }
+
+
+# --- Cache ---
+
+def _scope(department_id):
+    return 'none' if department_id is None else str(department_id)
+
+
+def _version_key(scope):
+    return f'salary_stats:{scope}:version'
+
+
+def _versions(scopes):
+    versions = cache.get_many([_version_key(scope) for scope in scopes])
+    result = {}
+    for scope in scopes:
+        version = versions.get(_version_key(scope))
+        if version is None:
+            version = 1
+            cache.add(_version_key(scope), version, None)
+        result[scope] = version
+    return result
+
+
+def invalidate_salary_statistics(*department_ids):
+    """
+    Make the cached statistics of the given departments (None for employees
+    without one) and the company-wide figures stale. With no arguments,
+    every department is reset.
+    """
+    if department_ids:
+        scopes = [_scope(department_id) for department_id in department_ids] + ['all']
+    else:
+        scopes = ['global']
+    for scope in scopes:
+        try:
+            cache.incr(_version_key(scope))
+        except ValueError:
+            cache.set(_version_key(scope), 2, None)
+
+
+def department_statistics(department_ids):
+    """
+    {department id: statistics} for the given department ids (None for
+    employees without a department, 'all' for the whole company), computed
+    only for the departments whose cached figures are stale.
+    """
+    scopes = {department_id: ('all' if department_id == 'all' else _scope(department_id)) for department_id in department_ids}
+    versions = _versions(['global', *scopes.values()])
+    keys = {
+        department_id: f"salary_stats:{versions['global']}:{scope}:{versions[scope]}"
+        for department_id, scope in scopes.items()
+    }
+    cached = cache.get_many(keys.values())
+    result, missing = {}, {}
+    for department_id, key in keys.items():
+        if key in cached:
+            result[department_id] = cached[key]
+        else:
+            stats = compute_statistics(None if department_id == 'all' else department_id, all_departments=department_id == 'all')
+            result[department_id] = missing[key] = stats
+    if missing:
+        cache.set_many(missing, STATS_CACHE_TIMEOUT)
+    return result
+
+
+def salary_statistics():
+    """[(label, department id, statistics), ...] for every department, the unassigned employees and the whole company."""
+    departments = list(Department.objects.order_by('name').values_list('pk', 'name'))
+    stats = department_statistics([pk for pk, _ in departments] + [None, 'all'])
+    rows = [(name, pk, stats[pk]) for pk, name in departments]
+    if stats[None]['overall']['count']:
+        rows.append(('Unassigned', None, stats[None]))
+    rows.append(('All departments', 'all', stats['all']))
+    return rows
@@ -0,0 +1,154 @@
+# core/signals.py
+"""
+Cache invalidation hooks for the cached choice lists in core/choices.py,
+the salary statistics in core/salary_stats.py and the roster calendars in
+core/rosters.py, and incremental refreshes of the reporting rollups in
+core/rollups.py.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import rollups
+from .choices import invalidate_choices
+from .rosters import invalidate_rosters
+from .salary_stats import SALARY_STATS_FIELDS, invalidate_salary_statistics
+from .models import Department, Payroll, Roster, RosterDay, Shift, User
+
+# Saves that touch only other fields (e.g. last_login on every login) leave
+# the employee autocomplete results alone
+EMPLOYEE_CHOICE_FIELDS = {'username', 'first_name', 'last_name', 'role', 'is_approved'}
+# Same for the rollups and salary statistics (whose fields are a subset of
+# the rollups'); update_fields name the field, not its column
+EMPLOYEE_ROLLUP_FIELDS = {field.removesuffix('_id') for field in rollups.EMPLOYEE_ROLLUP_FIELDS}
+_UNCHANGED = object()
+
+
+@receiver([post_save, post_delete], sender=Department)
+def department_changed(sender, **kwargs):
+    invalidate_choices('departments')
+
+
+@receiver(post_delete, sender=Department)
+def department_deleted(sender, **kwargs):
+    # Its employees are moved to "no department" by an UPDATE that sends no
+    # signals; departments are rarely deleted, so rebuild everything
+    rollups.schedule_rebuild()
+    transaction.on_commit(invalidate_salary_statistics)
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, update_fields=None, **kwargs):
+    if update_fields is not None and not EMPLOYEE_CHOICE_FIELDS.intersection(update_fields):
+        return
+    invalidate_choices('employees')
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, **kwargs):
+    invalidate_choices('employees')
+
+
+# --- Reporting rollups ---
+
+@receiver(pre_save, sender=User)
+def user_before_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not EMPLOYEE_ROLLUP_FIELDS.intersection(update_fields):
+        instance._rollup_previous = _UNCHANGED
+    elif instance.pk is None:
+        instance._rollup_previous = None
+    else:
+        instance._rollup_previous = User.objects.filter(pk=instance.pk).values(*rollups.EMPLOYEE_ROLLUP_FIELDS).first()
+
+
+@receiver(post_save, sender=User)
+def user_rollups(sender, instance, **kwargs):
+    previous = getattr(instance, '_rollup_previous', _UNCHANGED)
+    if previous is not _UNCHANGED:
+        rollups.employee_changed(instance.pk, previous, rollups.employee_state(instance))
+
+
+@receiver(post_delete, sender=User)
+def user_deleted_rollups(sender, instance, **kwargs):
+    rollups.employee_changed(instance.pk, rollups.employee_state(instance), None)
+
+
+@receiver(pre_save, sender=Payroll)
+def payroll_before_save(sender, instance, **kwargs):
+    instance._rollup_previous = None
+    if instance.pk is not None:
+        instance._rollup_previous = (
+            Payroll.objects.filter(pk=instance.pk).values_list('pay_period_end', 'employee_id').first()
+        )
+
+
+@receiver(post_save, sender=Payroll)
+def payroll_saved(sender, instance, **kwargs):
+    previous = getattr(instance, '_rollup_previous', None)
+    current = (instance.pay_period_end, instance.employee_id)
+    if previous is not None and previous != current:
+        rollups.payroll_changed(*previous)
+    rollups.payroll_changed(*current)
+
+
+@receiver(post_delete, sender=Payroll)
+def payroll_deleted(sender, instance, **kwargs):
+    rollups.payroll_changed(instance.pay_period_end, instance.employee_id)
+
+
+# --- Salary statistics ---
+
+@receiver(post_save, sender=User)
+def user_salary_statistics(sender, instance, **kwargs):
+    # Reuses the previous state captured for the rollups by user_before_save
+    previous = getattr(instance, '_rollup_previous', _UNCHANGED)
+    if previous is _UNCHANGED:
+        return
+    states = [{field: getattr(instance, field) for field in SALARY_STATS_FIELDS}]
+    if previous is not None:
+        states.append({field: previous[field] for field in SALARY_STATS_FIELDS})
+        if states[0] == states[1]:
+            return
+    if not any(state['role'] == 'EMPLOYEE' and state['is_approved'] and state['salary'] is not None for state in states):
+        return
+    departments = {state['department_id'] for state in states}
+    transaction.on_commit(lambda: invalidate_salary_statistics(*departments))
+
+
+@receiver(post_delete, sender=User)
+def user_deleted_salary_statistics(sender, instance, **kwargs):
+    if instance.role == 'EMPLOYEE' and instance.is_approved and instance.salary is not None:
+        department_id = instance.department_id
+        transaction.on_commit(lambda: invalidate_salary_statistics(department_id))
+
+
+# --- Rosters ---
+
+@receiver([post_save, post_delete], sender=Shift)
+def shift_changed(sender, **kwargs):
+    transaction.on_commit(invalidate_rosters)
+
+
+@receiver(pre_save, sender=Roster)
+def roster_before_save(sender, instance, **kwargs):
+    # A roster moved to another employee leaves a stale calendar behind
+    # for the previous one as well
+    instance._previous_employee_id = (
+        Roster.objects.filter(pk=instance.pk).values_list('employee_id', flat=True).first()
+        if instance.pk is not None else None
+    )
+
+
+@receiver([post_save, post_delete], sender=Roster)
+def roster_changed(sender, instance, **kwargs):
+    employee_ids = {instance.employee_id, getattr(instance, '_previous_employee_id', None)} - {None}
+    transaction.on_commit(lambda: invalidate_rosters(*employee_ids))
+
+
+@receiver([post_save, post_delete], sender=RosterDay)
+def roster_day_changed(sender, instance, **kwargs):
+    # Deleting a roster removes its days first; roster_changed covers that
+    employee_id = Roster.objects.filter(pk=instance.roster_id).values_list('employee_id', flat=True).first()
+    if employee_id is not None:
+        transaction.on_commit(lambda: invalidate_rosters(employee_id))
@@ -0,0 +1,213 @@
+# core/tasks.py
+"""
+Database-backed background job queue.
+
+Request handlers call `enqueue()` and return the job id immediately; the
+`run_jobs` management command claims pending jobs and runs the registered
+task function. No external broker is needed, the Job table is the queue.
+"""
+
+import csv
+import io
+import traceback
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.mail import send_mail
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.template.loader import get_template
+from django.utils import timezone
+
+from .models import ArchivedPayroll, Job, Payroll, Leave, User
+from .rollups import refresh_payroll
+
+# Registered task functions, keyed by Job.kind
+TASKS = {}
+
+
+def task(kind):
+    """Register a function as the handler for jobs of the given kind."""
+    def decorator(func):
+        TASKS[kind] = func
+        return func
+    return decorator
+
+
+class TaskResult:
+    """A downloadable file produced by a task."""
+    def __init__(self, content, content_type, filename):
+        self.content = content
+        self.content_type = content_type
+        self.filename = filename
+
+
+def enqueue(kind, payload=None, user=None, max_attempts=None):
+    """Create a pending job and return it without running it."""
+    if kind not in TASKS:
+        raise ValueError(f"Unknown job kind: {kind}")
+    return Job.objects.create(
+        kind=kind,
+        payload=payload or {},
+        created_by=user,
+        max_attempts=max_attempts or getattr(settings, 'JOB_MAX_ATTEMPTS', 3),
+    )
+
+
+def find_or_enqueue(kind, payload, user, fresh_since=None):
+    """
+    Return the user's queued, running or finished job of this kind for the
+    same payload, or enqueue a new one. A succeeded job is only reused if
+    it finished after fresh_since (when its input last changed), so
+    repeated clicks and refreshes do not queue the same work again.
+    """
+    jobs = Job.objects.defer('result').filter(
+        kind=kind,
+        created_by=user,
+        status__in=['PENDING', 'RUNNING', 'SUCCEEDED'],
+        **{f'payload__{key}': value for key, value in payload.items()},
+    ).order_by('-id')
+    for job in jobs[:5]:
+        if job.status != 'SUCCEEDED' or fresh_since is None or job.finished_at >= fresh_since:
+            return job
+    return enqueue(kind, payload, user=user)
+
+
+def claim_next_job():
+    """
+    Atomically mark the oldest runnable job as RUNNING and return it.
+    The conditional UPDATE makes it safe to run several workers at once.
+    """
+    now = timezone.now()
+    candidates = Job.objects.filter(status='PENDING', run_after__lte=now).order_by('id').values_list('id', flat=True)[:10]
+    for job_id in candidates:
+        claimed = Job.objects.filter(pk=job_id, status='PENDING').update(
+            status='RUNNING',
+            started_at=now,
+        )
+        if claimed:
+            return Job.objects.get(pk=job_id)
+    return None
+
+
+def run_job(job):
+    """Execute a claimed job, storing its result or scheduling a retry."""
+    job.attempts += 1
+    try:
+        result = TASKS[job.kind](job)
+    except Exception:
+        job.error = traceback.format_exc()
+        if job.attempts < job.max_attempts:
+            # Exponential backoff: 2s, 4s, 8s, ...
+            job.status = 'PENDING'
+            job.run_after = timezone.now() + timedelta(seconds=2 ** job.attempts)
+        else:
+            job.status = 'FAILED'
+            job.finished_at = timezone.now()
+        job.save(update_fields=['attempts', 'error', 'status', 'run_after', 'finished_at'])
+        return job
+
+    if isinstance(result, TaskResult):
+        job.result = result.content
+        job.result_content_type = result.content_type
+        job.result_filename = result.filename
+    job.status = 'SUCCEEDED'
+    job.error = ''
+    job.finished_at = timezone.now()
+    job.save(update_fields=[
+        'attempts', 'error', 'status', 'finished_at',
+        'result', 'result_content_type', 'result_filename',
+    ])
+    return job
+
+
+def requeue_stale_jobs(timeout):
+    """Put RUNNING jobs whose worker died back into the queue."""
+    cutoff = timezone.now() - timedelta(seconds=timeout)
+    return Job.objects.filter(status='RUNNING', started_at__lt=cutoff).update(status='PENDING')
+
+
+def purge_finished_jobs(days):
+    """Delete succeeded and failed jobs, and their stored results, finished more than `days` days ago."""
+    cutoff = timezone.now() - timedelta(days=days)
+    deleted, _ = Job.objects.filter(status__in=['SUCCEEDED', 'FAILED'], finished_at__lt=cutoff).delete()
+    return deleted
+
+
+# --- Task definitions ---
+
+@task('payslip_pdf')
+def render_payslip_pdf(job):
+    from xhtml2pdf import pisa
+
+    payroll_id = job.payload['payroll_id']
+    payslip = (
+        Payroll.objects.select_related('employee').filter(pk=payroll_id).first()
+        or ArchivedPayroll.objects.select_related('employee').get(pk=payroll_id)
+    )
+    html = get_template('payslip_pdf.html').render({'payslip': payslip})
+    output = io.BytesIO()
+    pisa_status = pisa.CreatePDF(html, dest=output)
+    if pisa_status.err:
+        raise RuntimeError(f"PDF generation failed with {pisa_status.err} errors")
+    return TaskResult(
+        output.getvalue(),
+        'application/pdf',
+        f"payslip_{payslip.employee.username}_{payslip.pay_period_start}.pdf",
+    )
+
+
+@task('payroll_run')
+def run_payroll(job):
+    """
+    Create PENDING payroll records for every approved employee for one pay
+    period and return a CSV report. Employees who already have a record for
+    the period, pending or paid, are skipped, so a retried job does not
+    create duplicates. Two runs racing for the same period are stopped by
+    the unique constraint on (employee, pay period): the later one fails
+    and its retry skips what the other created.
+    """
+    start = job.payload['pay_period_start']
+    end = job.payload['pay_period_end']
+    has_payroll = Payroll.objects.filter(employee=OuterRef('pk'), pay_period_start=start, pay_period_end=end)
+    employees = User.objects.filter(role='EMPLOYEE', is_approved=True).filter(~Exists(has_payroll)).order_by('id')
+
+    report = io.StringIO()
+    writer = csv.writer(report)
+    writer.writerow(['employee', 'username', 'salary', 'pay_period_start', 'pay_period_end'])
+    payrolls = []
+    for employee in employees.iterator():
+        if employee.salary is None:
+            continue
+        monthly_salary = (employee.salary / 12).quantize(Decimal('0.01'))
+        payrolls.append(Payroll(
+            employee=employee,
+            salary=monthly_salary,
+            pay_period_start=start,
+            pay_period_end=end,
+        ))
+        writer.writerow([employee.get_full_name(), employee.username, monthly_salary, start, end])
+
+    with transaction.atomic():
+        Payroll.objects.bulk_create(payrolls, batch_size=500)
+    # bulk_create skips the model signals that keep the reporting rollups current
+    refresh_payroll(date.fromisoformat(end))
+    return TaskResult(report.getvalue().encode(), 'text/csv', f"payroll_run_{start}_{end}.csv")
+
+
+@task('leave_notification')
+def notify_leave_decision(job):
+    leave = Leave.objects.select_related('employee').get(pk=job.payload['leave_id'])
+    if not leave.employee.email:
+        return None
+    send_mail(
+        subject=f"Your leave request has been {leave.get_status_display().lower()}",
+        message=(
+            f"Hello {leave.employee.first_name or leave.employee.username},\n\n"
+            f"Your leave from {leave.start_date} to {leave.end_date} is now {leave.get_status_display()}."
+        ),
+        from_email=None,
+        recipient_list=[leave.employee.email],
+    )
+    return None
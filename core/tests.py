@@ -1,3 +1,908 @@
-from django.test import TestCase
+import statistics
+import warnings
+from datetime import date, datetime, time, timedelta
+from io import StringIO
+from tempfile import TemporaryDirectory
+from threading import Barrier, Lock, Thread
+from unittest import mock, skipIf, skipUnless
 
-# Create your tests here.
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
+from django.apps import apps
+from django.contrib.auth.forms import UserCreationForm
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.core.cache.backends.base import CacheKeyWarning
+from django.db import IntegrityError, connection, connections, transaction
+from django.http import HttpResponse
+from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import ResolverMatch, reverse
+from django.utils import timezone
+
+from . import health, partitions, profiling, retention, rollups
+from .audit import AuditMiddleware, form_changes, record
+from .celebrations import anniversaries, birthdays, daily_digest
+from .choices import employee_search
+from .events import _events_after, publish_event, purge_feed_events
+from .forms import COMPACT_INPUT_CLASS, INPUT_CLASS, AttendanceForm, EmployeeSignUpForm, EmployeeUpdateForm
+from .hashers import HASH_PROFILES, hash_iterations
+from .history import history_page
+from .management.commands.seed_data import Command as SeedDataCommand
+from .models import (
+    Announcement, ArchivedPayroll, Attendance, AuditEvent, Department, FeedEvent, HeadcountRollup, Job, Leave, Payroll,
+    PayrollRollup, Roster, RosterDay, SalaryBandRollup, Shift, User,
+)
+from .rosters import assess, expected_shift, expected_shifts, punch_shift
+from .salary_stats import PERCENTILES, department_statistics, percentile
+from .tasks import enqueue, run_payroll
+from .views.attendance import _punch_in
+from .transitions import TransitionConflict, decide_leave, pay_payroll, transition
+
+
+@skipUnless(connection.vendor == 'postgresql', 'Attendance partitioning is PostgreSQL-only')
+class AttendancePartitionTests(TestCase):
+    """EXPLAIN shows that date-bounded attendance queries only scan the matching partitions."""
+
+    @classmethod
+    def setUpTestData(cls):
+        # Converts the test database's table unless migrate already did
+        partitions.partition_table(connection)
+        cls.today = date.today()
+        cls.last_month = partitions.add_months(cls.today, -1)
+        partitions.ensure_partitions(cls.last_month, cls.today)
+        cls.employee = User.objects.create_user('partitioned', 'partitioned@example.com', 'x', role='EMPLOYEE', is_approved=True)
+        Attendance.objects.create(employee=cls.employee, date=cls.last_month, clock_in=time(9))
+        cls.todays = Attendance.objects.create(employee=cls.employee, date=cls.today, clock_in=time(9))
+
+    def assertScansOnly(self, queryset, partition):
+        plan = queryset.explain()
+        self.assertIn(partition, plan)
+        for name, _, _ in partitions.list_partitions(connection):
+            if name != partition:
+                self.assertNotIn(name, plan)
+
+    def test_table_is_partitioned(self):
+        self.assertTrue(partitions.is_partitioned(connection))
+
+    def test_clock_in_lookup_prunes_to_one_partition(self):
+        queryset = Attendance.objects.filter(employee=self.employee, date=self.today)
+        self.assertScansOnly(queryset, partitions.partition_name(self.today))
+
+    def test_month_range_prunes_to_one_partition(self):
+        queryset = Attendance.objects.filter(employee=self.employee, date__gte=self.today.replace(day=1), date__lte=self.today)
+        self.assertScansOnly(queryset, partitions.partition_name(self.today))
+
+    def test_rows_route_to_partitions_and_keep_ids(self):
+        self.assertEqual(Attendance.objects.get(pk=self.todays.pk).date, self.today)
+        self.assertEqual(Attendance.objects.filter(employee=self.employee).count(), 2)
+
+    def test_stranded_rows_move_out_of_default_partition(self):
+        far_future = partitions.add_months(self.today, 24)
+        Attendance.objects.create(employee=self.employee, date=far_future, clock_in=time(9))
+        partitions.ensure_partitions(far_future, far_future)
+        self.assertScansOnly(Attendance.objects.filter(date=far_future), partitions.partition_name(far_future))
+        self.assertEqual(Attendance.objects.filter(date=far_future).count(), 1)
+
+
+@skipIf(connection.vendor == 'postgresql', 'Covered by AttendancePartitionTests')
+class AttendanceWithoutPartitioningTests(TestCase):
+    def test_other_databases_keep_the_plain_table(self):
+        self.assertFalse(partitions.partition_table(connection))
+        self.assertFalse(partitions.is_partitioned(connection))
+        employee = User.objects.create_user('plain', 'plain@example.com', 'x', role='EMPLOYEE', is_approved=True)
+        Attendance.objects.create(employee=employee, date=date.today(), clock_in=time(9))
+        self.assertEqual(Attendance.objects.filter(date=date.today()).count(), 1)
+
+
+class ClockInTests(TransactionTestCase):
+    """Clock-in through the async view, and concurrent punches that race for the same day."""
+
+    THREADS = 8
+
+    def setUp(self):
+        self.employee = User.objects.create_user('puncher', 'puncher@example.com', 'x', role='EMPLOYEE', is_approved=True)
+
+    def test_clock_in_and_out(self):
+        self.client.force_login(self.employee)
+        response = self.client.get(reverse('clock_in'), follow=True)
+        self.assertContains(response, 'Clocked in successfully.')
+        response = self.client.get(reverse('clock_in'), follow=True)
+        self.assertContains(response, 'You have already clocked in today.')
+        response = self.client.get(reverse('clock_out'), follow=True)
+        self.assertContains(response, 'Clocked out successfully.')
+        attendance = Attendance.objects.get(employee=self.employee)
+        self.assertEqual(attendance.date, timezone.localdate())
+        self.assertIsNotNone(attendance.clock_out)
+
+    def test_concurrent_clock_ins_insert_one_record(self):
+        barrier = Barrier(self.THREADS)
+        results, lock = [], Lock()
+
+        def worker():
+            try:
+                barrier.wait()
+                success, _ = async_to_sync(_punch_in)(self.employee)
+                with lock:
+                    results.append(success)
+            finally:
+                connections.close_all()
+
+        threads = [Thread(target=worker) for _ in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(results), [False] * (self.THREADS - 1) + [True])
+        self.assertEqual(Attendance.objects.filter(employee=self.employee).count(), 1)
+
+
+class StatusTransitionTests(TransactionTestCase):
+    """Concurrent decisions on the same row: exactly one wins, the rest see a conflict."""
+
+    THREADS = 8
+
+    def setUp(self):
+        self.employee = User.objects.create_user('transitions', 'transitions@example.com', 'x', role='EMPLOYEE', is_approved=True)
+
+    def race(self, action, rows):
+        """Run action(pk, attempt) from THREADS threads at once for every row; return the outcomes."""
+        barrier = Barrier(self.THREADS)
+        outcomes, lock = [], Lock()
+
+        def worker(attempt):
+            try:
+                barrier.wait()
+                for pk in rows:
+                    try:
+                        result = action(pk, attempt)
+                    except TransitionConflict as conflict:
+                        result = conflict
+                    with lock:
+                        outcomes.append((pk, attempt, result))
+            finally:
+                connections.close_all()
+
+        threads = [Thread(target=worker, args=(attempt,)) for attempt in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return outcomes
+
+    def test_one_decision_wins_per_leave(self):
+        leaves = [
+            Leave.objects.create(employee=self.employee, start_date=date(2026, 1, day), end_date=date(2026, 1, day), reason='race')
+            for day in range(1, 6)
+        ]
+        # Even attempts approve, odd ones reject
+        outcomes = self.race(
+            lambda pk, attempt: decide_leave(pk, 'APPROVED' if attempt % 2 == 0 else 'REJECTED'),
+            [leave.pk for leave in leaves],
+        )
+        self.assertEqual(len(outcomes), len(leaves) * self.THREADS)
+        for leave in leaves:
+            results = [result for pk, _, result in outcomes if pk == leave.pk]
+            winners = [result for result in results if isinstance(result, Leave)]
+            conflicts = [result for result in results if isinstance(result, TransitionConflict)]
+            self.assertEqual(len(winners), 1)
+            self.assertEqual(len(conflicts), self.THREADS - 1)
+            final = Leave.objects.get(pk=leave.pk).status
+            # The winner's decision is what is stored, and every loser was told about it
+            self.assertEqual(final, winners[0].status)
+            self.assertTrue(all(conflict.current == final for conflict in conflicts))
+
+    def test_payroll_is_paid_once(self):
+        payroll = Payroll.objects.create(
+            employee=self.employee, salary=1000, pay_period_start=date(2026, 1, 1), pay_period_end=date(2026, 1, 31),
+        )
+        outcomes = self.race(lambda pk, attempt: pay_payroll(pk), [payroll.pk])
+        self.assertEqual(sum(isinstance(result, Payroll) for _, _, result in outcomes), 1)
+        self.assertEqual(Payroll.objects.get(pk=payroll.pk).status, 'PAID')
+
+    def test_transition_only_touches_status(self):
+        leave = Leave.objects.create(employee=self.employee, start_date=date(2026, 2, 2), end_date=date(2026, 2, 3), reason='before')
+        # Another request edits the row after this one read it
+        Leave.objects.filter(pk=leave.pk).update(reason='edited elsewhere')
+        decide_leave(leave.pk, 'APPROVED')
+        leave.refresh_from_db()
+        self.assertEqual((leave.status, leave.reason), ('APPROVED', 'edited elsewhere'))
+        with self.assertRaises(TransitionConflict):
+            decide_leave(leave.pk, 'REJECTED')
+        with self.assertRaises(ValueError):
+            transition(Leave, leave.pk, 'PENDING')
+        with self.assertRaises(Leave.DoesNotExist):
+            decide_leave(leave.pk + 1000, 'APPROVED')
+
+
+class RosterTests(TestCase):
+    """Expected shifts come from the repeating roster patterns, including overnight shifts."""
+
+    def setUp(self):
+        self.employee = User.objects.create_user('rostered', 'rostered@example.com', 'x', role='EMPLOYEE', is_approved=True)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.day = Shift.objects.create(name='Day', start_time=time(9), end_time=time(17))
+            self.night = Shift.objects.create(name='Night', start_time=time(22), end_time=time(6))
+            # Two days, two nights, two days off, from Monday 2026-03-02
+            self.roster = Roster.objects.create(employee=self.employee, starts_on=date(2026, 3, 2))
+            for position, shift in enumerate([self.day, self.day, self.night, self.night, None, None]):
+                RosterDay.objects.create(roster=self.roster, position=position, shift=shift)
+
+    def test_pattern_repeats_across_months(self):
+        expected = expected_shifts((self.employee.pk, date(2026, 3, day)) for day in range(1, 32))
+        names = [shift.name if shift else None for _, shift in sorted(expected.items())]
+        self.assertEqual(names[:9], [None, 'Day', 'Day', 'Night', 'Night', None, None, 'Day', 'Day'])
+        # Day 31 of March is day 5 of the sixth cycle; April carries on from there
+        self.assertIsNone(expected[self.employee.pk, date(2026, 3, 31)])
+        self.assertEqual(expected_shift(self.employee.pk, date(2026, 4, 2)).name, 'Day')
+
+    def test_calendar_is_cached_until_the_roster_changes(self):
+        expected_shift(self.employee.pk, date(2026, 3, 2))
+        with self.assertNumQueries(0):
+            self.assertEqual(expected_shift(self.employee.pk, date(2026, 3, 3)), self.day)
+        with self.captureOnCommitCallbacks(execute=True):
+            Roster.objects.create(employee=self.employee, starts_on=date(2026, 3, 3))
+        # The later roster has no days, so it rosters everyone off
+        self.assertIsNone(expected_shift(self.employee.pk, date(2026, 3, 3)))
+        self.assertEqual(expected_shift(self.employee.pk, date(2026, 3, 2)), self.day)
+
+    def test_reassigned_roster_leaves_the_previous_employee(self):
+        other = User.objects.create_user('rostered.other', 'rostered.other@example.com', 'x', role='EMPLOYEE', is_approved=True)
+        self.assertEqual(expected_shift(self.employee.pk, date(2026, 3, 3)), self.day)
+        self.assertIsNone(expected_shift(other.pk, date(2026, 3, 3)))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.roster.employee = other
+            self.roster.save()
+        self.assertIsNone(expected_shift(self.employee.pk, date(2026, 3, 3)))
+        self.assertEqual(expected_shift(other.pk, date(2026, 3, 3)), self.day)
+
+    def test_night_shift_punches(self):
+        # Arriving after midnight belongs to the night shift that started the day before
+        self.assertEqual(punch_shift(self.employee.pk, datetime(2026, 3, 5, 0, 20)), (date(2026, 3, 4), self.night))
+        self.assertEqual(punch_shift(self.employee.pk, datetime(2026, 3, 4, 21, 55)), (date(2026, 3, 4), self.night))
+        self.assertEqual(
+            assess(self.night, date(2026, 3, 4), time(0, 20), time(7, 0)),
+            {'late_minutes': 140, 'overtime_minutes': 60},
+        )
+        self.assertEqual(
+            assess(self.day, date(2026, 3, 3), time(9, 8), time(17, 0)),
+            {'late_minutes': 0, 'overtime_minutes': 0},
+        )
+
+
+class FeedEventTests(TestCase):
+    """Streams see their own and broadcast events; expired events are purged."""
+
+    def setUp(self):
+        self.alice = User.objects.create_user('feed.alice', 'feed.alice@example.com', 'x', role='EMPLOYEE', is_approved=True)
+        self.bob = User.objects.create_user('feed.bob', 'feed.bob@example.com', 'x', role='EMPLOYEE', is_approved=True)
+
+    def test_stream_reads_own_and_broadcast_events(self):
+        broadcast = publish_event('announcement', {'title': 'Hello'})
+        own = publish_event('leave_decision', {'status': 'APPROVED'}, user=self.alice)
+        publish_event('leave_decision', {'status': 'REJECTED'}, user=self.bob)
+        events = async_to_sync(_events_after)(self.alice.pk, broadcast.pk - 1)
+        self.assertEqual([event.pk for event in events], [broadcast.pk, own.pk])
+
+    def test_purge_keeps_events_a_stream_can_still_resume_from(self):
+        old = publish_event('announcement', {'title': 'Old'})
+        recent = publish_event('announcement', {'title': 'Recent'})
+        FeedEvent.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=1))
+        with self.settings(SSE_MAX_DURATION=1800, FEED_RETENTION_MARGIN=3600):
+            self.assertEqual(purge_feed_events(), 1)
+        self.assertEqual(list(FeedEvent.objects.values_list('pk', flat=True)), [recent.pk])
+
+
+class CaseInsensitiveSignupTests(TestCase):
+    """Usernames and emails that differ only by case are rejected, by the form and by the database."""
+
+    def setUp(self):
+        User.objects.create_user('alice', 'alice@example.com', 'x')
+
+    def signup(self, username, email):
+        return EmployeeSignUpForm(data={
+            'username': username, 'email': email, 'first_name': 'A', 'last_name': 'B',
+            'password1': 'secret', 'password2': 'secret',
+        })
+
+    def test_form_rejects_case_variants(self):
+        form = self.signup('ALICE', 'Alice@Example.com')
+        self.assertFalse(form.is_valid())
+        self.assertEqual(set(form.errors), {'username', 'email'})
+        self.assertTrue(self.signup('alice2', 'alice2@example.com').is_valid())
+
+    def test_database_rejects_case_variants(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            User.objects.create_user('Alice', 'other@example.com', 'x')
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            User.objects.create_user('someone', 'ALICE@example.com', 'x')
+        # Blank emails are exempt from the email constraint
+        User.objects.create_user('blank1', '', 'x')
+        User.objects.create_user('blank2', '', 'x')
+
+
+class StyledFormTests(TestCase):
+    """Widget classes are applied once per form class, without leaking into parents or other instances."""
+
+    def test_widgets_are_styled_per_class(self):
+        form = AttendanceForm()
+        self.assertEqual(form.fields['employee'].widget.attrs['class'], INPUT_CLASS)
+        self.assertEqual(form.fields['date'].widget.attrs['class'], INPUT_CLASS)
+        # Meta.widgets keep their own attributes and get the class as well
+        self.assertEqual(form.fields['clock_in'].widget.input_type, 'time')
+        self.assertEqual(form.fields['clock_in'].widget.attrs['class'], INPUT_CLASS)
+        self.assertEqual(EmployeeSignUpForm().fields['username'].widget.attrs['class'], COMPACT_INPUT_CLASS)
+        # The inherited Django form is left alone
+        self.assertNotIn('class', UserCreationForm().fields['username'].widget.attrs)
+
+    def test_instances_do_not_share_widgets(self):
+        first, second = AttendanceForm(), AttendanceForm()
+        first.fields['date'].widget.attrs['class'] = 'changed'
+        self.assertEqual(second.fields['date'].widget.attrs['class'], INPUT_CLASS)
+        self.assertEqual(AttendanceForm.base_fields['date'].widget.attrs['class'], INPUT_CLASS)
+
+
+class ArchivedHistoryTests(TestCase):
+    """Archiving moves rows out of the hot tables but not out of the employee's own history."""
+
+    def setUp(self):
+        self.employee = User.objects.create_user('archived', 'archived@example.com', 'x', role='EMPLOYEE', is_approved=True)
+        self.payrolls = [
+            Payroll.objects.create(
+                employee=self.employee, salary=1000, status='PAID',
+                pay_period_start=date(year, month, 1), pay_period_end=date(year, month, 28),
+            )
+            for year in (2023, 2026) for month in range(1, 9)
+        ]
+        retention.archive('payroll', date(2024, 1, 1))
+
+    def test_payslip_pages_merge_live_and_archived_rows(self):
+        self.assertEqual(ArchivedPayroll.objects.filter(employee=self.employee).count(), 8)
+        rows, cursor = history_page('payslips', self.employee)
+        seen = list(rows)
+        while cursor:
+            rows, cursor = history_page('payslips', self.employee, cursor)
+            seen += rows
+        self.assertEqual([row.pk for row in seen], [payroll.pk for payroll in reversed(self.payrolls)])
+
+    def test_archived_payslip_pdf_can_be_requested(self):
+        self.client.force_login(self.employee)
+        response = self.client.get(reverse('payslip_pdf', args=[self.payrolls[0].pk]))
+        self.assertEqual(response.status_code, 302)
+        # A second click reuses the queued job
+        self.assertEqual(self.client.get(reverse('payslip_pdf', args=[self.payrolls[0].pk])).url, response.url)
+
+
+class CelebrationTests(TestCase):
+    """Birthdays and anniversaries are found through the month/day keys, however the users were created."""
+
+    def test_save_keeps_keys_in_sync(self):
+        user = User.objects.create_user('keys', 'keys@example.com', 'x', birthday=date(1990, 12, 25))
+        self.assertEqual((user.birthday_key, user.anniversary_key), (1225, None))
+        user.date_of_joining = date(2020, 3, 1)
+        user.save(update_fields=['date_of_joining'])
+        user.refresh_from_db()
+        self.assertEqual(user.anniversary_key, 301)
+
+    def test_digest_finds_birthdays_and_anniversaries(self):
+        User.objects.create_user(
+            'celebrated', 'celebrated@example.com', 'x', first_name='Cel', last_name='Ebrated',
+            role='EMPLOYEE', is_approved=True, birthday=date(1990, 5, 15), date_of_joining=date(2021, 5, 15),
+        )
+        digest = daily_digest(date(2026, 5, 15))
+        self.assertEqual([row['name'] for row in digest['birthdays']], ['Cel Ebrated'])
+        self.assertEqual([row['years'] for row in digest['anniversaries']], [5])
+        self.assertEqual(daily_digest(date(2026, 5, 16)), {'birthdays': [], 'anniversaries': []})
+
+    def test_leap_day_is_celebrated_on_february_28_in_common_years(self):
+        User.objects.create_user(
+            'leap', 'leap@example.com', 'x', role='EMPLOYEE', is_approved=True,
+            birthday=date(2000, 2, 29), date_of_joining=date(2024, 2, 29),
+        )
+        self.assertEqual(len(birthdays(date(2026, 2, 28))), 1)
+        self.assertEqual(len(birthdays(date(2028, 2, 28))), 0)
+        self.assertEqual(len(birthdays(date(2028, 2, 29))), 1)
+        self.assertEqual([row['years'] for row in anniversaries(date(2027, 2, 28))], [3])
+
+    def test_seeded_employees_get_keys(self):
+        command = SeedDataCommand(stdout=StringIO())
+        command.batch_size = 100
+        command.create_employees()
+        john = User.objects.get(username='john.doe')
+        self.assertEqual(john.birthday_key, 515)
+        self.assertIn(john.pk, [row['id'] for row in birthdays(date(2026, 5, 15))])
+
+
+class ConditionalGetTests(TestCase):
+    """Employee list pages answer repeat visits with 304 until what they show changes."""
+
+    def setUp(self):
+        self.employee = User.objects.create_user('etag', 'etag@example.com', 'x', role='EMPLOYEE', is_approved=True)
+        self.leave = Leave.objects.create(
+            employee=self.employee, start_date=date(2026, 1, 5), end_date=date(2026, 1, 6), reason='Trip',
+        )
+        self.client.force_login(self.employee)
+        self.url = reverse('leave_history')
+        # The first page view creates the session's CSRF secret, which is
+        # part of the ETag
+        self.client.get(self.url)
+
+    def test_repeat_visit_is_not_modified(self):
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, 200)
+        self.assertTrue(first['ETag'])
+        repeat = self.client.get(self.url, headers={'if-none-match': first['ETag']})
+        self.assertEqual(repeat.status_code, 304)
+        self.assertEqual(repeat.content, b'')
+        self.assertEqual(repeat['ETag'], first['ETag'])
+
+    def test_changes_produce_a_new_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        self.leave.status = 'APPROVED'
+        self.leave.save()
+        response = self.client.get(self.url, headers={'if-none-match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+        etag = response['ETag']
+        self.employee.first_name = 'Renamed'
+        self.employee.save()
+        response = self.client.get(self.url, headers={'if-none-match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_rotated_csrf_token_produces_a_new_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        self.assertEqual(self.client.get(self.url, headers={'if-none-match': etag}).status_code, 304)
+        # Signing in again rotates the CSRF secret kept in the session
+        self.client.logout()
+        self.client.post(reverse('login'), {'username': 'etag', 'password': 'x'})
+        response = self.client.get(self.url, headers={'if-none-match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_other_employees_changes_keep_the_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        other = User.objects.create_user('etag.other', 'etag.other@example.com', 'x', role='EMPLOYEE', is_approved=True)
+        Leave.objects.create(employee=other, start_date=date(2026, 2, 1), end_date=date(2026, 2, 2), reason='Other')
+        self.assertEqual(self.client.get(self.url, headers={'if-none-match': etag}).status_code, 304)
+
+
+class AuditTests(TestCase):
+    """Admin changes are logged with comparable before/after values, in one write per request."""
+
+    def setUp(self):
+        self.hr, self.it = Department.objects.create(name='HR'), Department.objects.create(name='IT')
+        self.admin = User.objects.create_user('audit.admin', 'audit.admin@example.com', 'x', role='ADMIN')
+        self.employee = User.objects.create_user(
+            'audit.employee', 'audit.employee@example.com', 'x', role='EMPLOYEE', is_approved=True,
+            department=self.hr, salary=1000,
+        )
+
+    def edit(self, **changes):
+        data = {
+            'username': self.employee.username, 'first_name': '', 'last_name': '', 'email': self.employee.email,
+            'department': self.hr.pk, 'salary': '1000.00', 'birthday': '', 'experience': '',
+        }
+        return EmployeeUpdateForm(data={**data, **changes}, instance=self.employee)
+
+    def test_foreign_keys_are_logged_as_ids_on_both_sides(self):
+        form = self.edit(department=self.it.pk)
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form_changes(form), {'department': [self.hr.pk, self.it.pk]})
+
+    def test_edit_view_logs_one_event(self):
+        self.client.force_login(self.admin)
+        data = self.edit(department=self.it.pk, salary='1200.00').data
+        response = self.client.post(reverse('admin_edit_employee', args=[self.employee.pk]), data)
+        self.assertEqual(response.status_code, 302)
+        event = AuditEvent.objects.get()
+        self.assertEqual((event.actor, event.verb, event.object_id), (self.admin, 'update', self.employee.pk))
+        self.assertEqual(event.changes, {'department': [self.hr.pk, self.it.pk], 'salary': ['1000.00', '1200.00']})
+
+    def view(self, status):
+        def get_response(request):
+            record(self.admin, 'approve', self.employee)
+            record(self.admin, 'update', self.employee, {'salary': [1, 2]})
+            return HttpResponse(status=status)
+        return get_response
+
+    def assertWrittenInOneInsert(self, call):
+        with CaptureQueriesContext(connection) as queries:
+            call(RequestFactory().get('/'))
+        inserts = [query for query in queries if query['sql'].startswith('INSERT INTO "core_auditevent"')]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(AuditEvent.objects.count(), 2)
+
+    def test_request_events_are_written_in_one_insert(self):
+        self.assertWrittenInOneInsert(AuditMiddleware(self.view(200)))
+
+    def test_async_request_events_are_written_in_one_insert(self):
+        view = self.view(200)
+
+        async def get_response(request):
+            return await sync_to_async(view)(request)
+        self.assertWrittenInOneInsert(async_to_sync(AuditMiddleware(get_response)))
+
+    def test_failed_requests_write_nothing(self):
+        AuditMiddleware(self.view(500))(RequestFactory().get('/'))
+        self.assertFalse(AuditEvent.objects.exists())
+
+
+class EmployeeSearchTests(TestCase):
+    """The autocomplete matches name prefixes case-insensitively, for any term."""
+
+    def setUp(self):
+        for username, first, last in [('zoe.z', 'Zoë', 'Zyl'), ('mary.ann', 'Mary Ann', 'Lee'), ('pct', '50%', 'Off')]:
+            User.objects.create_user(username, f'{username}@example.com', 'x', first_name=first, last_name=last, role='EMPLOYEE', is_approved=True)
+
+    def labels(self, term):
+        return [row['label'] for row in employee_search(term)]
+
+    def test_prefixes_match_case_insensitively(self):
+        self.assertEqual(self.labels('ZY'), ['Zoë Zyl (zoe.z)'])
+        self.assertEqual(self.labels('zoë'), ['Zoë Zyl (zoe.z)'])
+        self.assertEqual(self.labels('z{'), [])
+
+    def test_any_term_is_a_valid_cache_key(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', CacheKeyWarning)
+            self.assertEqual(self.labels('mary a'), ['Mary Ann Lee (mary.ann)'])
+            self.assertEqual(self.labels('50%'), ['50% Off (pct)'])
+            self.assertEqual(self.labels('5%'), [])
+
+
+class PayrollRunTests(TestCase):
+    """A payroll run creates one record per employee and period, however often it runs."""
+
+    def setUp(self):
+        self.paid, self.pending, self.new = [
+            User.objects.create_user(name, f'{name}@example.com', 'x', role='EMPLOYEE', is_approved=True, salary=12000)
+            for name in ('run.paid', 'run.pending', 'run.new')
+        ]
+        self.period = {'pay_period_start': '2026-09-01', 'pay_period_end': '2026-09-30'}
+        Payroll.objects.create(employee=self.paid, salary=1000, status='PAID', **self.period)
+        Payroll.objects.create(employee=self.pending, salary=1000, **self.period)
+
+    def run_payroll(self):
+        return run_payroll(enqueue('payroll_run', self.period))
+
+    def test_employees_with_a_record_are_skipped(self):
+        report = self.run_payroll().content.decode()
+        self.assertIn('run.new', report)
+        self.assertNotIn('run.paid', report)
+        self.assertNotIn('run.pending', report)
+        self.assertEqual(Payroll.objects.get(employee=self.new).salary, 1000)
+        self.run_payroll()
+        self.assertEqual(Payroll.objects.count(), 3)
+
+    def test_database_rejects_a_second_record_for_the_period(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Payroll.objects.create(employee=self.paid, salary=1000, **self.period)
+
+
+class ProfilingTests(TestCase):
+    """Requests are profiled on the sync and async paths, including queries run in sync_to_async threads."""
+
+    def setUp(self):
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(PROFILING_ENABLED=True, PROFILING_DIR=directory.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        profiling.registry.reset()
+        self.addCleanup(profiling.registry.reset)
+
+    def request(self, name):
+        request = RequestFactory().get('/')
+        request.resolver_match = ResolverMatch(lambda request: None, (), {}, url_name=name)
+        return request
+
+    def test_sync_requests_count_their_queries(self):
+        def view(request):
+            User.objects.count()
+            User.objects.exists()
+            return HttpResponse()
+        profiling.ProfilingMiddleware(view)(self.request('sync_view'))
+        stats = profiling.registry.snapshot()['sync_view']
+        self.assertEqual((stats['count'], stats['queries']), (1, 2))
+
+    def test_async_requests_count_queries_run_in_threads(self):
+        async def view(request):
+            await User.objects.acount()
+            return HttpResponse()
+        middleware = profiling.ProfilingMiddleware(view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        async_to_sync(middleware)(self.request('async_view'))
+        stats = profiling.registry.snapshot()['async_view']
+        self.assertEqual((stats['count'], stats['queries']), (1, 1))
+
+    def test_queries_outside_requests_are_not_counted(self):
+        profiling.ProfilingMiddleware(lambda request: HttpResponse())(self.request('empty_view'))
+        User.objects.count()
+        self.assertEqual(profiling.registry.snapshot()['empty_view']['queries'], 0)
+
+
+class RollupTests(TestCase):
+    """Signal-driven rollup refreshes move counts between buckets and agree with a full rebuild."""
+
+    def setUp(self):
+        self.hr, self.it = Department.objects.create(name='HR'), Department.objects.create(name='IT')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.alice = self.employee('roll.alice', self.hr, 60000, 4)
+            self.bob = self.employee('roll.bob', self.it, 48000, 12)
+            self.payroll = Payroll.objects.create(
+                employee=self.alice, salary=5000, pay_period_start=date(2026, 3, 1), pay_period_end=date(2026, 3, 31),
+            )
+            Payroll.objects.create(
+                employee=self.bob, salary=4000, status='PAID', pay_period_start=date(2026, 3, 1), pay_period_end=date(2026, 3, 31),
+            )
+
+    def employee(self, username, department, salary, experience):
+        return User.objects.create_user(
+            username, f'{username}@example.com', 'x', role='EMPLOYEE', is_approved=True,
+            department=department, salary=salary, experience=experience, date_of_joining=date(2025, 1, 10),
+        )
+
+    def payroll_buckets(self):
+        return {
+            row.department_id: (row.total_cost, row.paid_cost, row.payslips)
+            for row in PayrollRollup.objects.filter(month=date(2026, 3, 1))
+        }
+
+    def headcounts(self):
+        month = timezone.localdate().replace(day=1)
+        return dict(HeadcountRollup.objects.filter(month=month).values_list('department_id', 'headcount'))
+
+    def snapshot(self):
+        # A full rebuild also writes the empty salary bands, which the
+        # incremental refresh only creates once an employee enters them
+        return (
+            sorted(PayrollRollup.objects.values_list('month', 'department_id', 'total_cost', 'paid_cost', 'payslips', 'employees')),
+            sorted(HeadcountRollup.objects.values_list('month', 'department_id', 'headcount', 'hires')),
+            sorted(SalaryBandRollup.objects.exclude(employees=0).values_list('band', 'employees', 'total_salary')),
+        )
+
+    def assertMatchesRebuild(self):
+        incremental = self.snapshot()
+        rollups.rebuild_rollups()
+        self.assertEqual(incremental, self.snapshot())
+
+    def test_refresh_waits_for_the_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.payroll.status = 'PAID'
+            self.payroll.save()
+        self.assertEqual(self.payroll_buckets()[self.hr.pk], (5000, 0, 1))
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.payroll_buckets()[self.hr.pk], (5000, 5000, 1))
+
+    def test_department_change_moves_payroll_and_headcount(self):
+        self.assertEqual(self.headcounts(), {self.hr.pk: 1, self.it.pk: 1})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.alice.department = self.it
+            self.alice.save()
+        self.assertEqual(self.payroll_buckets(), {self.it.pk: (9000, 4000, 2)})
+        self.assertEqual(self.headcounts(), {self.it.pk: 2})
+        self.assertMatchesRebuild()
+
+    def test_salary_and_experience_changes_move_bands(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.alice.experience = 15
+            self.alice.salary = 72000
+            self.alice.save()
+        bands = dict(SalaryBandRollup.objects.values_list('band', 'employees'))
+        self.assertEqual((bands['3-5 years'], bands['11-20 years']), (0, 2))
+        self.assertEqual(SalaryBandRollup.objects.get(band='11-20 years').total_salary, 120000)
+        self.assertMatchesRebuild()
+
+    def test_unapproving_and_deleting_employees(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.bob.is_approved = False
+            self.bob.save()
+        self.assertEqual(self.headcounts(), {self.hr.pk: 1})
+        self.assertMatchesRebuild()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.alice.delete()
+        self.assertEqual(self.headcounts(), {})
+        self.assertEqual(self.payroll_buckets(), {self.it.pk: (4000, 4000, 1)})
+        self.assertMatchesRebuild()
+
+    def test_suspended_blocks_skip_incremental_refreshes(self):
+        with self.captureOnCommitCallbacks(execute=True), rollups.suspended():
+            self.employee('roll.carol', self.hr, 30000, 1)
+        self.assertEqual(self.headcounts(), {self.hr.pk: 1, self.it.pk: 1})
+        rollups.rebuild_rollups()
+        self.assertEqual(self.headcounts(), {self.hr.pk: 2, self.it.pk: 1})
+
+
+class SalaryStatisticsTests(TestCase):
+    """Percentiles match the standard library's inclusive quantiles, and cached figures follow salary changes."""
+
+    salaries = (31000, 45000, 52000, 61000, 75000, 90000, 120000)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.it, cls.empty = Department.objects.create(name='IT'), Department.objects.create(name='Empty')
+        cls.employees = [
+            User.objects.create_user(
+                f'stats{index}', f'stats{index}@example.com', 'x', role='EMPLOYEE', is_approved=True,
+                department=cls.it, salary=salary, experience=index,
+            )
+            for index, salary in enumerate(cls.salaries)
+        ]
+        User.objects.create_user('stats.solo', 'stats.solo@example.com', 'x', role='EMPLOYEE', is_approved=True, salary=40000)
+
+    def setUp(self):
+        # Rolled-back rows can reuse ids, so figures cached by another test must not be served
+        cache.clear()
+
+    def expected_percentiles(self, values):
+        quantiles = statistics.quantiles(values, n=100, method='inclusive')
+        return {f'p{pct}': round(quantiles[pct - 1], 2) for pct in PERCENTILES}
+
+    def test_percentiles_match_statistics_quantiles(self):
+        for values in ([1, 2], [3, 1, 4, 1, 5, 9, 2, 6], self.salaries):
+            values = sorted(values)
+            self.assertEqual(
+                {f'p{pct}': round(percentile(values, pct), 2) for pct in PERCENTILES},
+                self.expected_percentiles(values),
+            )
+
+    def test_department_summary(self):
+        stats = department_statistics([self.it.pk])[self.it.pk]['overall']
+        self.assertEqual((stats['count'], stats['min'], stats['max']), (7, 31000, 120000))
+        self.assertEqual(stats['mean'], round(statistics.mean(self.salaries), 2))
+        self.assertEqual(stats['percentiles'], self.expected_percentiles(self.salaries))
+
+    def test_empty_department_and_single_employee(self):
+        stats = department_statistics([self.empty.pk, None])
+        self.assertEqual(stats[self.empty.pk]['overall']['count'], 0)
+        self.assertEqual(set(stats[self.empty.pk]['overall']['percentiles'].values()), {None})
+        solo = stats[None]['overall']
+        self.assertEqual((solo['count'], solo['min'], solo['max'], solo['mean']), (1, 40000, 40000, 40000))
+        self.assertEqual(set(solo['percentiles'].values()), {40000})
+
+    def test_salary_change_invalidates_the_cached_figures(self):
+        department_statistics([self.it.pk, 'all'])
+        with self.assertNumQueries(0):
+            department_statistics([self.it.pk, 'all'])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.employees[0].salary = 200000
+            self.employees[0].save()
+        stats = department_statistics([self.it.pk, 'all'])
+        self.assertEqual(stats[self.it.pk]['overall']['max'], 200000)
+        self.assertEqual(stats['all']['overall']['count'], 8)
+        self.assertEqual(stats['all']['overall']['min'], 40000)
+
+
+class HealthCheckTests(TestCase):
+    """Probes answer before the middleware stack, and readiness reuses its database check for a while."""
+
+    def setUp(self):
+        patcher = mock.patch.dict(health._last_check, {'at': None, 'ok': False})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def failing_database(self):
+        connection = mock.Mock()
+        connection.cursor.side_effect = Exception('database is down')
+        return mock.patch.object(health, 'connection', connection)
+
+    def test_liveness_and_readiness(self):
+        for path in ('/health/', '/ready/'):
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response['Cache-Control'], 'no-store')
+        self.assertEqual(self.client.get('/ready/').json(), {'status': 'ready'})
+
+    def test_unreachable_database_is_not_ready(self):
+        with self.failing_database():
+            response = self.client.get('/ready/')
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(response.json(), {'status': 'unavailable'})
+            # Liveness does not depend on the database
+            self.assertEqual(self.client.get('/health/').status_code, 200)
+
+    def test_result_is_reused_until_the_interval_passes(self):
+        with self.settings(READINESS_CHECK_INTERVAL=5), mock.patch.object(health.time, 'monotonic', return_value=100.0) as clock:
+            self.assertEqual(self.client.get('/ready/').status_code, 200)
+            with self.failing_database():
+                clock.return_value = 104.0
+                self.assertEqual(self.client.get('/ready/').status_code, 200)
+                clock.return_value = 105.0
+                self.assertEqual(self.client.get('/ready/').status_code, 503)
+
+    def test_async_middleware_path(self):
+        async def get_response(request):
+            return HttpResponse('view')
+        middleware = health.HealthCheckMiddleware(get_response)
+        self.assertTrue(iscoroutinefunction(middleware))
+        call = async_to_sync(middleware)
+        self.assertEqual(call(RequestFactory().get('/ready/')).status_code, 200)
+        with self.failing_database():
+            health._last_check['at'] = None
+            self.assertEqual(call(RequestFactory().get('/ready/')).status_code, 503)
+        self.assertEqual(call(RequestFactory().get('/health/')).content, b'{"status": "healthy"}')
+        self.assertEqual(call(RequestFactory().get('/elsewhere/')).content, b'view')
+
+
+class ClearDataTests(TestCase):
+    """clear_data removes the seeded rows and everything that references them, chunk by chunk."""
+
+    def setUp(self):
+        self.department = Department.objects.create(name='Ops')
+        self.admin = User.objects.create_user('clear.admin', 'clear.admin@example.com', 'x', role='ADMIN')
+        self.superuser = User.objects.create_superuser('clear.root', 'clear.root@example.com', 'x')
+        self.shift = Shift.objects.create(name='Day', start_time=time(9), end_time=time(17))
+        for index in range(5):
+            employee = User.objects.create_user(
+                f'clear{index}', f'clear{index}@example.com', 'x', role='EMPLOYEE', is_approved=True,
+                department=self.department, salary=30000,
+            )
+            Leave.objects.create(employee=employee, start_date=date(2026, 1, 5), end_date=date(2026, 1, 6), reason='Trip')
+            Attendance.objects.create(employee=employee, date=date(2026, 1, 7), clock_in=time(9))
+            Payroll.objects.create(employee=employee, salary=2500, pay_period_start=date(2026, 1, 1), pay_period_end=date(2026, 1, 31))
+            ArchivedPayroll.objects.create(
+                id=1000 + index, employee=employee, salary=2500, status='PAID',
+                pay_period_start=date(2020, 1, 1), pay_period_end=date(2020, 1, 31),
+            )
+            roster = Roster.objects.create(employee=employee, starts_on=date(2026, 1, 1))
+            RosterDay.objects.create(roster=roster, position=0, shift=self.shift)
+            Job.objects.create(kind='payslip_pdf', created_by=employee)
+            publish_event('leave_decision', {'status': 'APPROVED'}, user=employee)
+            record(employee, 'update', employee)
+        record(self.admin, 'approve', self.admin)
+        Announcement.objects.create(title='Hello', content='World')
+        publish_event('announcement', {'title': 'Hello'})
+
+    def assertNoOrphans(self):
+        for model in apps.get_app_config('core').get_models():
+            for field in model._meta.concrete_fields:
+                if field.is_relation:
+                    orphans = model._base_manager.exclude(**{f'{field.attname}__isnull': True}).exclude(
+                        **{f'{field.attname}__in': field.related_model._base_manager.values('pk')}
+                    )
+                    self.assertFalse(orphans.exists(), f'{model.__name__}.{field.name} points at deleted rows')
+
+    def test_keep_admin_clears_employees_and_their_rows(self):
+        call_command('clear_data', keep_admin=True, chunk_size=2, stdout=StringIO())
+        self.assertNoOrphans()
+        self.assertEqual(set(User.objects.values_list('username', flat=True)), {'clear.admin', 'clear.root'})
+        for model in (Leave, Attendance, Payroll, ArchivedPayroll, Roster, RosterDay, Announcement, Department):
+            self.assertFalse(model.objects.exists(), model.__name__)
+        self.assertEqual(Job.objects.count(), 0)
+        # Broadcast events and the audit log stay; the log keeps its entries without the deleted actors
+        self.assertEqual(list(FeedEvent.objects.values_list('user', flat=True)), [None])
+        self.assertEqual(AuditEvent.objects.count(), 6)
+        self.assertEqual(AuditEvent.objects.filter(actor=self.admin).count(), 1)
+        self.assertEqual(list(Shift.objects.all()), [self.shift])
+
+    def test_without_keep_admin_only_superusers_remain(self):
+        call_command('clear_data', chunk_size=3, stdout=StringIO())
+        self.assertNoOrphans()
+        self.assertEqual(list(User.objects.all()), [self.superuser])
+        self.assertEqual(AuditEvent.objects.filter(actor__isnull=False).count(), 0)
+
+
+class PasswordHashSettingsTests(TestCase):
+    """Hash cost settings that would weaken stored passwords are refused."""
+
+    def test_profiles_and_explicit_counts(self):
+        with self.settings(PASSWORD_HASH_PROFILE='balanced', PASSWORD_HASH_ITERATIONS=0):
+            self.assertEqual(hash_iterations(), HASH_PROFILES['balanced'])
+        with self.settings(PASSWORD_HASH_ITERATIONS=750_000):
+            self.assertEqual(hash_iterations(), 750_000)
+
+    def test_unknown_profile_is_refused(self):
+        with self.settings(PASSWORD_HASH_PROFILE='stong', PASSWORD_HASH_ITERATIONS=0):
+            with self.assertRaisesMessage(ImproperlyConfigured, "Unknown PASSWORD_HASH_PROFILE 'stong'"):
+                hash_iterations()
+
+    def test_low_iteration_counts_need_debug(self):
+        with self.settings(PASSWORD_HASH_ITERATIONS=1, DEBUG=False):
+            with self.assertRaises(ImproperlyConfigured):
+                hash_iterations()
+        with self.settings(PASSWORD_HASH_ITERATIONS=1, DEBUG=True):
+            self.assertEqual(hash_iterations(), 1)
@@ -0,0 +1,78 @@
+# core/transitions.py
+"""
+Status transitions for leave requests and payroll, as conditional updates.
+
+Loading a row, setting its status and calling save() rewrites every column
+from whatever the process read earlier. Two admins acting on the same row
+would both succeed, and the later one would silently overwrite the first.
+transition() instead issues a single
+
+    UPDATE ... SET status = <target>, updated_at = now()
+    WHERE id = <pk> AND status IN (<allowed sources>)
+
+and looks at the affected row count. Exactly one of several concurrent
+callers matches the row. Everyone else gets TransitionConflict, naming the
+status the winner left behind. No row is locked beyond the UPDATE itself.
+
+QuerySet.update() skips model signals, so the rollups are refreshed here.
+"""
+
+from django.utils import timezone
+
+from .models import Leave, Payroll
+from .rollups import payroll_changed
+
+# {model: {target status: statuses it may be reached from}}
+TRANSITIONS = {
+    Leave: {
+        'APPROVED': ('PENDING',),
+        'REJECTED': ('PENDING',),
+    },
+    Payroll: {
+        'PAID': ('PENDING',),
+    },
+}
+
+
+class TransitionConflict(Exception):
+    """The row was no longer in a status the transition starts from."""
+
+    def __init__(self, model, pk, current, target):
+        self.model = model
+        self.pk = pk
+        self.current = current
+        self.target = target
+        super().__init__(f"{model._meta.verbose_name} {pk} is {current}, so it cannot become {target}")
+
+
+def transition(model, pk, target):
+    """
+    Move one row to `target` if it is still in an allowed source status and
+    return the updated instance. Raises TransitionConflict if another request
+    got there first, model.DoesNotExist if the row is gone, and ValueError
+    for a target the model does not allow.
+    """
+    sources = TRANSITIONS.get(model, {}).get(target)
+    if sources is None:
+        raise ValueError(f"{model.__name__} has no transition to {target!r}")
+    updated = model.objects.filter(pk=pk, status__in=sources).update(status=target, updated_at=timezone.now())
+    if not updated:
+        current = model.objects.filter(pk=pk).values_list('status', flat=True).first()
+        if current is None:
+            raise model.DoesNotExist(f"{model.__name__} {pk} does not exist")
+        raise TransitionConflict(model, pk, current, target)
+    instance = model.objects.get(pk=pk)
+    if model is Payroll:
+        # Paid cost moved between the rollup's totals
+        payroll_changed(instance.pay_period_end, instance.employee_id)
+    return instance
+
+
+def decide_leave(pk, status):
+    """Approve or reject a pending leave request."""
+    return transition(Leave, pk, status)
+
+
+def pay_payroll(pk):
+    """Mark a pending payroll record as paid."""
+    return transition(Payroll, pk, 'PAID')
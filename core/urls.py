@@ -1,47 +1,54 @@
 # core/urls.py
 
 from django.urls import path
-from .views import (
-    HomePageView, 
-    SignUpView, 
-    CustomLoginView, 
-    DashboardRedirectView,
-    AdminDashboardView,
-    EmployeeDashboardView,
-    AboutUsView,
-    ContactUsView,
-    NotApprovedView,
+from .views.pages import HomePageView, AboutUsView, ContactUsView, NotApprovedView
+from .views.accounts import SignUpView, CustomLoginView, DashboardRedirectView
+from .views.dashboards import AdminDashboardView, EmployeeDashboardView, AdminProfilingStatsView
+from .views.reports import AdminReportsView, AdminSalaryStatisticsView, salary_statistics_api
+from .views.employees import (
     AdminEmployeeListView,
     AdminAddEmployeeView,
     AdminEmployeeUpdateView,
     approve_employee,
     reject_employee,
     AdminEmployeeDeleteView,
+    employee_autocomplete,
+)
+from .views.departments import (
     AdminDepartmentListView,
     AdminAddDepartmentView,
     AdminDepartmentUpdateView,
     AdminDepartmentDeleteView,
-    LeaveApplyView,
-    LeaveHistoryView,
-    AdminLeaveManageView,
-    approve_leave,
-    reject_leave,
+)
+from .views.leaves import LeaveApplyView, LeaveHistoryView, AdminLeaveManageView, approve_leave, reject_leave
+from .views.payroll import (
     AdminPayrollListView,
     CreatePayrollView,
     process_payroll,
     EmployeePayslipListView,
     payslip_pdf_view,
+    admin_run_payroll,
+)
+from .views.jobs import job_detail, job_status, job_download
+from .views.attendance import (
     clock_in,
     clock_out,
+    attendance_api,
     EmployeeAttendanceView,
     AdminManageAttendanceView,
     AdminAddAttendanceView,
+)
+from .views.archive import AdminArchiveView
+from .views.audit import AdminAuditLogView
+from .views.announcements import (
     AdminAnnouncementListView,
     AdminAddAnnouncementView,
     AdminAnnouncementUpdateView,
     AdminAnnouncementDeleteView,
     EmployeeAnnouncementListView,
 )
+from .views.events import event_feed
+from .views.history import employee_history_api
 from django.contrib.auth.views import LogoutView
 
 urlpatterns = [
@@ -58,6 +65,10 @@ urlpatterns = [
     path('dashboard/admin/', AdminDashboardView.as_view(), name='admin_dashboard'),
     path('dashboard/employee/', EmployeeDashboardView.as_view(), name='employee_dashboard'),
     path('not-approved/', NotApprovedView.as_view(), name='not_approved'),
+    path('dashboard/admin/profiling/', AdminProfilingStatsView.as_view(), name='admin_profiling_stats'),
+    path('dashboard/admin/reports/', AdminReportsView.as_view(), name='admin_reports'),
+    path('dashboard/admin/reports/salaries/', AdminSalaryStatisticsView.as_view(), name='admin_salary_statistics'),
+    path('dashboard/admin/reports/salaries/api/', salary_statistics_api, name='admin_salary_statistics_api'),
 
     # Admin Employee Management URLs
     path('dashboard/admin/employees/', AdminEmployeeListView.as_view(), name='admin_view_employees'),
@@ -66,6 +77,7 @@ urlpatterns = [
     path('dashboard/admin/employees/delete/<int:pk>/', AdminEmployeeDeleteView.as_view(), name='admin_delete_employee'),
     path('dashboard/admin/employees/approve/<int:pk>/', approve_employee, name='admin_approve_employee'),
     path('dashboard/admin/employees/reject/<int:pk>/', reject_employee, name='admin_reject_employee'),
+    path('dashboard/admin/employees/autocomplete/', employee_autocomplete, name='admin_employee_autocomplete'),
     
      # Admin Department Management URLs
     path('dashboard/admin/departments/', AdminDepartmentListView.as_view(), name='admin_view_departments'),
@@ -88,14 +100,26 @@ urlpatterns = [
     path('dashboard/admin/payroll/process/<int:pk>/', process_payroll, name='admin_process_payroll'),
     path('dashboard/employee/payslips/', EmployeePayslipListView.as_view(), name='employee_payslips'),
     path('dashboard/employee/payslip/<int:pk>/pdf/', payslip_pdf_view, name='payslip_pdf'),
+    path('dashboard/admin/payroll/run/', admin_run_payroll, name='admin_run_payroll'),
+
+    # Background Job URLs
+    path('jobs/<int:pk>/', job_detail, name='job_detail'),
+    path('jobs/<int:pk>/status/', job_status, name='job_status'),
+    path('jobs/<int:pk>/download/', job_download, name='job_download'),
 
     # Attendance Management URLs
     path('dashboard/employee/attendance/', EmployeeAttendanceView.as_view(), name='employee_attendance'),
     path('dashboard/employee/clock-in/', clock_in, name='clock_in'),
     path('dashboard/employee/clock-out/', clock_out, name='clock_out'),
+    path('api/attendance/', attendance_api, name='attendance_api'),
+    path('api/history/<str:name>/', employee_history_api, name='employee_history_api'),
     path('dashboard/admin/attendance/', AdminManageAttendanceView.as_view(), name='admin_manage_attendance'),
     path('dashboard/admin/attendance/add/', AdminAddAttendanceView.as_view(), name='admin_add_attendance'),
 
+    # History Archive URLs
+    path('dashboard/admin/archive/<str:kind>/', AdminArchiveView.as_view(), name='admin_archive'),
+    path('dashboard/admin/audit/', AdminAuditLogView.as_view(), name='admin_audit_log'),
+
     # Announcement Management URLs
     path('dashboard/admin/announcements/', AdminAnnouncementListView.as_view(), name='admin_view_announcements'),
     path('dashboard/admin/announcements/add/', AdminAddAnnouncementView.as_view(), name='admin_add_announcement'),
@@ -103,4 +127,7 @@ urlpatterns = [
     path('dashboard/admin/announcements/delete/<int:pk>/', AdminAnnouncementDeleteView.as_view(), name='admin_delete_announcement'),
     path('dashboard/employee/announcements/', EmployeeAnnouncementListView.as_view(), name='employee_view_announcements'),
 
+    # Live Event Feed (server-sent events, ASGI only)
+    path('events/stream/', event_feed, name='event_feed'),
+
 ]
@@ -0,0 +1,12 @@
+# core/views/__init__.py
+"""
+Views, one module per domain (accounts, dashboards, employees, payroll,
+attendance, ...). core/urls.py imports each view from its module.
+
+Keep heavy, rarely needed libraries out of module level here: gunicorn
+preloads every view module into the master process before forking, so a
+top-level import would be paid by every web worker. The PDF stack
+(xhtml2pdf/ReportLab), for example, is only imported inside the payslip
+job in core/tasks.py. `python manage.py importtime_report --check` fails
+when one of them is loaded at boot.
+"""
@@ -0,0 +1,93 @@
+# core/views/accounts.py
+
+from django import forms
+from django.contrib import messages
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.contrib.auth.views import LoginView
+from django.shortcuts import redirect
+from django.urls import reverse_lazy
+from django.views.generic import TemplateView, CreateView
+
+from ..forms import EmployeeSignUpForm
+
+class SignUpView(CreateView):
+    """
+    View for employee registration.
+    Uses the EmployeeSignUpForm and redirects to the login page on success.
+    """
+    form_class = EmployeeSignUpForm
+    success_url = reverse_lazy('login')
+    template_name = 'signup.html'
+    
+    def form_valid(self, form):
+        """Handle successful form submission."""
+        try:
+            response = super().form_valid(form)
+        except forms.ValidationError as e:
+            # A concurrent signup took the username or email between clean() and save()
+            form.add_error(None, e)
+            return self.form_invalid(form)
+        messages.success(
+            self.request, 
+            'Account created successfully! Please wait for admin approval before you can log in.'
+        )
+        return response
+    
+    def form_invalid(self, form):
+        """Handle form validation errors."""
+        # Add a general error message
+        messages.error(
+            self.request, 
+            'Please correct the errors below and try again.'
+        )
+        return super().form_invalid(form)
+
+class CustomLoginView(LoginView):
+    """
+    Custom login view that checks for employee approval.
+    """
+    template_name = 'login.html'
+    redirect_authenticated_user = True
+
+    def get_success_url(self):
+        return reverse_lazy('dashboard_redirect')
+    
+    def form_valid(self, form):
+        """Check if user is approved after successful authentication."""
+        response = super().form_valid(form)
+        user = form.get_user()
+        
+        # Check if user is approved
+        if hasattr(user, 'is_approved') and not user.is_approved:
+            # Log out the user and redirect to not_approved page
+            from django.contrib.auth import logout
+            logout(self.request)
+            messages.error(
+                self.request,
+                'Your account is not approved yet. Please wait for admin approval.'
+            )
+            return redirect('login')
+        
+        return response
+    
+    def form_invalid(self, form):
+        """Handle invalid login attempts."""
+        # Add error message for invalid credentials
+        messages.error(
+            self.request,
+            'Invalid username or password. Please check your credentials and try again.'
+        )
+        return super().form_invalid(form)
+
+class DashboardRedirectView(LoginRequiredMixin, TemplateView):
+    """
+    Redirects users to their respective dashboards based on their role.
+    """
+    def get(self, request, *args, **kwargs):
+        if request.user.is_superuser or request.user.role == 'ADMIN':
+            return redirect('admin_dashboard')
+        elif request.user.role == 'EMPLOYEE':
+            if not request.user.is_approved:
+                return redirect('not_approved')
+            return redirect('employee_dashboard')
+        return redirect('home') 
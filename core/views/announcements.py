@@ -0,0 +1,61 @@
+# core/views/announcements.py
+
+from django.urls import reverse_lazy
+from django.views.generic import CreateView, ListView, UpdateView, DeleteView
+
+from ..announcements import unread_announcement_count, mark_announcements_seen, invalidate_unread_counts
+from ..events import publish_event
+from ..forms import AnnouncementForm
+from ..models import Announcement
+from .mixins import AdminRequiredMixin, ConditionalGetMixin, EmployeeRequiredMixin
+
+# --- Announcement Management ---
+class AdminAnnouncementListView(AdminRequiredMixin, ListView):
+    model = Announcement
+    template_name = 'admin_view_announcements.html'
+    context_object_name = 'announcements'
+
+class AdminAddAnnouncementView(AdminRequiredMixin, CreateView):
+    model = Announcement
+    form_class = AnnouncementForm
+    template_name = 'admin_add_announcement.html'
+    success_url = reverse_lazy('admin_view_announcements')
+
+    def form_valid(self, form):
+        response = super().form_valid(form)
+        invalidate_unread_counts()
+        publish_event('announcement.created', {'id': self.object.pk, 'title': self.object.title})
+        return response
+
+class AdminAnnouncementUpdateView(AdminRequiredMixin, UpdateView):
+    model = Announcement
+    form_class = AnnouncementForm
+    template_name = 'admin_edit_announcement.html'
+    success_url = reverse_lazy('admin_view_announcements')
+
+class AdminAnnouncementDeleteView(AdminRequiredMixin, DeleteView):
+    model = Announcement
+    template_name = 'admin_delete_announcement.html'
+    success_url = reverse_lazy('admin_view_announcements')
+
+    def form_valid(self, form):
+        response = super().form_valid(form)
+        invalidate_unread_counts()
+        return response
+
+class EmployeeAnnouncementListView(EmployeeRequiredMixin, ConditionalGetMixin, ListView):
+    model = Announcement
+    template_name = 'employee_view_announcements.html'
+    context_object_name = 'announcements'
+    ordering = ['-created_at']
+    paginate_by = 10
+
+    def get_fingerprint_queryset(self):
+        return Announcement.objects.all()
+
+    def get(self, request, *args, **kwargs):
+        response = super().get(request, *args, **kwargs)
+        # Viewing the list marks everything as read; skip the UPDATE when nothing is unread
+        if unread_announcement_count(request.user):
+            mark_announcements_seen(request.user)
+        return response
@@ -0,0 +1,52 @@
+# core/views/archive.py
+
+from django.db.models import Q
+from django.http import Http404
+from django.views.generic import ListView
+
+from ..models import ArchivedAttendance, ArchivedPayroll
+from .mixins import AdminRequiredMixin
+
+# --- History Archive ---
+class AdminArchiveView(AdminRequiredMixin, ListView):
+    """
+    Read-only view of the attendance and payroll rows that `archive_history`
+    moved out of the hot tables.
+    """
+    template_name = 'admin_archive.html'
+    context_object_name = 'records'
+    paginate_by = 15
+    # kind -> (archive model, date field used for filtering and ordering)
+    ARCHIVES = {
+        'attendance': (ArchivedAttendance, 'date'),
+        'payroll': (ArchivedPayroll, 'pay_period_end'),
+    }
+
+    def get_queryset(self):
+        if self.kwargs['kind'] not in self.ARCHIVES:
+            raise Http404('Unknown archive')
+        model, date_field = self.ARCHIVES[self.kwargs['kind']]
+        queryset = model.objects.select_related('employee').order_by(f'-{date_field}', '-id')
+
+        employee_search = self.request.GET.get('employee')
+        if employee_search:
+            queryset = queryset.filter(
+                Q(employee__first_name__icontains=employee_search) |
+                Q(employee__last_name__icontains=employee_search) |
+                Q(employee__username__icontains=employee_search)
+            )
+        start_date = self.request.GET.get('start_date')
+        if start_date:
+            queryset = queryset.filter(**{f'{date_field}__gte': start_date})
+        end_date = self.request.GET.get('end_date')
+        if end_date:
+            queryset = queryset.filter(**{f'{date_field}__lte': end_date})
+        return queryset
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['kind'] = self.kwargs['kind']
+        context['current_employee'] = self.request.GET.get('employee', '')
+        context['current_start_date'] = self.request.GET.get('start_date', '')
+        context['current_end_date'] = self.request.GET.get('end_date', '')
+        return context
@@ -0,0 +1,210 @@
+# core/views/attendance.py
+
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.db import IntegrityError
+from django.db.models import Q
+from django.http import JsonResponse
+from django.shortcuts import redirect
+from django.urls import reverse_lazy
+from django.utils import timezone
+from django.views.generic import CreateView, ListView, TemplateView
+
+from ..audit import form_changes, record
+from ..forms import AttendanceForm
+from ..models import Attendance
+from ..rosters import assess, expected_shift, expected_shifts, punch_shift
+from .mixins import AdminRequiredMixin, ConditionalGetMixin, EmployeeRequiredMixin, EmployeePickerMixin, HistoryPageMixin
+
+# --- Attendance Management ---
+# Clock-in/clock-out are tiny I/O-bound views that spike hard at shift start,
+# so they are async and use Django's async ORM. Under WSGI Django runs them
+# in a thread via async_to_sync; under the ASGI profile (SERVER_MODE=asgi in
+# start.sh) they run on the event loop without tying up a worker thread.
+
+# Punches use local time, like the shift times they are judged against
+# (core/rosters.py). The expected shift comes from a cached calendar, so it
+# adds no query to a punch once the employee's month has been expanded.
+
+async def _punch_in(user):
+    """Record the clock-in for ``user``'s current shift day. Returns (success, message)."""
+    now = timezone.localtime()
+    day, shift = await sync_to_async(punch_shift)(user.pk, now)
+    # Insert straight away and let the unique (employee, date) constraint
+    # reject a second punch: an exists() check first would race under load
+    try:
+        await Attendance.objects.acreate(
+            employee=user,
+            date=day,
+            clock_in=now.time()
+        )
+    except IntegrityError:
+        return False, 'You have already clocked in today.'
+    late = assess(shift, day, now.time())['late_minutes'] if shift else 0
+    if late:
+        return True, f'Clocked in {late} minutes late for the {shift.name} shift.'
+    return True, 'Clocked in successfully.'
+
+async def _punch_out(user):
+    """Record the clock-out for ``user``'s open attendance. Returns (success, message)."""
+    now = timezone.localtime()
+    today = now.date()
+    attendance = await Attendance.objects.filter(employee=user, date=today).afirst()
+    if attendance is None:
+        # Still open from yesterday's overnight shift
+        yesterday = today - timedelta(days=1)
+        shift = await sync_to_async(expected_shift)(user.pk, yesterday)
+        if shift is not None and shift.crosses_midnight:
+            attendance = await Attendance.objects.filter(employee=user, date=yesterday, clock_out__isnull=True).afirst()
+    if attendance is None:
+        return False, 'You have not clocked in today.'
+    if attendance.clock_out:
+        return False, 'You have already clocked out today.'
+    attendance.clock_out = now.time()
+    await attendance.asave(update_fields=['clock_out', 'updated_at'])
+    shift = await sync_to_async(expected_shift)(user.pk, attendance.date)
+    overtime = assess(shift, attendance.date, attendance.clock_in, attendance.clock_out)['overtime_minutes'] if shift else 0
+    if overtime:
+        return True, f'Clocked out with {overtime} minutes of overtime.'
+    return True, 'Clocked out successfully.'
+
+@login_required
+async def clock_in(request):
+    user = await request.auser()
+    if not user.role == 'EMPLOYEE':
+        return redirect('admin_dashboard')
+    success, message = await _punch_in(user)
+    if success:
+        messages.success(request, message)
+    else:
+        messages.error(request, message)
+    return redirect('employee_attendance')
+
+@login_required
+async def clock_out(request):
+    user = await request.auser()
+    if not user.role == 'EMPLOYEE':
+        return redirect('admin_dashboard')
+    success, message = await _punch_out(user)
+    if success:
+        messages.success(request, message)
+    else:
+        messages.error(request, message)
+    return redirect('employee_attendance')
+
+@login_required
+async def attendance_api(request):
+    """
+    JSON attendance API for the current employee.
+    GET returns today's record; POST with action=clock_in/clock_out punches.
+    """
+    user = await request.auser()
+    if not user.role == 'EMPLOYEE':
+        return JsonResponse({'error': 'Only employees can record attendance.'}, status=403)
+
+    if request.method == 'POST':
+        action = request.POST.get('action')
+        if action == 'clock_in':
+            success, message = await _punch_in(user)
+        elif action == 'clock_out':
+            success, message = await _punch_out(user)
+        else:
+            return JsonResponse({'error': 'Unknown action.'}, status=400)
+        return JsonResponse({'success': success, 'message': message}, status=200 if success else 409)
+
+    today = timezone.localdate()
+    attendance = await Attendance.objects.filter(employee=user, date=today).afirst()
+    return JsonResponse({
+        'date': today.isoformat(),
+        'clock_in': attendance.clock_in.isoformat() if attendance else None,
+        'clock_out': attendance.clock_out.isoformat() if attendance and attendance.clock_out else None,
+    })
+
+class EmployeeAttendanceView(EmployeeRequiredMixin, ConditionalGetMixin, HistoryPageMixin, TemplateView):
+    template_name = 'employee_attendance.html'
+    history_name = 'attendance'
+
+    def get_fingerprint_queryset(self):
+        return Attendance.objects.filter(employee=self.request.user)
+
+class AdminManageAttendanceView(AdminRequiredMixin, ListView):
+    model = Attendance
+    template_name = 'admin_manage_attendance.html'
+    context_object_name = 'attendance_records'
+    paginate_by = 15
+    ordering = ['-date', '-clock_in']
+    
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        
+        # Filter by employee name/username
+        employee_search = self.request.GET.get('employee')
+        if employee_search:
+            queryset = queryset.filter(
+                Q(employee__first_name__icontains=employee_search) |
+                Q(employee__last_name__icontains=employee_search) |
+                Q(employee__username__icontains=employee_search)
+            )
+        
+        # Filter by date range - start date
+        start_date = self.request.GET.get('start_date')
+        if start_date:
+            queryset = queryset.filter(date__gte=start_date)
+        
+        # Filter by date range - end date
+        end_date = self.request.GET.get('end_date')
+        if end_date:
+            queryset = queryset.filter(date__lte=end_date)
+        
+        # Filter by attendance status (present/absent)
+        status = self.request.GET.get('status')
+        if status:
+            if status == 'present':
+                queryset = queryset.filter(clock_in__isnull=False)
+            elif status == 'absent':
+                # For absent, we need to check if there's no attendance record for that date
+                # This is more complex and might need a different approach
+                pass
+        
+        return queryset
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        
+        # Add filter choices
+        context['status_choices'] = [
+            ('', 'All Records'),
+            ('present', 'Present'),
+            ('absent', 'Absent'),
+        ]
+        
+        # Add current filter values
+        context['current_employee'] = self.request.GET.get('employee', '')
+        context['current_start_date'] = self.request.GET.get('start_date', '')
+        context['current_end_date'] = self.request.GET.get('end_date', '')
+        context['current_status'] = self.request.GET.get('status', '')
+
+        # Judge this page's records against the shifts they were rostered for
+        records = context['attendance_records']
+        expected = expected_shifts((attendance.employee_id, attendance.date) for attendance in records)
+        for attendance in records:
+            attendance.shift = expected[attendance.employee_id, attendance.date]
+            attendance.assessment = (
+                assess(attendance.shift, attendance.date, attendance.clock_in, attendance.clock_out) if attendance.shift else None
+            )
+        
+        return context
+
+class AdminAddAttendanceView(AdminRequiredMixin, EmployeePickerMixin, CreateView):
+    model = Attendance
+    form_class = AttendanceForm
+    template_name = 'admin_add_attendance.html'
+    success_url = reverse_lazy('admin_manage_attendance')
+
+    def form_valid(self, form):
+        response = super().form_valid(form)
+        record(self.request.user, 'create', self.object, form_changes(form))
+        return response
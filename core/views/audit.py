@@ -0,0 +1,44 @@
+# core/views/audit.py
+
+from django.views.generic import TemplateView
+
+from ..audit import MODELS, VERBS
+from ..models import AuditEvent
+from .mixins import AdminRequiredMixin
+
+# --- Audit Log ---
+class AdminAuditLogView(AdminRequiredMixin, TemplateView):
+    """
+    Newest-first audit events, filterable by actor, verb, model and object
+    id. Pages are keyset-paginated on the id (?before=<id of the last row
+    shown>), so older pages cost the same as the first however long the
+    log grows.
+    """
+    template_name = 'admin_audit_log.html'
+    page_size = 50
+    FILTERS = ('actor', 'verb', 'model', 'object_id')
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        filters = {name: self.request.GET.get(name, '').strip() for name in self.FILTERS}
+        queryset = AuditEvent.objects.select_related('actor').order_by('-id')
+        if filters['actor']:
+            queryset = queryset.filter(actor__username__iexact=filters['actor'])
+        if filters['verb']:
+            queryset = queryset.filter(verb=filters['verb'])
+        if filters['model']:
+            queryset = queryset.filter(model=filters['model'])
+        if filters['object_id'].isdigit():
+            queryset = queryset.filter(object_id=filters['object_id'])
+        before = self.request.GET.get('before', '')
+        if before.isdigit():
+            queryset = queryset.filter(id__lt=before)
+
+        events = list(queryset[:self.page_size + 1])
+        context['events'] = events[:self.page_size]
+        context['next_before'] = events[self.page_size - 1].pk if len(events) > self.page_size else None
+        context['filters'] = filters
+        context['paged'] = before.isdigit()
+        context['verbs'] = VERBS
+        context['models'] = MODELS
+        return context
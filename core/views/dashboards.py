@@ -0,0 +1,87 @@
+# core/views/dashboards.py
+
+from django.conf import settings
+from django.utils import timezone
+from django.views.generic import TemplateView
+
+from ..announcements import unread_announcement_count
+from ..celebrations import daily_digest
+from ..models import Department, User, Leave, Payroll, Attendance, Announcement
+from ..profiling import load_snapshots, merge_snapshots, histogram_labels
+from .mixins import AdminRequiredMixin, EmployeeRequiredMixin
+
+class AdminDashboardView(AdminRequiredMixin, TemplateView):
+    """
+    Displays the admin dashboard with dynamic stats.
+    """
+    template_name = 'admin_dashboard.html'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        today = timezone.localdate()
+        current_month = today.month
+        current_year = today.year
+
+        # First row stats
+        context['total_employees'] = User.objects.filter(role='EMPLOYEE', is_approved=True).count()
+        context['on_leave_today'] = Leave.objects.filter(start_date__lte=today, end_date__gte=today, status='APPROVED').count()
+        context['total_departments'] = Department.objects.count()
+        context['pending_leave_approvals'] = Leave.objects.filter(status='PENDING').count()
+
+        # Second row stats
+        context['present_today'] = Attendance.objects.filter(date=today, clock_in__isnull=False).count()
+        context['total_announcements'] = Announcement.objects.count()
+        context['approved_leave_month'] = Leave.objects.filter(status='APPROVED', start_date__year=current_year, start_date__month=current_month).count()
+        context['pending_payrolls'] = Payroll.objects.filter(status='PENDING').count()
+
+        context['today'] = today
+        return context
+
+class EmployeeDashboardView(EmployeeRequiredMixin, TemplateView):
+    """
+    Displays the employee dashboard with dynamic, personalized stats.
+    """
+    template_name = 'employee_dashboard.html'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        employee = self.request.user
+        today = timezone.localdate()
+        current_month = today.month
+        current_year = today.year
+
+        context['pending_leaves'] = Leave.objects.filter(employee=employee, status='PENDING').count()
+        context['approved_leaves_month'] = Leave.objects.filter(
+            employee=employee, 
+            status='APPROVED', 
+            start_date__year=current_year, 
+            start_date__month=current_month
+        ).count()
+        # A plain date range (rather than __month) lets Postgres prune to this month's partition
+        context['attendance_month'] = Attendance.objects.filter(
+            employee=employee,
+            date__gte=today.replace(day=1),
+            date__lte=today,
+        ).count()
+        context['unread_announcements'] = unread_announcement_count(employee)
+        context['celebrations'] = daily_digest(today)
+        context['today'] = today
+        return context
+
+
+class AdminProfilingStatsView(AdminRequiredMixin, TemplateView):
+    """
+    Shows per-view SQL, template and latency stats collected by
+    ProfilingMiddleware across all worker processes.
+    """
+    template_name = 'admin_profiling_stats.html'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['profiling_enabled'] = settings.PROFILING_ENABLED
+        stats = merge_snapshots(load_snapshots())
+        labels = histogram_labels()
+        for row in stats:
+            row['histogram_pairs'] = list(zip(labels, row['histogram']))
+        context['stats'] = stats
+        return context
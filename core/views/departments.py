@@ -0,0 +1,31 @@
+# core/views/departments.py
+
+from django.urls import reverse_lazy
+from django.views.generic import CreateView, ListView, UpdateView, DeleteView
+
+from ..forms import DepartmentForm
+from ..models import Department
+from .mixins import AdminRequiredMixin
+
+# --- Admin Department Management ---
+class AdminDepartmentListView(AdminRequiredMixin, ListView):
+    model = Department
+    template_name = 'admin_view_departments.html'
+    context_object_name = 'departments'
+
+class AdminAddDepartmentView(AdminRequiredMixin, CreateView):
+    model = Department
+    form_class = DepartmentForm
+    template_name = 'admin_add_department.html'
+    success_url = reverse_lazy('admin_view_departments')
+
+class AdminDepartmentUpdateView(AdminRequiredMixin, UpdateView):
+    model = Department
+    form_class = DepartmentForm
+    template_name = 'admin_edit_department.html'
+    success_url = reverse_lazy('admin_view_departments')
+
+class AdminDepartmentDeleteView(AdminRequiredMixin, DeleteView):
+    model = Department
+    template_name = 'admin_delete_department.html'
+    success_url = reverse_lazy('admin_view_departments')
@@ -0,0 +1,119 @@
+# core/views/employees.py
+
+import logging
+
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.shortcuts import redirect, get_object_or_404
+from django.urls import reverse_lazy
+from django.views.generic import CreateView, ListView, UpdateView, DeleteView
+
+from ..audit import field_changes, form_changes, record
+from ..choices import employee_search
+from ..forms import EmployeeSignUpForm, EmployeeUpdateForm
+from ..models import User
+from .mixins import AdminRequiredMixin
+
+logger = logging.getLogger(__name__)
+
+# --- Admin Employee Management ---
+def employee_snapshot(employee):
+    """What the audit log keeps of an employee who is removed."""
+    return {
+        'username': employee.username,
+        'email': employee.email,
+        'department': str(employee.department) if employee.department_id else None,
+    }
+
+class AdminEmployeeListView(AdminRequiredMixin, ListView):
+    model = User
+    template_name = 'admin_view_employees.html'
+    context_object_name = 'employees'
+    paginate_by = 15
+    ordering = ['-id']  # Newest first
+
+    def get_queryset(self):
+        return User.objects.filter(role='EMPLOYEE').order_by('-id')
+
+class AdminAddEmployeeView(AdminRequiredMixin, CreateView):
+    form_class = EmployeeSignUpForm
+    template_name = 'admin_add_employee.html'
+    success_url = reverse_lazy('admin_view_employees')
+
+    def form_valid(self, form):
+        """Handle successful form submission."""
+        try:
+            form.instance.is_approved = True
+            response = super().form_valid(form)
+            messages.success(
+                self.request, 
+                f'Employee "{form.instance.username}" has been added successfully!'
+            )
+            return response
+        except Exception as e:
+            logger.exception('Could not add employee %s', form.cleaned_data.get('username'))
+            messages.error(
+                self.request, 
+                f'Error adding employee: {str(e)}'
+            )
+            return self.form_invalid(form)
+    
+    def form_invalid(self, form):
+        """Handle form validation errors."""
+        # Add a general error message
+        messages.error(
+            self.request, 
+            'Please correct the errors below and try again.'
+        )
+        return super().form_invalid(form)
+    
+class AdminEmployeeUpdateView(AdminRequiredMixin, UpdateView):
+    model = User
+    form_class = EmployeeUpdateForm
+    template_name = 'admin_edit_employee.html'
+    success_url = reverse_lazy('admin_view_employees')
+
+    def form_valid(self, form):
+        response = super().form_valid(form)
+        if form.changed_data:
+            record(self.request.user, 'update', self.object, form_changes(form))
+        return response
+
+@login_required
+def approve_employee(request, pk):
+    if not (request.user.is_superuser or request.user.role == 'ADMIN'):
+        return redirect('employee_dashboard')
+    employee = get_object_or_404(User, pk=pk)
+    if not employee.is_approved:
+        employee.is_approved = True
+        employee.save()
+        record(request.user, 'approve', employee, {'is_approved': [False, True]})
+    return redirect('admin_view_employees')
+
+@login_required
+def reject_employee(request, pk):
+    if not (request.user.is_superuser or request.user.role == 'ADMIN'):
+        return redirect('employee_dashboard')
+    employee = get_object_or_404(User, pk=pk)
+    record(request.user, 'reject', employee, field_changes(employee_snapshot(employee), {}))
+    employee.delete()
+    return redirect('admin_view_employees')
+
+class AdminEmployeeDeleteView(AdminRequiredMixin, DeleteView):
+    model = User
+    template_name = 'admin_delete_employee.html'
+    success_url = reverse_lazy('admin_view_employees')
+
+    def form_valid(self, form):
+        employee = self.object
+        # Recorded while the row still has its pk; dropped if the delete fails
+        record(self.request.user, 'delete', employee, field_changes(employee_snapshot(employee), {}))
+        return super().form_valid(form)
+
+@login_required
+def employee_autocomplete(request):
+    """JSON prefix search over approved employees for the employee pickers."""
+    if not (request.user.is_superuser or request.user.role == 'ADMIN'):
+        return JsonResponse({'error': 'Only admins can search employees.'}, status=403)
+    return JsonResponse({'results': employee_search(request.GET.get('q', ''))})
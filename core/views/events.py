@@ -0,0 +1,27 @@
+# core/views/events.py
+
+from django.contrib.auth.decorators import login_required
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, StreamingHttpResponse
+
+from ..events import event_stream
+
+# --- Live Event Feed ---
+@login_required
+async def event_feed(request):
+    """
+    Server-sent events stream of new announcements and the user's leave
+    decisions. Only served under ASGI; a WSGI worker would be held for the
+    whole connection, so there the client is told not to reconnect (204).
+    """
+    user = await request.auser()
+    if not isinstance(request, ASGIRequest):
+        return HttpResponse(status=204)
+    try:
+        last_id = int(request.headers.get('Last-Event-ID', ''))
+    except ValueError:
+        last_id = None
+    response = StreamingHttpResponse(event_stream(user.pk, last_id), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,30 @@
+# core/views/history.py
+
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.template.loader import render_to_string
+
+from ..history import HISTORIES, group_by_month, history_page
+
+# --- Employee History ---
+@login_required
+def employee_history_api(request, name):
+    """
+    The next page of one of the employee's history lists after ?cursor=,
+    as table rows ready to append, plus the cursor for the page after it.
+    """
+    if request.user.role != 'EMPLOYEE' or not request.user.is_approved:
+        return JsonResponse({'error': 'Only approved employees have a history.'}, status=403)
+    if name not in HISTORIES:
+        return JsonResponse({'error': 'Unknown history.'}, status=404)
+    cursor = request.GET.get('cursor') or None
+    try:
+        rows, next_cursor = history_page(name, request.user, cursor)
+    except ValueError:
+        return JsonResponse({'error': 'Invalid cursor.'}, status=400)
+    html = render_to_string(
+        HISTORIES[name]['rows_template'],
+        {'history_groups': group_by_month(name, rows, cursor)},
+        request=request,
+    )
+    return JsonResponse({'html': html, 'count': len(rows), 'next': next_cursor})
@@ -0,0 +1,55 @@
+# core/views/jobs.py
+
+from django.contrib.auth.decorators import login_required
+from django.http import HttpResponse, JsonResponse, Http404
+from django.shortcuts import render, get_object_or_404
+from django.urls import reverse
+
+from ..models import Job
+
+# --- Background Jobs ---
+def _get_job_for_user(request, pk):
+    """Jobs are visible to the user who queued them and to admins."""
+    job = get_object_or_404(Job.objects.defer('result'), pk=pk)
+    is_admin = request.user.is_superuser or request.user.role == 'ADMIN'
+    if not is_admin and job.created_by_id != request.user.pk:
+        raise Http404('No job found matching the query')
+    return job
+
+@login_required
+def job_detail(request, pk):
+    job = _get_job_for_user(request, pk)
+    is_admin = request.user.is_superuser or request.user.role == 'ADMIN'
+    context = {
+        'job': job,
+        'base_template': 'base_admin.html' if is_admin else 'base_employee.html',
+    }
+    return render(request, 'job_detail.html', context)
+
+@login_required
+def job_status(request, pk):
+    """JSON status endpoint for polling a queued job."""
+    job = _get_job_for_user(request, pk)
+    data = {
+        'id': job.pk,
+        'kind': job.kind,
+        'status': job.status,
+        'attempts': job.attempts,
+        'max_attempts': job.max_attempts,
+        'created_at': job.created_at.isoformat(),
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+        'download_url': None,
+    }
+    if job.status == 'SUCCEEDED' and job.result_filename:
+        data['download_url'] = reverse('job_download', args=[job.pk])
+    return JsonResponse(data)
+
+@login_required
+def job_download(request, pk):
+    job = _get_job_for_user(request, pk)
+    if job.status != 'SUCCEEDED' or not job.result_filename:
+        raise Http404('This job has no downloadable result yet')
+    content = Job.objects.filter(pk=job.pk).values_list('result', flat=True).get()
+    response = HttpResponse(bytes(content), content_type=job.result_content_type)
+    response['Content-Disposition'] = f'attachment; filename="{job.result_filename}"'
+    return response
@@ -0,0 +1,144 @@
+# core/views/leaves.py
+
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.db import models
+from django.http import Http404
+from django.shortcuts import redirect
+from django.urls import reverse_lazy
+from django.views.generic import CreateView, ListView, TemplateView
+
+from ..audit import record
+from ..events import publish_event
+from ..forms import LeaveForm
+from ..models import Leave
+from ..tasks import enqueue
+from ..transitions import TransitionConflict, decide_leave
+from .mixins import AdminRequiredMixin, ConditionalGetMixin, EmployeeRequiredMixin, HistoryPageMixin
+
+# --- Employee Leave Management ---
+class LeaveApplyView(EmployeeRequiredMixin, CreateView):
+    model = Leave
+    form_class = LeaveForm
+    template_name = 'leave_apply.html'
+    success_url = reverse_lazy('leave_history')
+
+    def form_valid(self, form):
+        form.instance.employee = self.request.user
+        return super().form_valid(form)
+
+class LeaveHistoryView(EmployeeRequiredMixin, ConditionalGetMixin, HistoryPageMixin, TemplateView):
+    template_name = 'leave_history.html'
+    history_name = 'leaves'
+
+    def get_fingerprint_queryset(self):
+        return Leave.objects.filter(employee=self.request.user)
+
+# --- Admin Leave Management ---
+class AdminLeaveManageView(AdminRequiredMixin, ListView):
+    model = Leave
+    template_name = 'admin_manage_leaves.html'
+    context_object_name = 'leaves'
+    paginate_by = 15
+    ordering = ['-id']  # Newest first (by ID, which is auto-incrementing)
+    
+    def get_queryset(self):
+        queryset = Leave.objects.select_related('employee').order_by('-id')
+        
+        # Filter by status
+        status = self.request.GET.get('status')
+        if status and status in ['PENDING', 'APPROVED', 'REJECTED']:
+            queryset = queryset.filter(status=status)
+        
+        # Filter by employee name
+        employee_name = self.request.GET.get('employee')
+        if employee_name:
+            queryset = queryset.filter(
+                models.Q(employee__first_name__icontains=employee_name) |
+                models.Q(employee__last_name__icontains=employee_name) |
+                models.Q(employee__username__icontains=employee_name)
+            )
+        
+        # Filter by date range
+        start_date = self.request.GET.get('start_date')
+        end_date = self.request.GET.get('end_date')
+        
+        if start_date:
+            try:
+                from datetime import datetime
+                start_date_obj = datetime.strptime(start_date, '%Y-%m-%d').date()
+                queryset = queryset.filter(start_date__gte=start_date_obj)
+            except ValueError:
+                pass  # Invalid date format, ignore filter
+        
+        if end_date:
+            try:
+                from datetime import datetime
+                end_date_obj = datetime.strptime(end_date, '%Y-%m-%d').date()
+                queryset = queryset.filter(end_date__lte=end_date_obj)
+            except ValueError:
+                pass  # Invalid date format, ignore filter
+        
+        return queryset
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        
+        # Add filter values to context for form persistence
+        context['current_status'] = self.request.GET.get('status', '')
+        context['current_employee'] = self.request.GET.get('employee', '')
+        context['current_start_date'] = self.request.GET.get('start_date', '')
+        context['current_end_date'] = self.request.GET.get('end_date', '')
+        
+        # Add status choices for filter dropdown
+        context['status_choices'] = [
+            ('', 'All Statuses'),
+            ('PENDING', 'Pending'),
+            ('APPROVED', 'Approved'),
+            ('REJECTED', 'Rejected'),
+        ]
+        
+        return context
+
+def publish_leave_decision(leave):
+    publish_event(
+        f'leave.{leave.status.lower()}',
+        {
+            'id': leave.pk,
+            'status': leave.status,
+            'start_date': leave.start_date.isoformat(),
+            'end_date': leave.end_date.isoformat(),
+        },
+        user=leave.employee,
+    )
+
+def apply_leave_decision(request, pk, status):
+    """
+    Apply an admin's decision only if the request is still pending. If
+    another admin decided first, their decision stands and this one is
+    reported as a conflict instead of overwriting it.
+    """
+    try:
+        leave = decide_leave(pk, status)
+    except Leave.DoesNotExist:
+        raise Http404('No leave request matches the given query.')
+    except TransitionConflict as conflict:
+        messages.warning(request, f'Leave request #{pk} was already {conflict.current.lower()}; your decision was not applied.')
+        return redirect('admin_manage_leaves')
+    record(request.user, 'approve' if status == 'APPROVED' else 'reject', leave, {'status': ['PENDING', status]})
+    enqueue('leave_notification', {'leave_id': leave.pk}, user=request.user)
+    publish_leave_decision(leave)
+    messages.success(request, f'Leave request #{pk} {status.lower()}.')
+    return redirect('admin_manage_leaves')
+
+@login_required
+def approve_leave(request, pk):
+    if not (request.user.is_superuser or request.user.role == 'ADMIN'):
+        return redirect('employee_dashboard')
+    return apply_leave_decision(request, pk, 'APPROVED')
+
+@login_required
+def reject_leave(request, pk):
+    if not (request.user.is_superuser or request.user.role == 'ADMIN'):
+        return redirect('employee_dashboard')
+    return apply_leave_decision(request, pk, 'REJECTED')
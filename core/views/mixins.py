@@ -0,0 +1,146 @@
+# core/views/mixins.py
+
+import hashlib
+
+from django import forms
+from django.conf import settings
+from django.contrib import messages
+from django.contrib.auth.mixins import AccessMixin
+from django.db.models import Count, Max
+from django.shortcuts import redirect
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+from ..choices import employee_label
+from ..history import group_by_month, history_page
+from ..models import User
+
+# --- Custom Mixins for Role-Based Access ---
+
+class AdminRequiredMixin(AccessMixin):
+    """Verify that the current user is an admin or superuser."""
+    def dispatch(self, request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+        if not (request.user.is_superuser or request.user.role == 'ADMIN'):
+            return redirect('employee_dashboard')
+        return super().dispatch(request, *args, **kwargs)
+
+class EmployeeRequiredMixin(AccessMixin):
+    """Verify that the current user is an approved employee."""
+    def dispatch(self, request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+        if request.user.is_superuser or request.user.role == 'ADMIN':
+            return redirect('admin_dashboard')
+        if not request.user.is_approved:
+            return redirect('not_approved')
+        return super().dispatch(request, *args, **kwargs)
+
+class RedirectLoggedInUserMixin(AccessMixin):
+    """Redirects logged-in users from public pages to their dashboard."""
+    def dispatch(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            if request.user.is_superuser or request.user.role == 'ADMIN':
+                return redirect('admin_dashboard')
+            else:
+                return redirect('employee_dashboard')
+        return super().dispatch(request, *args, **kwargs)
+
+class EmployeePickerMixin:
+    """
+    Render a form's employee field as a hidden input driven by the employee
+    autocomplete, instead of a <select> holding every approved employee.
+    """
+    def get_form(self, form_class=None):
+        form = super().get_form(form_class)
+        field = form.fields['employee']
+        field.queryset = User.objects.filter(role='EMPLOYEE', is_approved=True)
+        field.widget = forms.HiddenInput()
+        return form
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        # Label for the current selection when the form is re-rendered with errors
+        selected = context['form']['employee'].value()
+        context['selected_employee_label'] = ''
+        if selected and str(selected).isdigit():
+            employee = User.objects.filter(pk=selected).values_list('first_name', 'last_name', 'username').first()
+            if employee:
+                context['selected_employee_label'] = employee_label(*employee)
+        return context
+
+
+class ConditionalGetMixin:
+    """
+    Answer a repeat visit with 304 Not Modified, before the page's queries
+    run or its template renders, while the data it shows is unchanged.
+
+    get_fingerprint_queryset() returns the rows the page lists. Their count
+    and latest updated_at come from one aggregate on an (employee,
+    updated_at) index. The ETag combines them with the URL, the signed-in
+    user's profile (shown in the header), the CSRF secret (a token derived
+    from it is embedded in the logout form) and settings.PAGE_CACHE_RELEASE.
+    The secret is read from request.META['CSRF_COOKIE'], where
+    CsrfViewMiddleware puts it whether it is kept in a cookie or, with
+    CSRF_USE_SESSIONS, in the session; get_token() would return a freshly
+    masked token on every call. Validation always goes
+    through the ETag; Last-Modified is sent for information only, because
+    profile edits carry no timestamp.
+    """
+    # User fields rendered by the employee base template
+    profile_fields = ('username', 'email', 'first_name', 'last_name', 'department_id', 'salary', 'birthday', 'experience')
+
+    def get_fingerprint_queryset(self):
+        raise NotImplementedError('ConditionalGetMixin requires get_fingerprint_queryset()')
+
+    def get_validators(self):
+        """(ETag, latest updated_at) for the current request."""
+        fingerprint = self.get_fingerprint_queryset().order_by().aggregate(count=Count('pk'), latest=Max('updated_at'))
+        user = self.request.user
+        parts = [
+            settings.PAGE_CACHE_RELEASE,
+            self.request.get_full_path(),
+            self.request.META.get('CSRF_COOKIE', ''),
+            fingerprint['count'],
+            fingerprint['latest'].isoformat() if fingerprint['latest'] else '',
+            *(str(getattr(user, field)) for field in self.profile_fields),
+            user.department.name if user.department_id else '',
+        ]
+        return quote_etag(hashlib.md5(repr(parts).encode()).hexdigest()), fingerprint['latest']
+
+    def get(self, request, *args, **kwargs):
+        # A page carrying a one-off flash message must be rendered, and must
+        # not be cached under an ETag that later visits would match
+        if len(messages.get_messages(request)):
+            response = super().get(request, *args, **kwargs)
+            patch_cache_control(response, private=True, no_cache=True)
+            return response
+
+        etag, last_modified = self.get_validators()
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        response.headers['ETag'] = etag
+        if last_modified:
+            response.headers['Last-Modified'] = http_date(last_modified.timestamp())
+        # Private per user, and revalidated on every visit
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ('Cookie',))
+        return response
+
+
+class HistoryPageMixin:
+    """
+    First page of one of the employee history lists in core/history.py,
+    grouped by month, plus the cursor the "load more" button continues from.
+    """
+    history_name = None
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        rows, next_cursor = history_page(self.history_name, self.request.user)
+        context['history_name'] = self.history_name
+        context['history_groups'] = group_by_month(self.history_name, rows)
+        context['next_cursor'] = next_cursor
+        return context
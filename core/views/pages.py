@@ -0,0 +1,33 @@
+# core/views/pages.py
+
+from django.shortcuts import redirect
+from django.views.generic import TemplateView
+
+from .mixins import RedirectLoggedInUserMixin
+
+# --- Static Pages ---
+class HomePageView(RedirectLoggedInUserMixin, TemplateView):
+    template_name = 'home.html'
+
+class AboutUsView(RedirectLoggedInUserMixin, TemplateView):
+    template_name = 'about.html'
+
+class ContactUsView(RedirectLoggedInUserMixin, TemplateView):
+    template_name = 'contact.html'
+
+class NotApprovedView(TemplateView):
+    template_name = 'not_approved.html'
+    
+    def dispatch(self, request, *args, **kwargs):
+        """Ensure only unapproved users can access this view."""
+        if not request.user.is_authenticated:
+            return redirect('login')
+        if request.user.is_approved:
+            return redirect('dashboard_redirect')
+        return super().dispatch(request, *args, **kwargs)
+    
+    def get_context_data(self, **kwargs):
+        """Add user information to context."""
+        context = super().get_context_data(**kwargs)
+        context['user'] = self.request.user
+        return context
@@ -0,0 +1,146 @@
+# core/views/payroll.py
+
+from datetime import datetime
+
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.db.models import Q
+from django.http import Http404
+from django.shortcuts import redirect, get_object_or_404
+from django.urls import reverse_lazy
+from django.views.generic import CreateView, ListView, TemplateView
+
+from ..audit import form_changes, record
+from ..forms import PayrollForm
+from ..models import ArchivedPayroll, Payroll
+from ..tasks import enqueue, find_or_enqueue
+from ..transitions import TransitionConflict, pay_payroll
+from .mixins import AdminRequiredMixin, ConditionalGetMixin, EmployeeRequiredMixin, EmployeePickerMixin, HistoryPageMixin
+
+# --- Payroll Management ---
+class AdminPayrollListView(AdminRequiredMixin, ListView):
+    model = Payroll
+    template_name = 'admin_manage_payroll.html'
+    context_object_name = 'payrolls'
+    paginate_by = 15
+    ordering = ['-id']
+    
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        
+        # Filter by status
+        status = self.request.GET.get('status')
+        if status:
+            queryset = queryset.filter(status=status)
+        
+        # Filter by employee name/username
+        employee_search = self.request.GET.get('employee')
+        if employee_search:
+            queryset = queryset.filter(
+                Q(employee__first_name__icontains=employee_search) |
+                Q(employee__last_name__icontains=employee_search) |
+                Q(employee__username__icontains=employee_search)
+            )
+        
+        # Filter by pay period start date
+        start_date = self.request.GET.get('start_date')
+        if start_date:
+            queryset = queryset.filter(pay_period_start__gte=start_date)
+        
+        # Filter by pay period end date
+        end_date = self.request.GET.get('end_date')
+        if end_date:
+            queryset = queryset.filter(pay_period_end__lte=end_date)
+        
+        return queryset
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        
+        # Add filter choices
+        context['status_choices'] = [
+            ('', 'All Status'),
+            ('PENDING', 'Pending'),
+            ('PAID', 'Paid'),
+        ]
+        
+        # Add current filter values
+        context['current_status'] = self.request.GET.get('status', '')
+        context['current_employee'] = self.request.GET.get('employee', '')
+        context['current_start_date'] = self.request.GET.get('start_date', '')
+        context['current_end_date'] = self.request.GET.get('end_date', '')
+        
+        return context
+
+class CreatePayrollView(AdminRequiredMixin, EmployeePickerMixin, CreateView):
+    model = Payroll
+    form_class = PayrollForm
+    template_name = 'admin_create_payroll.html'
+    success_url = reverse_lazy('admin_manage_payroll')
+
+    def form_valid(self, form):
+        response = super().form_valid(form)
+        record(self.request.user, 'create', self.object, form_changes(form))
+        return response
+
+@login_required
+def process_payroll(request, pk):
+    if not (request.user.is_superuser or request.user.role == 'ADMIN'):
+        return redirect('employee_dashboard')
+    try:
+        payroll = pay_payroll(pk)
+    except Payroll.DoesNotExist:
+        raise Http404('No payroll matches the given query.')
+    except TransitionConflict as conflict:
+        messages.warning(request, f'Payroll #{pk} was already {conflict.current.lower()}; nothing was changed.')
+    else:
+        record(request.user, 'pay', payroll, {'status': ['PENDING', 'PAID']})
+        messages.success(request, f'Payroll #{pk} marked as paid.')
+    return redirect('admin_manage_payroll')
+
+class EmployeePayslipListView(EmployeeRequiredMixin, ConditionalGetMixin, HistoryPageMixin, TemplateView):
+    template_name = 'employee_payslips.html'
+    history_name = 'payslips'
+
+    def get_fingerprint_queryset(self):
+        return Payroll.objects.filter(employee=self.request.user)
+    
+@login_required
+def payslip_pdf_view(request, pk):
+    """
+    Queue the payslip PDF for rendering by the job worker instead of running
+    pisa.CreatePDF inline, then send the employee to the job page to wait.
+    """
+    if not request.user.role == 'EMPLOYEE':
+        return redirect('admin_dashboard')
+    payslip = Payroll.objects.filter(pk=pk, employee=request.user).first()
+    if payslip is None:
+        # Archived payslips stay downloadable; they no longer change
+        payslip = get_object_or_404(ArchivedPayroll, pk=pk, employee=request.user)
+    # Another click while the PDF renders, or later, reuses the same job
+    job = find_or_enqueue('payslip_pdf', {'payroll_id': payslip.pk}, request.user, fresh_since=getattr(payslip, 'updated_at', None))
+    return redirect('job_detail', pk=job.pk)
+
+@login_required
+def admin_run_payroll(request):
+    """Queue a payroll run for every approved employee for one pay period."""
+    if not (request.user.is_superuser or request.user.role == 'ADMIN'):
+        return redirect('employee_dashboard')
+    if request.method != 'POST':
+        return redirect('admin_manage_payroll')
+    try:
+        start = datetime.strptime(request.POST.get('pay_period_start', ''), '%Y-%m-%d').date()
+        end = datetime.strptime(request.POST.get('pay_period_end', ''), '%Y-%m-%d').date()
+    except ValueError:
+        messages.error(request, 'Please provide a valid pay period.')
+        return redirect('admin_manage_payroll')
+    if end < start:
+        messages.error(request, 'The pay period end must not be before its start.')
+        return redirect('admin_manage_payroll')
+    job = enqueue(
+        'payroll_run',
+        {'pay_period_start': start.isoformat(), 'pay_period_end': end.isoformat()},
+        user=request.user,
+    )
+    messages.success(request, f'Payroll run queued as job #{job.pk}.')
+    return redirect('job_detail', pk=job.pk)
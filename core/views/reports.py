@@ -0,0 +1,105 @@
+# core/views/reports.py
+
+from django.contrib.auth.decorators import login_required
+from django.db import models
+from django.http import JsonResponse
+from django.utils import timezone
+from django.views.generic import TemplateView
+
+from ..models import Department, PayrollRollup, HeadcountRollup, SalaryBandRollup
+from ..rollups import add_months
+from ..salary_stats import PERCENTILES, department_statistics, salary_statistics
+from .mixins import AdminRequiredMixin
+
+class AdminReportsView(AdminRequiredMixin, TemplateView):
+    """
+    Monthly payroll cost, headcount trend and salary bands. Reads only the
+    rollup tables maintained by core/rollups.py, never the payroll or user
+    tables themselves.
+    """
+    template_name = 'admin_reports.html'
+    months = 12
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        this_month = timezone.localdate().replace(day=1)
+        months = [add_months(this_month, offset) for offset in range(1 - self.months, 1)]
+        departments = {None: 'Unassigned', **dict(Department.objects.values_list('id', 'name'))}
+
+        # Payroll cost pivot: one row per department, one column per month
+        costs = {}
+        for rollup in PayrollRollup.objects.filter(month__gte=months[0], month__lte=this_month):
+            costs.setdefault(rollup.department_id, {})[rollup.month] = rollup.total_cost
+        cost_rows = [
+            {
+                'department': departments.get(dept, 'Unassigned'),
+                'costs': [by_month.get(month, 0) for month in months],
+                'total': sum(by_month.values()),
+            }
+            for dept, by_month in costs.items()
+        ]
+        cost_rows.sort(key=lambda row: row['department'])
+        context['cost_rows'] = cost_rows
+        context['cost_totals'] = [sum(row['costs'][i] for row in cost_rows) for i in range(len(months))]
+
+        # Headcount trend over all departments
+        trend = {
+            row['month']: row
+            for row in HeadcountRollup.objects.filter(month__gte=months[0], month__lte=this_month)
+            .values('month').annotate(headcount=models.Sum('headcount'), hires=models.Sum('hires'))
+        }
+        context['headcount_trend'] = [
+            {'month': month, 'headcount': trend.get(month, {}).get('headcount') or 0, 'hires': trend.get(month, {}).get('hires') or 0}
+            for month in months
+        ]
+
+        context['months'] = months
+        context['salary_bands'] = SalaryBandRollup.objects.order_by('position')
+        context['refreshed_at'] = max(
+            filter(None, (model.objects.aggregate(latest=models.Max('refreshed_at'))['latest']
+                          for model in (PayrollRollup, HeadcountRollup, SalaryBandRollup))),
+            default=None,
+        )
+        return context
+
+
+class AdminSalaryStatisticsView(AdminRequiredMixin, TemplateView):
+    """Salary min, max, mean, median and percentiles per department and experience band."""
+    template_name = 'admin_salary_statistics.html'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['percentiles'] = PERCENTILES
+        context['rows'] = salary_statistics()
+        return context
+
+
+@login_required
+def salary_statistics_api(request):
+    """
+    JSON salary statistics. ?department=<id> (or "none" for employees
+    without a department, "all" for the whole company) returns one entry.
+    """
+    if not (request.user.is_superuser or request.user.role == 'ADMIN'):
+        return JsonResponse({'error': 'Only admins can view salary statistics.'}, status=403)
+    department = request.GET.get('department')
+    if department is None:
+        rows = salary_statistics()
+    elif department == 'all':
+        rows = [('All departments', 'all', department_statistics(['all'])['all'])]
+    elif department == 'none':
+        rows = [('Unassigned', None, department_statistics([None])[None])]
+    elif department.isdigit():
+        name = Department.objects.filter(pk=department).values_list('name', flat=True).first()
+        if name is None:
+            return JsonResponse({'error': 'Unknown department.'}, status=404)
+        rows = [(name, int(department), department_statistics([int(department)])[int(department)])]
+    else:
+        return JsonResponse({'error': 'department must be an id, "none" or "all".'}, status=400)
+    return JsonResponse({
+        'percentiles': list(PERCENTILES),
+        'departments': [
+            {'department': name, 'department_id': department_id, **stats}
+            for name, department_id, stats in rows
+        ],
+    })
@@ -54,6 +54,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.health.HealthCheckMiddleware',  # Answers /health/ and /ready/ before sessions/auth
+    'core.profiling.ProfilingMiddleware',  # No-op unless PROFILING=True
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',  # Add whitenoise for static files
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -61,6 +63,7 @@ MIDDLEWARE = [
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
+    'core.audit.AuditMiddleware',  # Writes the request's audit events in one batch
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
@@ -103,6 +106,9 @@ else:
         'default': {
             'ENGINE': 'django.db.backends.sqlite3',
             'NAME': BASE_DIR / 'db.sqlite3',
+            # A file rather than shared-cache memory: threaded tests then wait
+            # on SQLite's database lock instead of failing with "table is locked"
+            'TEST': {'NAME': BASE_DIR / 'test_db.sqlite3'},
         }
     }
     print("Using SQLite database")
@@ -118,6 +124,27 @@ if 'DATABASE_URL' not in os.environ:
     }
 
 
+# Cache
+# Per-process memory cache by default, which is only correct with a single
+# worker process. Set REDIS_URL (the `redis` client is in requirements.txt)
+# so cached counts are shared and invalidated across all workers;
+# gunicorn.conf.py refuses to start several workers without it.
+
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -167,3 +194,88 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# Background jobs
+# Jobs are stored in the database and executed by `python manage.py run_jobs`
+
+JOB_MAX_ATTEMPTS = int(os.environ.get('JOB_MAX_ATTEMPTS', 3))
+JOB_POLL_INTERVAL = float(os.environ.get('JOB_POLL_INTERVAL', 1.0))
+# Finished jobs (and their PDF/CSV results) are deleted after this many days
+JOB_RETENTION_DAYS = int(os.environ.get('JOB_RETENTION_DAYS', 7))
+
+# Email (used by notification jobs); prints to the worker log unless configured
+EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
+DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'noreply@example.com')
+
+
+# Request profiling
+# Set PROFILING=True to record per-view SQL/template/latency stats, viewable at
+# /dashboard/admin/profiling/ and via `python manage.py profile_report`
+
+PROFILING_ENABLED = os.environ.get('PROFILING', 'False') == 'True'
+PROFILING_DIR = os.environ.get('PROFILING_DIR', os.path.join(BASE_DIR, 'profiling'))
+PROFILING_DUMP_INTERVAL = int(os.environ.get('PROFILING_DUMP_INTERVAL', 10))
+PROFILING_SAMPLE_SIZE = int(os.environ.get('PROFILING_SAMPLE_SIZE', 200))
+
+
+# Health checks
+# /ready/ checks the database at most once per this many seconds
+
+READINESS_CHECK_INTERVAL = float(os.environ.get('READINESS_CHECK_INTERVAL', 5))
+
+
+# Live event feed (server-sent events)
+# Streams poll the database this often for events published by other workers,
+# and are closed after SSE_MAX_DURATION seconds (the browser reconnects)
+
+SSE_POLL_INTERVAL = float(os.environ.get('SSE_POLL_INTERVAL', 15))
+SSE_MAX_DURATION = int(os.environ.get('SSE_MAX_DURATION', 1800))
+# Events are kept this many seconds beyond SSE_MAX_DURATION, then deleted by the job worker
+FEED_RETENTION_MARGIN = int(os.environ.get('FEED_RETENTION_MARGIN', 3600))
+
+
+# Password hashing cost
+# PASSWORD_HASH_PROFILE is one of strong (Django's default), balanced or fast
+# (development only); PASSWORD_HASH_ITERATIONS overrides it with an exact count
+# (at least 10,000 unless DEBUG). Invalid values stop startup (core/hashers.py).
+# PASSWORD_HASH_CONCURRENCY caps concurrent hashes per process (0 = no cap).
+# Compare profiles with `python manage.py benchmark_signup`.
+
+PASSWORD_HASH_PROFILE = os.environ.get('PASSWORD_HASH_PROFILE', 'strong')
+PASSWORD_HASH_ITERATIONS = int(os.environ.get('PASSWORD_HASH_ITERATIONS', 0))
+PASSWORD_HASH_CONCURRENCY = int(os.environ.get('PASSWORD_HASH_CONCURRENCY', 0))
+
+PASSWORD_HASHERS = [
+    'core.hashers.ProfiledPBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+
+# Data retention
+# `python manage.py archive_history` moves attendance and paid payroll older
+# than this many months into the archive tables (viewable at /dashboard/admin/archive/)
+
+RETENTION_ATTENDANCE_MONTHS = int(os.environ.get('RETENTION_ATTENDANCE_MONTHS', 12))
+RETENTION_PAYROLL_MONTHS = int(os.environ.get('RETENTION_PAYROLL_MONTHS', 24))
+
+
+# Attendance partitioning (PostgreSQL only)
+# With ATTENDANCE_PARTITIONING=True, migrate splits core_attendance into monthly
+# range partitions; `python manage.py partition_attendance` keeps creating
+# partitions this many months ahead. SQLite always keeps the plain table.
+
+ATTENDANCE_PARTITIONING = os.environ.get('ATTENDANCE_PARTITIONING', 'False') == 'True'
+ATTENDANCE_PARTITION_MONTHS_AHEAD = int(os.environ.get('ATTENDANCE_PARTITION_MONTHS_AHEAD', 3))
+
+
+# Conditional GET
+# The employee list pages answer 304 Not Modified while their data is
+# unchanged. The release id is part of their ETags, so pages cached by
+# browsers before a deploy that changed the templates are rendered again.
+
+PAGE_CACHE_RELEASE = os.environ.get('RELEASE_VERSION') or os.environ.get('RAILWAY_GIT_COMMIT_SHA', '')
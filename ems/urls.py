@@ -2,10 +2,7 @@
 
 from django.contrib import admin
 from django.urls import path, include
-from django.http import JsonResponse
-
-def health_check(request):
-    return JsonResponse({"status": "healthy"})
+from core.health import health_check, readiness_check
 
 urlpatterns = [
     # Django admin site
@@ -14,6 +11,8 @@ urlpatterns = [
     # Include URLs from the 'core' app
     path('', include('core.urls')),
     
-    # Health check endpoint
+    # Health check endpoints (normally answered by HealthCheckMiddleware
+    # before reaching URL resolution; kept here so reverse() works)
     path('health/', health_check, name='health_check'),
+    path('ready/', readiness_check, name='readiness_check'),
 ]
@@ -0,0 +1,116 @@
+# gunicorn.conf.py
+"""
+Gunicorn settings, picked by the GUNICORN_PROFILE environment variable.
+
+- mixed (default): gthread workers, one per CPU plus one, 4 threads each.
+  A slow CPU-bound request only occupies one thread, so clock-ins keep
+  being served by the worker's other threads and the other workers.
+- io: fewer processes with 8 threads each, for deployments whose requests
+  mostly wait on the database.
+- cpu: classic sync workers, two per CPU plus one, for CPU-heavy loads
+  where threads would only contend for the GIL.
+
+SERVER_MODE=asgi switches to uvicorn workers (see ems/asgi.py). Every value
+can be overridden: WEB_CONCURRENCY (workers, otherwise capped at
+GUNICORN_MAX_WORKERS, default 12), GUNICORN_THREADS,
+GUNICORN_TIMEOUT, GUNICORN_MAX_REQUESTS, GUNICORN_MAX_REQUESTS_JITTER and
+GUNICORN_PRELOAD. Compare the profiles with `python manage.py benchmark_server`.
+
+More than one worker requires REDIS_URL; without it a single worker is run
+(see the cache check below).
+"""
+
+import gc
+import os
+
+
+def cpu_count():
+    # Respects container CPU pinning, unlike os.cpu_count()
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+CPUS = cpu_count()
+PROFILES = {
+    'mixed': {'worker_class': 'gthread', 'workers': CPUS + 1, 'threads': 4},
+    'io': {'worker_class': 'gthread', 'workers': max(2, CPUS), 'threads': 8},
+    'cpu': {'worker_class': 'sync', 'workers': CPUS * 2 + 1, 'threads': 1},
+}
+
+profile_name = os.environ.get('GUNICORN_PROFILE', 'mixed')
+if profile_name not in PROFILES:
+    raise RuntimeError(f"Unknown GUNICORN_PROFILE {profile_name!r}; choose one of {', '.join(PROFILES)}")
+profile = PROFILES[profile_name]
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+# Extra workers only add memory once the CPUs are busy
+workers = int(os.environ.get('WEB_CONCURRENCY', min(profile['workers'], int(os.environ.get('GUNICORN_MAX_WORKERS', 12)))))
+threads = int(os.environ.get('GUNICORN_THREADS', profile['threads']))
+
+# Unread counts, choice lists, salary statistics and roster calendars are
+# invalidated through the cache. Without REDIS_URL it is a per-process
+# memory cache, and one worker's invalidation never reaches the others, so
+# without the shared one a single worker is run (its threads still serve
+# requests concurrently). ALLOW_LOCAL_CACHE=1 keeps several workers and
+# accepts stale reads instead (e.g. for local benchmarks).
+cache_warning = None
+if workers > 1 and not os.environ.get('REDIS_URL') and os.environ.get('ALLOW_LOCAL_CACHE') != '1':
+    cache_warning = (
+        f'REDIS_URL is not set, so running 1 worker instead of {workers}: '
+        'a per-process cache would serve stale values across workers'
+    )
+    workers = 1
+if os.environ.get('SERVER_MODE') == 'asgi':
+    worker_class = 'uvicorn.workers.UvicornWorker'
+else:
+    worker_class = profile['worker_class']
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle each worker after this many requests (jittered so they do not all
+# restart together), bounding memory growth from fragmentation or leaks
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+# Import Django once in the master; forked workers share those pages
+# copy-on-write instead of each importing it again
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'True') == 'True'
+
+# Heartbeat files on tmpfs, so a slow container disk cannot stall workers
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG') or None
+
+
+def when_ready(server):
+    if cache_warning:
+        server.log.warning(cache_warning)
+    server.log.info(
+        'Profile %s: %s workers x %s threads (%s), max_requests=%s, preload=%s',
+        profile_name, workers, threads, worker_class, max_requests, preload_app,
+    )
+    if preload_app:
+        # Move the preloaded objects out of the collector's reach, so the
+        # first collection in each worker does not touch (and copy) them
+        gc.freeze()
+
+
+def pre_fork(server, worker):
+    # A database connection opened while preloading must not be inherited
+    # by (and shared between) the workers
+    if preload_app:
+        from django.db import connections
+        connections.close_all()
+
+
+def worker_exit(server, worker):
+    # Keep a recycled worker's request profile (no-op unless PROFILING=True)
+    from django.conf import settings
+    if getattr(settings, 'PROFILING_ENABLED', False):
+        from core.profiling import dump_snapshot
+        dump_snapshot()
@@ -1,35 +1,35 @@
 #!/bin/bash
 
-# Wait for database to be ready
-echo "Waiting for database connection..."
-
-# Check if DATABASE_URL is available
-if [ -z "$DATABASE_URL" ]; then
-    echo "No DATABASE_URL found, using SQLite"
-    python manage.py migrate
-else
-    echo "DATABASE_URL found, connecting to PostgreSQL"
-    echo "Database URL: $DATABASE_URL"
-    python manage.py migrate
+# Migrations, attendance partitions and the admin account are handled by
+# `python manage.py release`, which runs once per deploy (railway.toml
+# preDeployCommand / the Procfile release phase), and static files are
+# collected when the image is built. Without DATABASE_URL the SQLite
+# database lives in the container, so it is prepared here; RUN_RELEASE=1
+# forces the same on platforms without a release phase.
+if [ -z "$DATABASE_URL" ] || [ "$RUN_RELEASE" = "1" ]; then
+    echo "Running release tasks..."
+    python manage.py release
 fi
 
-# Collect static files
-echo "Collecting static files..."
-python manage.py collectstatic --noinput
-
-# Create superuser if it doesn't exist
-echo "Creating superuser if needed..."
-python manage.py shell -c "
-from django.contrib.auth import get_user_model
-User = get_user_model()
-if not User.objects.filter(username='admin').exists():
-    User.objects.create_superuser('admin', 'admin@example.com', 'admin123')
-    print('Superuser created: admin/admin123')
-else:
-    print('Superuser already exists')
-"
+# The background job worker runs as its own service from the same image
+# (PROCESS_TYPE=worker), so the platform restarts it if it dies and web
+# replicas do not each start a poller
+if [ "$PROCESS_TYPE" = "worker" ]; then
+    echo "Starting background job worker..."
+    exec python manage.py run_jobs
+fi
 
 # Start the application
 echo "Starting application..."
 echo "Port: $PORT"
-exec gunicorn ems.wsgi:application --bind 0.0.0.0:${PORT:-8000} --timeout 120
+# Workers, threads, timeouts and recycling come from gunicorn.conf.py
+# (GUNICORN_PROFILE=mixed|io|cpu). SERVER_MODE=asgi serves ems.asgi through
+# uvicorn workers so the async clock-in/clock-out views run on the event loop.
+echo "Gunicorn profile: ${GUNICORN_PROFILE:-mixed}"
+if [ "$SERVER_MODE" = "asgi" ]; then
+    echo "Server mode: ASGI (uvicorn workers)"
+    exec gunicorn ems.asgi:application -c gunicorn.conf.py
+else
+    echo "Server mode: WSGI"
+    exec gunicorn ems.wsgi:application -c gunicorn.conf.py
+fi